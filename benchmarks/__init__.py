@@ -0,0 +1 @@
+"""Benchmarks for the todo domain, persistence and API layers."""
@@ -0,0 +1,71 @@
+"""Compare benchmark results against a baseline and flag regressions.
+
+Run with ``python -m benchmarks.compare baseline.json current.json``; the
+command exits with status 1 when any benchmark regressed.
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Tuple
+
+from benchmarks.harness import BenchmarkResult, load_results
+
+
+def compare(
+    baseline: Dict[str, BenchmarkResult],
+    current: Dict[str, BenchmarkResult],
+    tolerance: float,
+) -> List[Tuple[str, float, float, str]]:
+    """Classify each benchmark present in both result sets.
+
+    Best timings are compared, as they are the least disturbed by noise.
+
+    Args:
+        baseline: Earlier results by benchmark name.
+        current: New results by benchmark name.
+        tolerance: Relative slowdown tolerated, such as 0.1 for 10%.
+
+    Returns:
+        List[Tuple[str, float, float, str]]: Name, baseline and current
+        nanoseconds per call, and ``regressed``, ``improved`` or ``ok``.
+    """
+    rows = []
+    for name in sorted(baseline.keys() & current.keys()):
+        before = baseline[name].best_ns
+        after = current[name].best_ns
+        if after > before * (1 + tolerance):
+            verdict = 'regressed'
+        elif after < before / (1 + tolerance):
+            verdict = 'improved'
+        else:
+            verdict = 'ok'
+        rows.append((name, before, after, verdict))
+    return rows
+
+
+def main() -> None:
+    """Parse command-line options, print the comparison and set the status."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--tolerance', type=float, default=0.1)
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    rows = compare(baseline, current, args.tolerance)
+    width = max((len(name) for name, *_ in rows), default=0)
+    for name, before, after, verdict in rows:
+        change = (after - before) / before * 100 if before else 0.0
+        print(
+            f'{name:<{width}}  {before:>12.0f} ns  {after:>12.0f} ns  '
+            f'{change:>+7.1f}%  {verdict}'
+        )
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f'{name:<{width}}  missing from current results')
+    if any(verdict == 'regressed' for *_, verdict in rows):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Time small callables and store the results as JSON baselines."""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timing of one benchmark.
+
+    Attributes:
+        best_ns: Fastest repeat, in nanoseconds per call.
+        median_ns: Median repeat, in nanoseconds per call.
+        loops: Calls per repeat.
+        repeat: Number of repeats.
+    """
+
+    best_ns: float
+    median_ns: float
+    loops: int
+    repeat: int
+
+
+def measure(
+    function: Callable[[], Any], repeat: int = 5, min_seconds: float = 0.1
+) -> BenchmarkResult:
+    """Time ``function`` like ``timeit``, calibrating the loop count first.
+
+    The loop count grows until one repeat lasts ``min_seconds``, so timer
+    resolution does not distort fast calls.
+
+    Args:
+        function: Callable taking no arguments.
+        repeat: Number of timed repeats.
+        min_seconds: Shortest duration of one repeat.
+
+    Returns:
+        BenchmarkResult: Per-call timings.
+    """
+    loops = 1
+    while True:
+        elapsed = _time(function, loops)
+        if elapsed >= min_seconds or loops >= 1 << 24:
+            break
+        loops *= 2 if elapsed == 0 else max(2, int(min_seconds / elapsed) + 1)
+    timings = [_time(function, loops) / loops * 1e9 for _ in range(repeat)]
+    return BenchmarkResult(min(timings), statistics.median(timings), loops, repeat)
+
+
+def _time(function: Callable[[], Any], loops: int) -> float:
+    started = time.perf_counter()
+    for _ in range(loops):
+        function()
+    return time.perf_counter() - started
+
+
+def save_results(path: str, results: Dict[str, BenchmarkResult]) -> None:
+    """Write results with a description of the machine that produced them.
+
+    Args:
+        path: Destination JSON file.
+        results: Results by benchmark name.
+    """
+    document = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': {name: asdict(result) for name, result in results.items()},
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def load_results(path: str) -> Dict[str, BenchmarkResult]:
+    """Read results written by ``save_results``.
+
+    Args:
+        path: JSON file to read.
+
+    Returns:
+        Dict[str, BenchmarkResult]: Results by benchmark name.
+    """
+    with open(path, encoding='utf-8') as file:
+        document = json.load(file)
+    return {
+        name: BenchmarkResult(**result) for name, result in document['results'].items()
+    }
@@ -0,0 +1,396 @@
+"""Drive the todo API with concurrent clients and report latency per route.
+
+Run with ``python -m benchmarks.load_test --concurrency 16 --duration 10``
+to exercise ``main.app`` in-process, or add ``--url http://127.0.0.1:8000``
+to load a running uvicorn instead. In-process, the clients share the event
+loop and the GIL with the application, so absolute numbers are lower than
+against a separate server; compare runs made the same way, for instance
+with ``--output before.json`` and then ``--baseline before.json``.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import httpx
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from dddpy.infrastructure.di.injection import get_session
+from dddpy.infrastructure.sqlite.database import create_tables
+from main import app
+
+OPERATIONS = ('list', 'get', 'create', 'update', 'start', 'complete')
+DEFAULT_MIX = 'list=4,get=4,create=1,update=1,start=1,complete=1'
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+_driver_errors: ContextVar[Optional[List[str]]] = ContextVar(
+    'driver_errors', default=None
+)
+
+
+@dataclass
+class RouteStats:
+    """Latencies and failures recorded for one operation."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+
+    def report(self, duration: float) -> Dict[str, Any]:
+        """Summarize the operation over the measured duration.
+
+        Args:
+            duration: Seconds the load ran for.
+
+        Returns:
+            Dict[str, Any]: Request count, throughput, error rate, latency
+            percentiles in milliseconds and errors by kind.
+        """
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        failed = sum(self.errors.values())
+        return {
+            'requests': count,
+            'throughput_rps': count / duration if duration else 0.0,
+            'error_rate': failed / count if count else 0.0,
+            **{
+                f'p{percentile:g}_ms': _percentile(latencies, percentile) * 1000
+                for percentile in PERCENTILES
+            },
+            'errors': dict(self.errors),
+        }
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    """Return the nearest-rank percentile of sorted values, or 0 when empty."""
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * percentile // 100))
+    return values[min(len(values), int(rank)) - 1]
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Parse ``name=weight`` pairs into operation weights.
+
+    Args:
+        text: Comma-separated pairs, such as ``list=4,create=1``.
+
+    Returns:
+        Dict[str, float]: Positive weight by operation name.
+
+    Raises:
+        ValueError: If an operation is unknown or no weight is positive.
+    """
+    weights: Dict[str, float] = {}
+    for pair in filter(None, text.split(',')):
+        name, _, weight = pair.partition('=')
+        if name not in OPERATIONS:
+            raise ValueError(f'unknown operation {name!r}; expected {OPERATIONS}')
+        if float(weight) > 0:
+            weights[name] = float(weight)
+    if not weights:
+        raise ValueError('the request mix has no operation with a positive weight')
+    return weights
+
+
+class LoadTest:
+    """Issue a weighted mix of todo requests from concurrent clients.
+
+    Todos created by the run are tracked by status, so ``start`` and
+    ``complete`` target todos that can make the transition; an operation
+    without a suitable todo is replaced by a ``create``.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        mix: Dict[str, float],
+        rng: random.Random,
+    ):
+        """Prepare a run.
+
+        Args:
+            client: Client sending the requests.
+            mix: Weight by operation name.
+            rng: Random generator choosing operations and todos.
+        """
+        self.client = client
+        self.operations = list(mix)
+        self.weights = list(mix.values())
+        self.rng = rng
+        self.stats: Dict[str, RouteStats] = defaultdict(RouteStats)
+        self._ids: List[str] = []
+        self._not_started: List[str] = []
+        self._in_progress: List[str] = []
+
+    async def seed(self, count: int) -> None:
+        """Create todos for reads and transitions; they are not measured.
+
+        Args:
+            count: Number of todos to create.
+        """
+        for _ in range(count):
+            await self._request('create', record=False)
+
+    async def run(self, concurrency: int, duration: float) -> float:
+        """Send requests from ``concurrency`` clients for ``duration`` seconds.
+
+        Args:
+            concurrency: Number of clients, each with one request in flight.
+            duration: Seconds to keep sending requests.
+
+        Returns:
+            float: Seconds actually elapsed.
+        """
+        started = time.perf_counter()
+        deadline = started + duration
+
+        async def client_loop() -> None:
+            while time.perf_counter() < deadline:
+                operation = self.rng.choices(self.operations, self.weights)[0]
+                await self._request(operation)
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        return time.perf_counter() - started
+
+    async def _request(self, operation: str, record: bool = True) -> None:
+        todo_id = self._pick(operation)
+        if todo_id is None and operation != 'list':
+            operation = 'create'
+        method, url, body = _REQUESTS[operation]
+        driver_errors: List[str] = []
+        token = _driver_errors.set(driver_errors)
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            response = await self.client.request(
+                method, url.format(todo_id=todo_id), json=body
+            )
+            if response.status_code >= 400:
+                error = _describe(response, driver_errors)
+        except httpx.HTTPError as e:
+            response = None
+            error = type(e).__name__
+        finally:
+            elapsed = time.perf_counter() - started
+            _driver_errors.reset(token)
+
+        if record:
+            stats = self.stats[operation]
+            stats.latencies.append(elapsed)
+            if error is not None:
+                stats.errors[error] += 1
+        if error is None and response is not None:
+            self._track(operation, todo_id, response)
+
+    def _pick(self, operation: str) -> Optional[str]:
+        pool = {
+            'get': self._ids,
+            'update': self._ids,
+            'start': self._not_started,
+            'complete': self._in_progress,
+        }.get(operation)
+        if not pool:
+            return None
+        if operation in ('start', 'complete'):
+            # Take the todo out so no other client transitions it as well.
+            return pool.pop(self.rng.randrange(len(pool)))
+        return self.rng.choice(pool)
+
+    def _track(
+        self, operation: str, todo_id: Optional[str], response: httpx.Response
+    ) -> None:
+        if operation == 'create':
+            created = response.json()['id']
+            self._ids.append(created)
+            self._not_started.append(created)
+        elif operation == 'start' and todo_id is not None:
+            self._in_progress.append(todo_id)
+
+
+_REQUESTS: Dict[str, Tuple[str, str, Optional[Dict[str, str]]]] = {
+    'list': ('GET', '/todos', None),
+    'get': ('GET', '/todos/{todo_id}', None),
+    'create': ('POST', '/todos', {'title': 'Load test', 'description': 'Load'}),
+    'update': ('PUT', '/todos/{todo_id}', {'title': 'Load test updated'}),
+    'start': ('PATCH', '/todos/{todo_id}/start', None),
+    'complete': ('PATCH', '/todos/{todo_id}/complete', None),
+}
+
+
+def _describe(response: httpx.Response, driver_errors: Sequence[str]) -> str:
+    """Name a failed response by status and, when known, the database error."""
+    if driver_errors:
+        return f'{response.status_code} {driver_errors[-1]}'
+    if 'database is locked' in response.text:
+        return f'{response.status_code} database is locked'
+    return str(response.status_code)
+
+
+@contextlib.asynccontextmanager
+async def in_process_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Start ``main.app`` with its lifespan and yield a client calling it directly.
+
+    Requests use sessions of a database file created in a temporary
+    directory, so the seeded todos never reach the application's database.
+    Database errors raised while a request is handled are attributed to the
+    request, since the application answers them with a bare 500.
+
+    Yields:
+        httpx.AsyncClient: Client bound to the application.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(
+            f'sqlite:///{directory}/sqlite.db',
+            connect_args={'check_same_thread': False},
+        )
+        create_tables(engine)
+        sessions = sessionmaker(bind=engine, autoflush=True)
+
+        def temporary_session() -> Iterator[Session]:
+            with sessions() as session:
+                yield session
+
+        def record_driver_error(context: Any) -> None:
+            errors = _driver_errors.get()
+            if errors is not None:
+                errors.append(str(context.original_exception).splitlines()[0])
+
+        event.listen(engine, 'handle_error', record_driver_error)
+        app.dependency_overrides[get_session] = temporary_session
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        try:
+            async with app.router.lifespan_context(app):
+                async with httpx.AsyncClient(
+                    transport=transport, base_url='http://testserver'
+                ) as client:
+                    yield client
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+            engine.dispose()
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the load test described by the command-line options.
+
+    Args:
+        args: Parsed command-line options.
+
+    Returns:
+        Dict[str, Any]: Report with the run settings and per-route results.
+    """
+    mix = parse_mix(args.mix)
+    if args.url:
+        client_context: Any = httpx.AsyncClient(
+            base_url=args.url,
+            timeout=args.timeout,
+            limits=httpx.Limits(max_connections=args.concurrency),
+        )
+    else:
+        client_context = in_process_client()
+    async with client_context as client:
+        load_test = LoadTest(client, mix, random.Random(args.seed))
+        await load_test.seed(args.seed_todos)
+        duration = await load_test.run(args.concurrency, args.duration)
+
+    routes = {
+        operation: load_test.stats[operation].report(duration)
+        for operation in OPERATIONS
+        if operation in load_test.stats
+    }
+    total = RouteStats()
+    for stats in load_test.stats.values():
+        total.latencies.extend(stats.latencies)
+        total.errors.update(stats.errors)
+    return {
+        'target': args.url or 'in-process',
+        'concurrency': args.concurrency,
+        'duration_seconds': duration,
+        'mix': mix,
+        'routes': routes,
+        'total': total.report(duration),
+    }
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    """Print one line per route, with changes from a baseline when given.
+
+    Args:
+        report: Report returned by ``run``.
+        baseline: Earlier report to compare with, if any.
+    """
+    print(
+        f'target={report["target"]} concurrency={report["concurrency"]} '
+        f'duration_seconds={report["duration_seconds"]:.1f}'
+    )
+    rows = {**report['routes'], 'total': report['total']}
+    before = {**baseline['routes'], 'total': baseline['total']} if baseline else {}
+    for name, result in rows.items():
+        line = (
+            f'{name:<8} requests={result["requests"]} '
+            f'rps={result["throughput_rps"]:.1f} '
+            + ' '.join(
+                f'p{percentile:g}={result[f"p{percentile:g}_ms"]:.2f}ms'
+                for percentile in PERCENTILES
+            )
+            + f' error_rate={result["error_rate"]:.2%}'
+        )
+        previous = before.get(name)
+        if previous and previous['throughput_rps'] and previous['p99_ms']:
+            line += (
+                f' rps_change={result["throughput_rps"] / previous["throughput_rps"] - 1:+.1%}'
+                f' p99_change={result["p99_ms"] / previous["p99_ms"] - 1:+.1%}'
+            )
+        print(line)
+        for error, count in sorted(result['errors'].items()):
+            print(f'{"":<8} error={error!r} count={count}')
+
+
+def main() -> None:
+    """Parse command-line options, run the load test and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', help='base URL of a running server')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--mix', default=DEFAULT_MIX)
+    parser.add_argument('--seed-todos', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--output', help='write the report to this JSON file')
+    parser.add_argument('--baseline', help='compare with a report from --output')
+    args = parser.parse_args()
+    # httpx logs every request at INFO, which would drown the report.
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+
+    report = asyncio.run(run(args))
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+    print_report(report, baseline)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+            file.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Time columnar overdue checks on a large TodoBatch.
+
+Run with ``python -m benchmarks.todo_batch_overdue --count 1000000``.
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+from dddpy.domain.todo.entities import TodoBatch
+from dddpy.domain.todo.entities.todo_batch import ID_SIZE, MISSING_TIMESTAMP
+
+
+def build_batch(count: int, seed: int = 0) -> TodoBatch:
+    """Build a synthetic batch with random statuses and timestamps.
+
+    Args:
+        count: Number of rows in the batch.
+        seed: Seed for the random generator.
+
+    Returns:
+        TodoBatch: Batch with ``count`` synthetic todos.
+    """
+    rng = random.Random(seed)
+    created_at = array(
+        'q', (rng.randrange(1_700_000_000_000, 1_760_000_000_000) for _ in range(count))
+    )
+    return TodoBatch(
+        rng.randbytes(ID_SIZE * count),
+        ['Benchmark todo'] * count,
+        [None] * count,
+        array('b', (rng.randrange(3) for _ in range(count))),
+        created_at,
+        array('q', created_at),
+        array('q', [MISSING_TIMESTAMP]) * count,
+    )
+
+
+def main() -> None:
+    """Parse command-line options and print the timing report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    batch = build_batch(args.count)
+    deadlines = array('q', (value + 7 * 24 * 3600 * 1000 for value in batch.created_at))
+    now = 1_730_000_000_000
+
+    best = float('inf')
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        overdue = batch.is_overdue(deadlines, now).count(1)
+        best = min(best, time.perf_counter() - started)
+    print(f'todos={args.count} overdue={overdue} best_seconds={best:.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Measure the retained heap size of Todo entities with tracemalloc.
+
+Run with ``python -m benchmarks.todo_memory --count 1000000``.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoDescription, TodoTitle
+
+
+def measure_bytes_per_todo(count: int) -> float:
+    """Create ``count`` todos and return the traced bytes retained per todo.
+
+    Args:
+        count: Number of todo entities to keep alive while measuring.
+
+    Returns:
+        float: Average number of bytes allocated per todo entity.
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    todos = [
+        Todo.create(TodoTitle('Benchmark todo'), TodoDescription('Benchmark body'))
+        for _ in range(count)
+    ]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = current - baseline
+    del todos
+    return retained / count
+
+
+def main() -> None:
+    """Parse command-line options and print the memory report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    bytes_per_todo = measure_bytes_per_todo(args.count)
+    print(f'todos={args.count} bytes_per_todo={bytes_per_todo:.1f}')
+
+
+if __name__ == '__main__':
+    main()
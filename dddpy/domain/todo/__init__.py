@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
-from . import entities, exceptions, repositories, value_objects
+from . import clocks, entities, events, exceptions, repositories, value_objects
 
-__all__ = ('entities', 'exceptions', 'repositories', 'value_objects')
+__all__ = (
+    'clocks',
+    'entities',
+    'events',
+    'exceptions',
+    'repositories',
+    'value_objects',
+)
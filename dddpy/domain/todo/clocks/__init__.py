@@ -0,0 +1,7 @@
+"""Expose clock abstractions used to timestamp todos."""
+
+from __future__ import annotations
+
+from .clock import Clock, CoarseClock, FixedClock, SystemClock
+
+__all__ = ('Clock', 'CoarseClock', 'FixedClock', 'SystemClock')
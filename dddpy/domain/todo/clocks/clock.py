@@ -0,0 +1,85 @@
+"""Define the clock port and its implementations."""
+
+import time
+from abc import ABC, abstractmethod
+
+from dddpy.domain.todo.value_objects import TodoTimestamp
+
+
+class Clock(ABC):
+    """Provide the current time to the domain and use cases."""
+
+    @abstractmethod
+    def now(self) -> TodoTimestamp:
+        """Return the current time.
+
+        Returns:
+            TodoTimestamp: Timestamp for the current instant.
+        """
+
+
+class SystemClock(Clock):
+    """Read the system clock on every call."""
+
+    def now(self) -> TodoTimestamp:
+        """Return the current system time."""
+        return TodoTimestamp.now()
+
+
+class CoarseClock(Clock):
+    """Cache the system time and refresh it at most once per resolution window.
+
+    Calls within the same window return the same timestamp instance, which
+    avoids a wall-clock read and an allocation per call on hot paths. Returned
+    timestamps lag the real time by less than the configured resolution.
+    """
+
+    def __init__(self, resolution_ms: int = 10):
+        """Configure the refresh interval.
+
+        Args:
+            resolution_ms: Maximum age of a returned timestamp in milliseconds.
+        """
+        self._resolution_ns = resolution_ms * 1_000_000
+        self._expires_at = 0
+        self._current = TodoTimestamp(0)
+
+    def now(self) -> TodoTimestamp:
+        """Return the cached time, refreshing it when the window has elapsed."""
+        tick = time.monotonic_ns()
+        if tick >= self._expires_at:
+            self._current = TodoTimestamp.now()
+            self._expires_at = tick + self._resolution_ns
+        return self._current
+
+
+class FixedClock(Clock):
+    """Return a fixed time that only changes when told to, for tests and batches."""
+
+    def __init__(self, now: TodoTimestamp):
+        """Store the time to report.
+
+        Args:
+            now: Timestamp returned by ``now`` until changed.
+        """
+        self._now = now
+
+    def now(self) -> TodoTimestamp:
+        """Return the fixed time."""
+        return self._now
+
+    def set(self, now: TodoTimestamp) -> None:
+        """Replace the reported time.
+
+        Args:
+            now: New timestamp to report.
+        """
+        self._now = now
+
+    def advance(self, milliseconds: int) -> None:
+        """Move the reported time forward.
+
+        Args:
+            milliseconds: Number of milliseconds to add.
+        """
+        self._now = TodoTimestamp(self._now.value + milliseconds)
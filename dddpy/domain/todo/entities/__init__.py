@@ -3,5 +3,6 @@
 from __future__ import annotations
 
 from .todo import Todo
+from .todo_batch import TodoBatch
 
-__all__ = ('Todo',)
+__all__ = ('Todo', 'TodoBatch')
@@ -1,15 +1,30 @@
 """Define the Todo entity used throughout the domain layer."""
 
-from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind, TodoSnapshot
 from dddpy.domain.todo.value_objects import (
     TodoDescription,
     TodoId,
     TodoStatus,
+    TodoTimestamp,
     TodoTitle,
 )
 
+_TITLE = 1
+_DESCRIPTION = 2
+_STATUS = 4
+_UPDATED_AT = 8
+_COMPLETED_AT = 16
+
+_FIELD_BITS = (
+    ('title', _TITLE),
+    ('description', _DESCRIPTION),
+    ('status', _STATUS),
+    ('updated_at', _UPDATED_AT),
+    ('completed_at', _COMPLETED_AT),
+)
+
 
 class Todo:
     """Represent a todo item tracked by the domain.
@@ -22,17 +37,35 @@ class Todo:
         _created_at: Timestamp when the todo was created.
         _updated_at: Timestamp when the todo was last updated.
         _completed_at: Optional timestamp when the todo was completed.
+        _version: Version of the persisted state, 0 until first saved.
+        _changed: Bit set of the fields changed since the todo was loaded or
+            last persisted.
+        _events: Events recorded since they were last pulled, if any.
     """
 
+    __slots__ = (
+        '_id',
+        '_title',
+        '_description',
+        '_status',
+        '_created_at',
+        '_updated_at',
+        '_completed_at',
+        '_version',
+        '_changed',
+        '_events',
+    )
+
     def __init__(
         self,
         id: TodoId,
         title: TodoTitle,
         description: Optional[TodoDescription] = None,
         status: TodoStatus = TodoStatus.NOT_STARTED,
-        created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None,
-        completed_at: Optional[datetime] = None,
+        created_at: Optional[TodoTimestamp] = None,
+        updated_at: Optional[TodoTimestamp] = None,
+        completed_at: Optional[TodoTimestamp] = None,
+        version: int = 0,
     ):
         """Initialize a todo domain entity.
 
@@ -44,14 +77,22 @@ class Todo:
             created_at: Creation timestamp in UTC.
             updated_at: Last updated timestamp in UTC.
             completed_at: Optional completion timestamp in UTC.
+            version: Version of the persisted state, 0 for a new todo.
         """
         self._id = id
         self._title = title
         self._description = description
         self._status = status
-        self._created_at = created_at or datetime.now()
-        self._updated_at = updated_at or datetime.now()
+        if created_at is None or updated_at is None:
+            now = TodoTimestamp.now()
+            created_at = created_at if created_at is not None else now
+            updated_at = updated_at if updated_at is not None else now
+        self._created_at = created_at
+        self._updated_at = updated_at
         self._completed_at = completed_at
+        self._version = version
+        self._changed = 0
+        self._events: Optional[List[TodoEvent]] = None
 
     def __eq__(self, obj: object) -> bool:
         if isinstance(obj, Todo):
@@ -80,46 +121,115 @@ class Todo:
         return self._status
 
     @property
-    def created_at(self) -> datetime:
+    def created_at(self) -> TodoTimestamp:
         """Return the todo's creation timestamp."""
         return self._created_at
 
     @property
-    def updated_at(self) -> datetime:
+    def updated_at(self) -> TodoTimestamp:
         """Return the todo's last update timestamp."""
         return self._updated_at
 
     @property
-    def completed_at(self) -> Optional[datetime]:
+    def completed_at(self) -> Optional[TodoTimestamp]:
         """Return the todo's completion timestamp if set."""
         return self._completed_at
 
-    def update_title(self, new_title: TodoTitle) -> None:
+    @property
+    def version(self) -> int:
+        """Return the version of the persisted state this todo reflects."""
+        return self._version
+
+    @property
+    def changed_fields(self) -> Tuple[str, ...]:
+        """Return the names of the fields changed since the last persist."""
+        return tuple(name for name, bit in _FIELD_BITS if self._changed & bit)
+
+    def copy(self) -> 'Todo':
+        """Return an independent todo with the same state.
+
+        The copy has no changed fields or recorded events, so changing it
+        never affects this todo or what is persisted for it.
+
+        Returns:
+            Todo: Todo equal to this one in every field.
+        """
+        return Todo(
+            self._id,
+            self._title,
+            self._description,
+            self._status,
+            self._created_at,
+            self._updated_at,
+            self._completed_at,
+            self._version,
+        )
+
+    def snapshot(self) -> TodoSnapshot:
+        """Return the current state of the todo as an immutable value."""
+        return self._snapshot(self._version)
+
+    def pull_events(self) -> List[TodoEvent]:
+        """Return the events recorded since the last call and forget them."""
+        events, self._events = self._events, None
+        return events if events is not None else []
+
+    def mark_persisted(self) -> None:
+        """Advance the version and forget the changed fields after a write."""
+        self._version += 1
+        self._changed = 0
+
+    def update_title(
+        self, new_title: TodoTitle, now: Optional[TodoTimestamp] = None
+    ) -> None:
         """Update the todo title and refresh timestamps.
 
         Args:
             new_title: Replacement title for the todo.
+            now: Time of the change; the system clock is read when omitted.
         """
-        self._title = new_title
-        self._updated_at = datetime.now()
+        self._touch(now)
+        if new_title != self._title:
+            self._title = new_title
+            self._changed |= _TITLE
+            self._record(TodoEventKind.UPDATED)
 
-    def update_description(self, new_description: Optional[TodoDescription]) -> None:
+    def update_description(
+        self,
+        new_description: Optional[TodoDescription],
+        now: Optional[TodoTimestamp] = None,
+    ) -> None:
         """Update the todo description and refresh timestamps.
 
         Args:
             new_description: Optional replacement description.
+            now: Time of the change; the system clock is read when omitted.
         """
-        self._description = new_description if new_description else None
-        self._updated_at = datetime.now()
+        new_description = new_description if new_description else None
+        self._touch(now)
+        if new_description != self._description:
+            self._description = new_description
+            self._changed |= _DESCRIPTION
+            self._record(TodoEventKind.UPDATED)
 
-    def start(self) -> None:
-        """Mark the todo as in progress and update timestamps."""
-        self._status = TodoStatus.IN_PROGRESS
-        self._updated_at = datetime.now()
+    def start(self, now: Optional[TodoTimestamp] = None) -> None:
+        """Mark the todo as in progress and update timestamps.
 
-    def complete(self) -> None:
+        Args:
+            now: Time of the change; the system clock is read when omitted.
+        """
+        self._touch(now)
+        if self._status != TodoStatus.IN_PROGRESS:
+            self._status = TodoStatus.IN_PROGRESS
+            self._changed |= _STATUS
+            self._record(TodoEventKind.STARTED)
+
+    def complete(self, now: Optional[TodoTimestamp] = None) -> None:
         """Mark the todo as completed and record completion time.
 
+        Args:
+            now: Time of the change; the system clock is read when omitted.
+
         Raises:
             ValueError: If the todo is already completed.
         """
@@ -127,8 +237,37 @@ class Todo:
             raise ValueError('Already completed')
 
         self._status = TodoStatus.COMPLETED
-        self._completed_at = datetime.now()
+        self._completed_at = now if now is not None else TodoTimestamp.now()
         self._updated_at = self._completed_at
+        self._changed |= _STATUS | _COMPLETED_AT | _UPDATED_AT
+        self._record(TodoEventKind.COMPLETED)
+
+    def _record(self, kind: TodoEventKind) -> None:
+        # The state is captured now, under the version the next write gives
+        # it, so later changes never leak into events already recorded.
+        event = TodoEvent(kind, self._id, self._snapshot(self._version + 1))
+        if self._events is None:
+            self._events = []
+        elif kind == TodoEventKind.UPDATED and self._events[-1].kind == kind:
+            self._events[-1] = event
+            return
+        self._events.append(event)
+
+    def _snapshot(self, version: int) -> TodoSnapshot:
+        return TodoSnapshot(
+            self._id,
+            self._title,
+            self._description,
+            self._status,
+            self._created_at,
+            self._updated_at,
+            self._completed_at,
+            version,
+        )
+
+    def _touch(self, now: Optional[TodoTimestamp]) -> None:
+        self._updated_at = now if now is not None else TodoTimestamp.now()
+        self._changed |= _UPDATED_AT
 
     @property
     def is_completed(self) -> bool:
@@ -136,7 +275,7 @@ class Todo:
         return self._status == TodoStatus.COMPLETED
 
     def is_overdue(
-        self, deadline: datetime, current_time: Optional[datetime] = None
+        self, deadline: TodoTimestamp, current_time: Optional[TodoTimestamp] = None
     ) -> bool:
         """Determine whether the todo has passed the provided deadline.
 
@@ -149,19 +288,30 @@ class Todo:
         """
         if self.is_completed:
             return False
-        return (current_time or datetime.now()) > deadline
+        if current_time is None:
+            current_time = TodoTimestamp.now()
+        return current_time > deadline
 
     @staticmethod
     def create(
-        title: TodoTitle, description: Optional[TodoDescription] = None
+        title: TodoTitle,
+        description: Optional[TodoDescription] = None,
+        now: Optional[TodoTimestamp] = None,
     ) -> 'Todo':
         """Create a new todo entity with generated identifier.
 
+        The todo records a created event.
+
         Args:
             title: Title describing the todo to create.
             description: Optional description for the todo.
+            now: Creation time; the system clock is read when omitted.
 
         Returns:
             Todo: Newly created todo instance.
         """
-        return Todo(TodoId.generate(), title, description)
+        todo = Todo(
+            TodoId.generate(), title, description, created_at=now, updated_at=now
+        )
+        todo._record(TodoEventKind.CREATED)
+        return todo
@@ -0,0 +1,406 @@
+"""Define a columnar collection of todos for vectorized domain queries."""
+
+import sys
+from array import array
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from dddpy.domain.todo.entities.todo import Todo
+from dddpy.domain.todo.value_objects import (
+    TodoDescription,
+    TodoId,
+    TodoStatus,
+    TodoTimestamp,
+    TodoTitle,
+)
+
+STATUS_CODES = {
+    TodoStatus.NOT_STARTED: 0,
+    TodoStatus.IN_PROGRESS: 1,
+    TodoStatus.COMPLETED: 2,
+}
+STATUSES_BY_CODE = tuple(STATUS_CODES)
+
+MISSING_TIMESTAMP = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+ID_SIZE = 16
+
+TIME_FIELDS = ('created_at', 'updated_at', 'completed_at')
+
+TodoRow = Tuple[UUID, str, Optional[str], str, int, int, Optional[int]]
+EpochMs = Union[int, Sequence[int]]
+
+# Byte tables for ``bytes.translate``, which maps a whole column at C speed.
+_MATCHES = tuple(bytes(int(i == code) for i in range(256)) for code in range(256))
+_DIFFERS = tuple(bytes(int(i != code) for i in range(256)) for code in range(256))
+# 1 where the byte is below the code, 2 where it is equal, 0 above.
+_COMPARES = tuple(
+    bytes(1 if i < code else 2 if i == code else 0 for i in range(256))
+    for code in range(256)
+)
+_FLIP_SIGN = bytes(i ^ 0x80 for i in range(256))
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+# Rows still tied after a byte are finished one by one below this share.
+_SPARSE_SHIFT = 10
+
+
+class _TimestampColumn:
+    """Compare a timestamp column with bounds using whole-buffer operations.
+
+    Masks are integers selecting row ``i`` when bit ``8 * i`` is set, so
+    they combine with ``&`` and ``|`` and convert to one byte per row with
+    ``int.to_bytes``. The 64-bit values are compared one byte position at a
+    time from the most significant, each position being one strided slice
+    and one ``translate`` over the whole column; slices are kept, so
+    comparing with a second bound reuses them. Positions holding the same
+    byte in every row are decided without a translation, and the few rows
+    still tied once most are decided are compared one by one.
+    """
+
+    __slots__ = ('_column', '_count', '_ones', '_raw', '_positions')
+
+    def __init__(self, column: 'array[int]'):
+        self._column = column
+        self._count = len(column)
+        self._ones = int.from_bytes(b'\x01' * self._count, 'little')
+        self._raw = column.tobytes()
+        self._positions: Dict[int, Tuple[bytes, bool]] = {}
+
+    def below(self, bound: int) -> int:
+        """Return the mask of the timestamps less than ``bound``."""
+        if not self._count or bound <= MISSING_TIMESTAMP:
+            return 0
+        if bound > _INT64_MAX:
+            return self._ones
+        key = (bound - MISSING_TIMESTAMP).to_bytes(8, 'little')
+        below = 0
+        tied = self._ones
+        for significance in range(7, -1, -1):
+            values, constant = self._position(significance)
+            target = key[significance]
+            if constant:
+                if values[0] == target:
+                    continue
+                return below | tied if values[0] < target else below
+            codes = int.from_bytes(values.translate(_COMPARES[target]), 'little')
+            below |= tied & codes
+            tied &= codes >> 1
+            if not tied:
+                return below
+            if tied.bit_count() <= self._count >> _SPARSE_SHIFT:
+                return self._finish(below, tied, bound)
+        return below
+
+    def _position(self, significance: int) -> Tuple[bytes, bool]:
+        position = self._positions.get(significance)
+        if position is None:
+            offset = significance if _LITTLE_ENDIAN else 7 - significance
+            values = self._raw[offset::8]
+            if significance == 7:
+                values = values.translate(_FLIP_SIGN)
+            position = (values, values.count(values[0]) == self._count)
+            self._positions[significance] = position
+        return position
+
+    def _finish(self, below: int, tied: int, bound: int) -> int:
+        rows = bytearray(below.to_bytes(self._count, 'little'))
+        pending = tied.to_bytes(self._count, 'little')
+        index = pending.find(1)
+        while index != -1:
+            rows[index] = self._column[index] < bound
+            index = pending.find(1, index + 1)
+        return int.from_bytes(rows, 'little')
+
+
+class TodoBatch:
+    """Represent many todos as parallel columns instead of entity objects.
+
+    Statuses are stored as small integer codes and timestamps as UTC epoch
+    milliseconds in typed arrays, and identifiers as one buffer of raw
+    16-byte UUIDs, so that predicates such as overdue checks scan compact
+    columns instead of entity attributes. Missing completion timestamps are
+    stored as ``MISSING_TIMESTAMP``.
+
+    Masks are ``bytes`` holding 1 for each selected todo and 0 otherwise,
+    and are computed with whole-buffer operations rather than per-row
+    Python code.
+
+    Attributes:
+        _ids: Todo identifiers as consecutive 16-byte UUIDs.
+        _titles: Title strings.
+        _descriptions: Description strings or None.
+        _statuses: Status codes as defined by ``STATUS_CODES``.
+        _created_at: Creation timestamps in epoch milliseconds.
+        _updated_at: Last update timestamps in epoch milliseconds.
+        _completed_at: Completion timestamps in epoch milliseconds.
+    """
+
+    __slots__ = (
+        '_ids',
+        '_titles',
+        '_descriptions',
+        '_statuses',
+        '_created_at',
+        '_updated_at',
+        '_completed_at',
+    )
+
+    def __init__(
+        self,
+        ids: bytes,
+        titles: List[str],
+        descriptions: List[Optional[str]],
+        statuses: 'array[int]',
+        created_at: 'array[int]',
+        updated_at: 'array[int]',
+        completed_at: 'array[int]',
+    ):
+        """Initialize a batch from equally sized columns.
+
+        Args:
+            ids: Todo identifiers as consecutive 16-byte UUIDs.
+            titles: Title strings.
+            descriptions: Description strings or None.
+            statuses: Status codes as defined by ``STATUS_CODES``, typecode ``b``.
+            created_at: Creation timestamps in epoch milliseconds, typecode ``q``.
+            updated_at: Last update timestamps in epoch milliseconds, typecode ``q``.
+            completed_at: Completion timestamps in epoch milliseconds,
+                typecode ``q``.
+
+        Raises:
+            ValueError: If the columns differ in length.
+        """
+        columns = (
+            titles,
+            descriptions,
+            statuses,
+            created_at,
+            updated_at,
+            completed_at,
+        )
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1 or len(ids) != ID_SIZE * len(titles):
+            raise ValueError('All TodoBatch columns must have the same length')
+
+        self._ids = ids
+        self._titles = titles
+        self._descriptions = descriptions
+        self._statuses = statuses
+        self._created_at = created_at
+        self._updated_at = updated_at
+        self._completed_at = completed_at
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    @property
+    def ids(self) -> bytes:
+        """Return the identifier column as consecutive 16-byte UUIDs."""
+        return self._ids
+
+    @property
+    def statuses(self) -> 'array[int]':
+        """Return the status code column."""
+        return self._statuses
+
+    @property
+    def created_at(self) -> 'array[int]':
+        """Return the creation timestamp column."""
+        return self._created_at
+
+    @property
+    def updated_at(self) -> 'array[int]':
+        """Return the last update timestamp column."""
+        return self._updated_at
+
+    @property
+    def completed_at(self) -> 'array[int]':
+        """Return the completion timestamp column."""
+        return self._completed_at
+
+    def status_mask(self, status: TodoStatus) -> bytes:
+        """Return a mask selecting todos in the given status.
+
+        Args:
+            status: Lifecycle status to match.
+
+        Returns:
+            bytes: 1 where the todo has the given status.
+        """
+        return self._statuses.tobytes().translate(_MATCHES[STATUS_CODES[status]])
+
+    def is_overdue(
+        self, deadline: EpochMs, current_time: Optional[int] = None
+    ) -> bytes:
+        """Determine which todos have passed the provided deadline.
+
+        This is the columnar counterpart of ``Todo.is_overdue``.
+
+        Args:
+            deadline: Deadline in epoch milliseconds, either shared by all todos
+                or given per todo as a sequence.
+            current_time: Current time in epoch milliseconds.
+
+        Returns:
+            bytes: 1 where the todo is incomplete and past the deadline.
+
+        Raises:
+            ValueError: If per-todo deadlines do not match the batch length.
+        """
+        now = current_time if current_time is not None else TodoTimestamp.now().value
+        if isinstance(deadline, int):
+            if deadline >= now:
+                return bytes(len(self))
+            return self._incomplete()
+        if len(deadline) != len(self):
+            raise ValueError('The deadlines must have one value per todo')
+        if not isinstance(deadline, array) or deadline.typecode != 'q':
+            deadline = array('q', deadline)
+        incomplete = int.from_bytes(self._incomplete(), 'little')
+        overdue = incomplete & _TimestampColumn(deadline).below(now)
+        return overdue.to_bytes(len(self), 'little')
+
+    def time_range_mask(self, field: str, start: int, end: int) -> bytes:
+        """Return a mask selecting todos whose timestamp lies in ``[start, end)``.
+
+        Args:
+            field: One of ``created_at``, ``updated_at`` or ``completed_at``.
+            start: Inclusive lower bound in epoch milliseconds.
+            end: Exclusive upper bound in epoch milliseconds.
+
+        Returns:
+            bytes: 1 where the timestamp falls inside the range.
+
+        Raises:
+            ValueError: If ``field`` is not a timestamp column.
+        """
+        if field not in TIME_FIELDS:
+            raise ValueError(f'Unknown timestamp field: {field}')
+        if start >= end:
+            return bytes(len(self))
+        column = _TimestampColumn(getattr(self, field))
+        inside = column.below(end) & ~column.below(start)
+        return inside.to_bytes(len(self), 'little')
+
+    def select(self, mask: Sequence[int]) -> 'TodoBatch':
+        """Return a new batch containing the rows selected by ``mask``.
+
+        Args:
+            mask: One value per todo in the batch, truthy to keep it, such
+                as a mask returned by this batch.
+
+        Returns:
+            TodoBatch: Batch holding only the selected todos.
+
+        Raises:
+            ValueError: If the mask does not match the batch length.
+        """
+        if len(mask) != len(self):
+            raise ValueError('The mask must have one value per todo')
+        view = memoryview(self._ids)
+        return TodoBatch(
+            b''.join(
+                compress(
+                    (view[i : i + ID_SIZE] for i in range(0, len(view), ID_SIZE)),
+                    mask,
+                )
+            ),
+            list(compress(self._titles, mask)),
+            list(compress(self._descriptions, mask)),
+            array('b', compress(self._statuses, mask)),
+            array('q', compress(self._created_at, mask)),
+            array('q', compress(self._updated_at, mask)),
+            array('q', compress(self._completed_at, mask)),
+        )
+
+    def _incomplete(self) -> bytes:
+        completed = STATUS_CODES[TodoStatus.COMPLETED]
+        return self._statuses.tobytes().translate(_DIFFERS[completed])
+
+    def to_todos(self) -> List[Todo]:
+        """Materialize the batch as todo entities.
+
+        Returns:
+            List[Todo]: One entity per row, in batch order.
+        """
+        todos = []
+        for i in range(len(self)):
+            completed_at = self._completed_at[i]
+            description = self._descriptions[i]
+            todos.append(
+                Todo(
+                    TodoId(UUID(bytes=self._ids[i * ID_SIZE : (i + 1) * ID_SIZE])),
+                    TodoTitle(self._titles[i]),
+                    TodoDescription(description) if description else None,
+                    STATUSES_BY_CODE[self._statuses[i]],
+                    TodoTimestamp(self._created_at[i]),
+                    TodoTimestamp(self._updated_at[i]),
+                    TodoTimestamp(completed_at)
+                    if completed_at != MISSING_TIMESTAMP
+                    else None,
+                )
+            )
+        return todos
+
+    @staticmethod
+    def from_todos(todos: Sequence[Todo]) -> 'TodoBatch':
+        """Build a batch from todo entities.
+
+        Args:
+            todos: Entities to convert.
+
+        Returns:
+            TodoBatch: Columnar copy of the entities.
+        """
+        return TodoBatch.from_rows(
+            (
+                todo.id.value,
+                todo.title.value,
+                todo.description.value if todo.description else None,
+                todo.status.value,
+                todo.created_at.value,
+                todo.updated_at.value,
+                todo.completed_at.value if todo.completed_at else None,
+            )
+            for todo in todos
+        )
+
+    @staticmethod
+    def from_rows(rows: Iterable[TodoRow]) -> 'TodoBatch':
+        """Build a batch from persisted column values.
+
+        Args:
+            rows: Tuples of ``(id, title, description, status, created_at,
+                updated_at, completed_at)`` with timestamps in epoch milliseconds.
+
+        Returns:
+            TodoBatch: Batch holding the rows in iteration order.
+        """
+        codes = {status.value: code for status, code in STATUS_CODES.items()}
+        ids = bytearray()
+        titles: List[str] = []
+        descriptions: List[Optional[str]] = []
+        statuses = array('b')
+        created_at = array('q')
+        updated_at = array('q')
+        completed_at = array('q')
+        for row in rows:
+            ids += row[0].bytes
+            titles.append(row[1])
+            descriptions.append(row[2])
+            statuses.append(codes[row[3]])
+            created_at.append(row[4])
+            updated_at.append(row[5])
+            completed_at.append(row[6] if row[6] is not None else MISSING_TIMESTAMP)
+
+        return TodoBatch(
+            bytes(ids),
+            titles,
+            descriptions,
+            statuses,
+            created_at,
+            updated_at,
+            completed_at,
+        )
@@ -0,0 +1,7 @@
+"""Expose todo domain events."""
+
+from __future__ import annotations
+
+from .todo_event import TodoEvent, TodoEventKind, TodoSnapshot
+
+__all__ = ('TodoEvent', 'TodoEventKind', 'TodoSnapshot')
@@ -0,0 +1,63 @@
+"""Define the events describing changes to todos."""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+from dddpy.domain.todo.value_objects import (
+    TodoDescription,
+    TodoId,
+    TodoStatus,
+    TodoTimestamp,
+    TodoTitle,
+)
+
+
+class TodoEventKind(Enum):
+    """Enumerate the changes a todo goes through."""
+
+    CREATED = 'created'
+    UPDATED = 'updated'
+    STARTED = 'started'
+    COMPLETED = 'completed'
+    DELETED = 'deleted'
+
+
+@dataclass(frozen=True, slots=True)
+class TodoSnapshot:
+    """Hold the state of a todo at one point in time.
+
+    Attributes:
+        id: Identifier of the todo.
+        title: Title of the todo.
+        description: Description of the todo, if any.
+        status: Lifecycle status of the todo.
+        created_at: Creation timestamp.
+        updated_at: Last update timestamp.
+        completed_at: Completion timestamp, if completed.
+        version: Version the state is persisted under.
+    """
+
+    id: TodoId
+    title: TodoTitle
+    description: Optional[TodoDescription]
+    status: TodoStatus
+    created_at: TodoTimestamp
+    updated_at: TodoTimestamp
+    completed_at: Optional[TodoTimestamp]
+    version: int
+
+
+@dataclass(frozen=True)
+class TodoEvent:
+    """Record one change made to a todo.
+
+    Attributes:
+        kind: Change that was made.
+        todo_id: Identifier of the changed todo.
+        todo: State of the todo right after the change; None once deleted.
+    """
+
+    kind: TodoEventKind
+    todo_id: TodoId
+    todo: Optional[TodoSnapshot] = None
@@ -6,10 +6,12 @@ from .todo_already_completed_error import TodoAlreadyCompletedError
 from .todo_already_started_error import TodoAlreadyStartedError
 from .todo_not_found_error import TodoNotFoundError
 from .todo_not_started_error import TodoNotStartedError
+from .todo_version_conflict_error import TodoVersionConflictError
 
 __all__ = (
     'TodoAlreadyCompletedError',
     'TodoAlreadyStartedError',
     'TodoNotFoundError',
     'TodoNotStartedError',
+    'TodoVersionConflictError',
 )
@@ -0,0 +1,11 @@
+"""Define exception for concurrent modifications of a todo."""
+
+
+class TodoVersionConflictError(Exception):
+    """Raise when a todo changed since the version the caller based its edit on."""
+
+    message = 'The Todo was modified by another request.'
+
+    def __str__(self):
+        """Return the default human-readable error message."""
+        return TodoVersionConflictError.message
@@ -1,10 +1,10 @@
 """Define the repository abstraction for todo entities."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
-from dddpy.domain.todo.entities import Todo
-from dddpy.domain.todo.value_objects import TodoId
+from dddpy.domain.todo.entities import Todo, TodoBatch
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTimestamp
 
 
 class TodoRepository(ABC):
@@ -12,7 +12,10 @@ class TodoRepository(ABC):
 
     @abstractmethod
     def save(self, todo: Todo) -> None:
-        """Persist the provided todo entity.
+        """Register the provided todo entity to be stored.
+
+        Implementations may defer the write until the surrounding unit of
+        work is committed.
 
         Args:
             todo: Todo instance to store or update.
@@ -38,9 +41,84 @@ class TodoRepository(ABC):
         """
 
     @abstractmethod
-    def delete(self, todo_id: TodoId) -> None:
+    def find_all_as_batch(self) -> TodoBatch:
+        """Return every stored todo in columnar form for bulk queries.
+
+        Returns:
+            TodoBatch: All persisted todos without per-entity objects.
+        """
+
+    @abstractmethod
+    def find_statuses(self, todo_ids: Sequence[TodoId]) -> Dict[TodoId, TodoStatus]:
+        """Return the current status of each existing todo among the given ids.
+
+        Args:
+            todo_ids: Identifiers of the todos to look up.
+
+        Returns:
+            Dict[TodoId, TodoStatus]: Status by identifier; missing todos are
+            left out.
+        """
+
+    @abstractmethod
+    def start(self, todo_id: TodoId, now: TodoTimestamp) -> Optional[Todo]:
+        """Move a not-started todo to in progress in one atomic operation.
+
+        Args:
+            todo_id: Identifier of the todo to start.
+            now: Time recorded as the todo's update timestamp.
+
+        Returns:
+            Optional[Todo]: The started todo, or None when no not-started todo
+            matches the identifier.
+        """
+
+    @abstractmethod
+    def complete(self, todo_id: TodoId, now: TodoTimestamp) -> Optional[Todo]:
+        """Move an in-progress todo to completed in one atomic operation.
+
+        Args:
+            todo_id: Identifier of the todo to complete.
+            now: Time recorded as the completion and update timestamp.
+
+        Returns:
+            Optional[Todo]: The completed todo, or None when no in-progress todo
+            matches the identifier.
+        """
+
+    @abstractmethod
+    def start_many(self, todo_ids: Sequence[TodoId], now: TodoTimestamp) -> List[Todo]:
+        """Move every not-started todo among the given ids to in progress at once.
+
+        Args:
+            todo_ids: Identifiers of the todos to start.
+            now: Time recorded as the todos' update timestamp.
+
+        Returns:
+            List[Todo]: The started todos, in no particular order.
+        """
+
+    @abstractmethod
+    def complete_many(
+        self, todo_ids: Sequence[TodoId], now: TodoTimestamp
+    ) -> List[Todo]:
+        """Move every in-progress todo among the given ids to completed at once.
+
+        Args:
+            todo_ids: Identifiers of the todos to complete.
+            now: Time recorded as the completion and update timestamp.
+
+        Returns:
+            List[Todo]: The completed todos, in no particular order.
+        """
+
+    @abstractmethod
+    def delete(self, todo_id: TodoId) -> bool:
         """Remove the todo identified by the provided ID.
 
         Args:
             todo_id: Identifier of the todo to delete.
+
+        Returns:
+            bool: True when a todo was deleted; False when none matched.
         """
@@ -5,6 +5,13 @@ from __future__ import annotations
 from .todo_description import TodoDescription
 from .todo_id import TodoId
 from .todo_status import TodoStatus
+from .todo_timestamp import TodoTimestamp
 from .todo_title import TodoTitle
 
-__all__ = ('TodoDescription', 'TodoId', 'TodoStatus', 'TodoTitle')
+__all__ = (
+    'TodoDescription',
+    'TodoId',
+    'TodoStatus',
+    'TodoTimestamp',
+    'TodoTitle',
+)
@@ -0,0 +1,50 @@
+"""Define the Todo timestamp value object."""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MILLISECOND = timedelta(milliseconds=1)
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class TodoTimestamp:
+    """Represent a UTC instant as integer milliseconds since the Unix epoch.
+
+    The integer is the canonical representation; ``datetime`` objects are only
+    created when ``to_datetime`` is called.
+    """
+
+    value: int
+
+    @staticmethod
+    def now() -> 'TodoTimestamp':
+        """Return the current time read from the system clock.
+
+        Returns:
+            TodoTimestamp: Timestamp for the current instant.
+        """
+        return TodoTimestamp(time.time_ns() // 1_000_000)
+
+    @staticmethod
+    def from_datetime(value: datetime) -> 'TodoTimestamp':
+        """Convert a datetime into a timestamp.
+
+        Args:
+            value: Datetime to convert. Naive values are interpreted as UTC.
+
+        Returns:
+            TodoTimestamp: Timestamp for the same instant.
+        """
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return TodoTimestamp((value - EPOCH) // ONE_MILLISECOND)
+
+    def to_datetime(self) -> datetime:
+        """Return the timestamp as a timezone-aware UTC datetime."""
+        return EPOCH + self.value * ONE_MILLISECOND
+
+    def __str__(self) -> str:
+        """Return the epoch-millisecond value as a string."""
+        return str(self.value)
@@ -2,6 +2,15 @@
 
 from __future__ import annotations
 
-from . import di, sqlite
+from . import di, diagnostics, events, idempotency, metrics, profiling, sqlite, tracing
 
-__all__ = ('di', 'sqlite')
+__all__ = (
+    'di',
+    'diagnostics',
+    'events',
+    'idempotency',
+    'metrics',
+    'profiling',
+    'sqlite',
+    'tracing',
+)
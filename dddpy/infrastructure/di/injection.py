@@ -1,36 +1,383 @@
 """Dependency injection configuration for the application."""
 
-from typing import Iterator
+import threading
+from dataclasses import asdict
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from dddpy.domain.todo.clocks import Clock, CoarseClock
+from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.infrastructure.sqlite.database import SessionLocal
-from dddpy.infrastructure.sqlite.todo.todo_repository import new_todo_repository
+from dddpy.infrastructure.diagnostics import MemoryDiagnostics
+from dddpy.infrastructure.events import (
+    Broadcaster,
+    TodoEventBroadcaster,
+    TodoEventDispatcher,
+)
+from dddpy.infrastructure.idempotency import IdempotencyStore
+from dddpy.infrastructure.metrics import (
+    MetricsRegistry,
+    instrument_engine_pool,
+    time_methods,
+)
+from dddpy.infrastructure.profiling import ProfileStore
+from dddpy.infrastructure.sqlite.database import SessionLocal, engine
+from dddpy.infrastructure.sqlite.statement_stats import instrument_statement_stats
+from dddpy.infrastructure.sqlite.todo import (
+    TodoIdBloomFilter,
+    TodoOutboxRelay,
+    TodoRepositoryImpl,
+    log_todo_outbox_messages,
+)
+from dddpy.infrastructure.sqlite.todo.todo_unit_of_work import new_todo_unit_of_work
+from dddpy.infrastructure.tracing import (
+    OtlpJsonFileSpanExporter,
+    RingBufferSpanExporter,
+    Tracer,
+    instrument_sql_spans,
+    trace_methods,
+)
 from dddpy.usecase.todo import (
+    CompleteTodosUseCase,
     CompleteTodoUseCase,
     CreateTodoUseCase,
     DeleteTodoUseCase,
+    ExecuteTodoBatchUseCase,
     FindTodoByIdUseCase,
     FindTodosUseCase,
+    SingleFlight,
+    SingleFlightStats,
+    StartTodosUseCase,
     StartTodoUseCase,
+    TodoUnitOfWork,
     UpdateTodoUseCase,
     new_complete_todo_usecase,
+    new_complete_todos_usecase,
     new_create_todo_usecase,
     new_delete_todo_usecase,
+    new_execute_todo_batch_usecase,
     new_find_todo_by_id_usecase,
     new_find_todos_usecase,
     new_start_todo_usecase,
+    new_start_todos_usecase,
     new_update_todo_usecase,
 )
+from dddpy.usecase.todo.complete_todo_usecase import CompleteTodoUseCaseImpl
+from dddpy.usecase.todo.complete_todos_usecase import CompleteTodosUseCaseImpl
+from dddpy.usecase.todo.create_todo_usecase import CreateTodoUseCaseImpl
+from dddpy.usecase.todo.delete_todo_usecase import DeleteTodoUseCaseImpl
+from dddpy.usecase.todo.execute_todo_batch_usecase import ExecuteTodoBatchUseCaseImpl
+from dddpy.usecase.todo.find_todo_by_id_usecase import FindTodoByIdUseCaseImpl
+from dddpy.usecase.todo.find_todos_usecase import FindTodosUseCaseImpl
+from dddpy.usecase.todo.start_todo_usecase import StartTodoUseCaseImpl
+from dddpy.usecase.todo.start_todos_usecase import StartTodosUseCaseImpl
+from dddpy.usecase.todo.update_todo_usecase import UpdateTodoUseCaseImpl
+
+CLOCK_RESOLUTION_MS = 10
+
+_clock = CoarseClock(resolution_ms=CLOCK_RESOLUTION_MS)
+
+_idempotency_store = IdempotencyStore()
+
+SINGLE_FLIGHT_TIMEOUT_SECONDS = 5.0
+
+_find_todo_by_id_flight: SingleFlight[Todo] = SingleFlight(
+    SINGLE_FLIGHT_TIMEOUT_SECONDS
+)
+_find_todos_flight: SingleFlight[List[Todo]] = SingleFlight(
+    SINGLE_FLIGHT_TIMEOUT_SECONDS
+)
+
+# The filter only learns the identifiers written by this process, so it
+# answers false 404s for todos created by other workers. Enable it only when
+# a single process writes to the database.
+TODO_ID_FILTER_ENABLED = False
+TODO_ID_FILTER_FALSE_POSITIVE_RATE = 0.01
+TODO_ID_FILTER_REBUILD_SECONDS = 60 * 60
+
+_todo_id_filter = TodoIdBloomFilter(
+    false_positive_rate=TODO_ID_FILTER_FALSE_POSITIVE_RATE
+)
+
+TODO_STREAM_QUEUE_SIZE = 256
+TODO_STREAM_HISTORY_SIZE = 1024
+
+_todo_event_broadcaster = Broadcaster(
+    queue_size=TODO_STREAM_QUEUE_SIZE, history_size=TODO_STREAM_HISTORY_SIZE
+)
+
+TODO_EVENT_WORKERS = 2
+TODO_EVENT_QUEUE_SIZE = 10_000
+TODO_EVENT_BATCH_SIZE = 100
+
+_todo_event_dispatcher = TodoEventDispatcher(
+    workers=TODO_EVENT_WORKERS,
+    queue_size=TODO_EVENT_QUEUE_SIZE,
+    batch_size=TODO_EVENT_BATCH_SIZE,
+)
+_todo_event_dispatcher.subscribe(TodoEventBroadcaster(_todo_event_broadcaster).publish)
+
+TODO_OUTBOX_ENABLED = True
+TODO_OUTBOX_BATCH_SIZE = 500
+TODO_OUTBOX_RETENTION_SECONDS = 60 * 60
+
+_todo_outbox_relay = TodoOutboxRelay(
+    SessionLocal,
+    batch_size=TODO_OUTBOX_BATCH_SIZE,
+    retention_seconds=TODO_OUTBOX_RETENTION_SECONDS,
+)
+_todo_outbox_relay.subscribe(log_todo_outbox_messages)
+
+SLOW_QUERY_LOG_THRESHOLD_MS: Optional[float] = None
+SLOW_QUERY_LOG_REDACT_PARAMETERS = True
+
+_TODO_USECASES = (
+    CreateTodoUseCaseImpl,
+    FindTodoByIdUseCaseImpl,
+    FindTodosUseCaseImpl,
+    UpdateTodoUseCaseImpl,
+    StartTodoUseCaseImpl,
+    CompleteTodoUseCaseImpl,
+    StartTodosUseCaseImpl,
+    CompleteTodosUseCaseImpl,
+    DeleteTodoUseCaseImpl,
+    ExecuteTodoBatchUseCaseImpl,
+)
+_TODO_REPOSITORY_METHODS = (
+    'find_by_id',
+    'find_all',
+    'find_all_as_batch',
+    'find_statuses',
+    'save',
+    'flush',
+    'start',
+    'complete',
+    'start_many',
+    'complete_many',
+    'delete',
+)
+
+_metrics = MetricsRegistry()
+
+TRACE_SAMPLE_RATE = 0.0
+TRACE_BUFFER_SIZE = 256
+TRACE_FILE_PATH: Optional[str] = None
+
+_trace_buffer = RingBufferSpanExporter(TRACE_BUFFER_SIZE)
+_tracer = Tracer(
+    TRACE_SAMPLE_RATE,
+    [_trace_buffer]
+    + ([OtlpJsonFileSpanExporter(TRACE_FILE_PATH)] if TRACE_FILE_PATH else []),
+)
+
+PROFILE_STORE_SIZE = 32
+PROFILE_SAMPLE_INTERVAL_SECONDS = 0.001
+# Client addresses allowed to profile requests and to call the /debug routes.
+PROFILE_ALLOWED_HOSTS = ('127.0.0.1', '::1')
+
+_profile_store = ProfileStore(PROFILE_STORE_SIZE)
+
+_memory_diagnostics = MemoryDiagnostics()
+
+
+def _component_stats() -> Dict[Tuple[str, ...], float]:
+    stats: Dict[str, Any] = {
+        'todo_id_filter': _todo_id_filter.stats(),
+        'todo_event_dispatcher': _todo_event_dispatcher.stats(),
+        'todo_event_broadcaster': _todo_event_broadcaster.stats(),
+        'todo_outbox_relay': _todo_outbox_relay.stats(),
+        **{
+            f'single_flight_{name}': flight_stats
+            for name, flight_stats in get_single_flight_stats().items()
+        },
+    }
+    return {
+        (component, field): float(value)
+        for component, snapshot in stats.items()
+        for field, value in asdict(snapshot).items()
+    }
+
+
+_metrics.callback_gauge(
+    'todo_component_stat',
+    'Counters reported by the todo components.',
+    ('component', 'stat'),
+    _component_stats,
+)
+
+
+class _Instrumentation:
+    """Record whether the process has been instrumented, under a lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.done = False
+
+
+_instrumentation = _Instrumentation()
+
+
+def instrument_app() -> None:
+    """Attach metrics and tracing to the todo use cases, repository and engine.
+
+    The use case and repository methods are wrapped in place and listeners
+    are added to the application engine, so this is called once the
+    application starts rather than when the module is imported. Later calls
+    do nothing.
+    """
+    with _instrumentation.lock:
+        if _instrumentation.done:
+            return
+        usecase_duration = _metrics.histogram(
+            'usecase_duration_seconds', 'Use case execution time.', ('class', 'method')
+        )
+        repository_duration = _metrics.histogram(
+            'repository_duration_seconds',
+            'Repository call time; its count is the number of calls.',
+            ('class', 'method'),
+        )
+        for usecase in _TODO_USECASES:
+            time_methods(usecase, ('execute',), usecase_duration)
+            trace_methods(usecase, ('execute',), _tracer)
+        time_methods(TodoRepositoryImpl, _TODO_REPOSITORY_METHODS, repository_duration)
+        trace_methods(TodoRepositoryImpl, _TODO_REPOSITORY_METHODS, _tracer)
+
+        instrument_engine_pool(engine, _metrics)
+        instrument_statement_stats(engine)
+        instrument_sql_spans(engine, _tracer)
+        _instrumentation.done = True
+
+
+def get_clock() -> Clock:
+    """Provide the process-wide clock used to timestamp todo changes.
+
+    Returns:
+        Clock: Coarse clock shared by all requests.
+    """
+    return _clock
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Provide the process-wide store of idempotent responses.
+
+    Returns:
+        IdempotencyStore: Store shared by all requests.
+    """
+    return _idempotency_store
+
+
+def get_todo_id_filter() -> TodoIdBloomFilter:
+    """Provide the process-wide filter of stored todo identifiers.
+
+    Returns:
+        TodoIdBloomFilter: Filter shared by all requests.
+    """
+    return _todo_id_filter
+
+
+def get_todo_event_broadcaster() -> Broadcaster:
+    """Provide the process-wide broadcaster of the todo change stream.
+
+    Returns:
+        Broadcaster: Broadcaster shared by all stream subscribers.
+    """
+    return _todo_event_broadcaster
+
+
+def get_todo_event_dispatcher() -> TodoEventDispatcher:
+    """Provide the process-wide dispatcher of committed todo events.
+
+    Returns:
+        TodoEventDispatcher: Dispatcher shared by all requests.
+    """
+    return _todo_event_dispatcher
+
+
+def get_todo_outbox_relay() -> TodoOutboxRelay:
+    """Provide the process-wide relay of the todo event outbox.
+
+    Returns:
+        TodoOutboxRelay: Relay delivering outbox rows to its handlers.
+    """
+    return _todo_outbox_relay
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Provide the process-wide registry of application metrics.
+
+    Returns:
+        MetricsRegistry: Registry rendered by the metrics endpoint.
+    """
+    return _metrics
+
+
+def get_tracer() -> Tracer:
+    """Provide the process-wide tracer of requests.
+
+    Returns:
+        Tracer: Tracer sampling requests at ``TRACE_SAMPLE_RATE``.
+    """
+    return _tracer
+
+
+def get_trace_buffer() -> RingBufferSpanExporter:
+    """Provide the buffer of the most recent traces.
+
+    Returns:
+        RingBufferSpanExporter: Buffer served by the traces endpoint.
+    """
+    return _trace_buffer
+
+
+def get_profile_store() -> ProfileStore:
+    """Provide the store of on-demand request profiles.
+
+    Returns:
+        ProfileStore: Store served by the profiles endpoint.
+    """
+    return _profile_store
+
+
+def get_debug_allowed_hosts() -> FrozenSet[str]:
+    """Provide the client addresses allowed to call the debug routes.
+
+    Returns:
+        FrozenSet[str]: Addresses of the allowed clients.
+    """
+    return frozenset(PROFILE_ALLOWED_HOSTS)
+
+
+def get_memory_diagnostics() -> MemoryDiagnostics:
+    """Provide the process-wide memory snapshots and counters.
+
+    Returns:
+        MemoryDiagnostics: Diagnostics served by the memory endpoints.
+    """
+    return _memory_diagnostics
+
+
+def get_single_flight_stats() -> Dict[str, SingleFlightStats]:
+    """Report how many concurrent reads each use case collapsed.
+
+    Returns:
+        Dict[str, SingleFlightStats]: Counters by use case name.
+    """
+    return {
+        'find_todo_by_id': _find_todo_by_id_flight.stats(),
+        'find_todos': _find_todos_flight.stats(),
+    }
 
 
 def get_session() -> Iterator[Session]:
     """Yield a managed SQLAlchemy session for request handling.
 
+    Use cases commit through their unit of work; anything left uncommitted
+    when the request ends is rolled back.
+
     Yields:
-        Session: Database session with automatic commit or rollback.
+        Session: Database session closed after the request.
 
     Raises:
         Exception: Propagates any database or application error after rollback.
@@ -38,7 +385,6 @@ def get_session() -> Iterator[Session]:
     session: Session = SessionLocal()
     try:
         yield session
-        session.commit()
     except Exception:
         session.rollback()
         raise
@@ -46,92 +392,172 @@ def get_session() -> Iterator[Session]:
         session.close()
 
 
-def get_todo_repository(session: Session = Depends(get_session)) -> TodoRepository:
-    """Provide a repository instance bound to the current session.
+def get_todo_unit_of_work(
+    session: Session = Depends(get_session),
+    clock: Clock = Depends(get_clock),
+) -> TodoUnitOfWork:
+    """Provide a unit of work bound to the current session.
 
     Args:
         session: Active SQLAlchemy session provided by FastAPI.
+        clock: Clock dependency supplied by FastAPI.
 
     Returns:
-        TodoRepository: Repository configured with the session.
+        TodoUnitOfWork: Unit of work configured with the session.
     """
-    return new_todo_repository(session)
+    return new_todo_unit_of_work(
+        session,
+        _todo_id_filter if TODO_ID_FILTER_ENABLED else None,
+        _todo_event_dispatcher,
+        TODO_OUTBOX_ENABLED,
+        clock,
+    )
+
+
+def get_todo_repository(
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
+) -> TodoRepository:
+    """Provide the repository of the current unit of work.
+
+    Args:
+        unit_of_work: Unit of work dependency supplied by FastAPI.
+
+    Returns:
+        TodoRepository: Repository sharing the unit of work's identity map.
+    """
+    return unit_of_work.todos
 
 
 def get_create_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
+    clock: Clock = Depends(get_clock),
 ) -> CreateTodoUseCase:
-    """Provide the create-todo use case with injected repository.
+    """Provide the create-todo use case with injected unit of work and clock.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+        unit_of_work: Unit of work dependency supplied by FastAPI.
+        clock: Clock dependency supplied by FastAPI.
 
     Returns:
         CreateTodoUseCase: Configured use case implementation.
     """
-    return new_create_todo_usecase(todo_repository)
+    return new_create_todo_usecase(unit_of_work, clock)
 
 
 def get_start_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
+    clock: Clock = Depends(get_clock),
 ) -> StartTodoUseCase:
-    """Provide the start-todo use case with injected repository.
+    """Provide the start-todo use case with injected unit of work and clock.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+        unit_of_work: Unit of work dependency supplied by FastAPI.
+        clock: Clock dependency supplied by FastAPI.
 
     Returns:
         StartTodoUseCase: Configured use case implementation.
     """
-    return new_start_todo_usecase(todo_repository)
+    return new_start_todo_usecase(unit_of_work, clock)
 
 
 def get_complete_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
+    clock: Clock = Depends(get_clock),
 ) -> CompleteTodoUseCase:
-    """Provide the complete-todo use case with injected repository.
+    """Provide the complete-todo use case with injected unit of work and clock.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+        unit_of_work: Unit of work dependency supplied by FastAPI.
+        clock: Clock dependency supplied by FastAPI.
 
     Returns:
         CompleteTodoUseCase: Configured use case implementation.
     """
-    return new_complete_todo_usecase(todo_repository)
+    return new_complete_todo_usecase(unit_of_work, clock)
+
+
+def get_start_todos_usecase(
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
+    clock: Clock = Depends(get_clock),
+) -> StartTodosUseCase:
+    """Provide the bulk start-todos use case with injected unit of work and clock.
+
+    Args:
+        unit_of_work: Unit of work dependency supplied by FastAPI.
+        clock: Clock dependency supplied by FastAPI.
+
+    Returns:
+        StartTodosUseCase: Configured use case implementation.
+    """
+    return new_start_todos_usecase(unit_of_work, clock)
+
+
+def get_complete_todos_usecase(
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
+    clock: Clock = Depends(get_clock),
+) -> CompleteTodosUseCase:
+    """Provide the bulk complete-todos use case with injected unit of work and clock.
+
+    Args:
+        unit_of_work: Unit of work dependency supplied by FastAPI.
+        clock: Clock dependency supplied by FastAPI.
+
+    Returns:
+        CompleteTodosUseCase: Configured use case implementation.
+    """
+    return new_complete_todos_usecase(unit_of_work, clock)
 
 
 def get_update_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
+    clock: Clock = Depends(get_clock),
 ) -> UpdateTodoUseCase:
-    """Provide the update-todo use case with injected repository.
+    """Provide the update-todo use case with injected unit of work and clock.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+        unit_of_work: Unit of work dependency supplied by FastAPI.
+        clock: Clock dependency supplied by FastAPI.
 
     Returns:
         UpdateTodoUseCase: Configured use case implementation.
     """
-    return new_update_todo_usecase(todo_repository)
+    return new_update_todo_usecase(unit_of_work, clock)
 
 
 def get_delete_todo_usecase(
-    todo_repository: TodoRepository = Depends(get_todo_repository),
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
 ) -> DeleteTodoUseCase:
-    """Provide the delete-todo use case with injected repository.
+    """Provide the delete-todo use case with injected unit of work.
 
     Args:
-        todo_repository: Repository dependency supplied by FastAPI.
+        unit_of_work: Unit of work dependency supplied by FastAPI.
 
     Returns:
         DeleteTodoUseCase: Configured use case implementation.
     """
-    return new_delete_todo_usecase(todo_repository)
+    return new_delete_todo_usecase(unit_of_work)
+
+
+def get_execute_todo_batch_usecase(
+    unit_of_work: TodoUnitOfWork = Depends(get_todo_unit_of_work),
+    clock: Clock = Depends(get_clock),
+) -> ExecuteTodoBatchUseCase:
+    """Provide the batch todo use case with injected unit of work and clock.
+
+    Args:
+        unit_of_work: Unit of work dependency supplied by FastAPI.
+        clock: Clock dependency supplied by FastAPI.
+
+    Returns:
+        ExecuteTodoBatchUseCase: Configured use case implementation.
+    """
+    return new_execute_todo_batch_usecase(unit_of_work, clock)
 
 
 def get_find_todo_by_id_usecase(
     todo_repository: TodoRepository = Depends(get_todo_repository),
 ) -> FindTodoByIdUseCase:
-    """Provide the find-by-id use case with injected repository.
+    """Provide the find-by-id use case, coalescing concurrent lookups.
 
     Args:
         todo_repository: Repository dependency supplied by FastAPI.
@@ -139,13 +565,13 @@ def get_find_todo_by_id_usecase(
     Returns:
         FindTodoByIdUseCase: Configured use case implementation.
     """
-    return new_find_todo_by_id_usecase(todo_repository)
+    return new_find_todo_by_id_usecase(todo_repository, _find_todo_by_id_flight)
 
 
 def get_find_todos_usecase(
     todo_repository: TodoRepository = Depends(get_todo_repository),
 ) -> FindTodosUseCase:
-    """Provide the list-todos use case with injected repository.
+    """Provide the list-todos use case, coalescing concurrent listings.
 
     Args:
         todo_repository: Repository dependency supplied by FastAPI.
@@ -153,4 +579,4 @@ def get_find_todos_usecase(
     Returns:
         FindTodosUseCase: Configured use case implementation.
     """
-    return new_find_todos_usecase(todo_repository)
+    return new_find_todos_usecase(todo_repository, _find_todos_flight)
@@ -0,0 +1,7 @@
+"""Expose diagnostics of the running process."""
+
+from __future__ import annotations
+
+from .memory_diagnostics import GROUPINGS, MemoryDiagnostics, MemorySnapshot
+
+__all__ = ('GROUPINGS', 'MemoryDiagnostics', 'MemorySnapshot')
@@ -0,0 +1,206 @@
+"""Inspect the memory of the running process."""
+
+import gc
+import threading
+import time
+import tracemalloc
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+from dddpy.infrastructure.sqlite.todo import TodoRepositoryImpl
+
+GROUPINGS = ('lineno', 'filename', 'type')
+
+_IGNORED_TRACES = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+)
+
+
+@dataclass(frozen=True)
+class MemorySnapshot:
+    """Memory state captured under a name.
+
+    Attributes:
+        name: Name the snapshot was taken under.
+        created_at: Unix time at which it was taken.
+        type_counts: Live objects by qualified type name.
+        traces: Allocation traces, when tracemalloc was running.
+    """
+
+    name: str
+    created_at: float
+    type_counts: Counter[str]
+    traces: Optional[tracemalloc.Snapshot]
+
+
+def _type_counts() -> Counter[str]:
+    return Counter(
+        f'{type(obj).__module__}.{type(obj).__qualname__}' for obj in gc.get_objects()
+    )
+
+
+class MemoryDiagnostics:
+    """Take named memory snapshots and compare them.
+
+    Allocation diffs by file or line need ``tracemalloc`` running while
+    both snapshots are taken; diffs by type count the objects tracked by
+    the garbage collector and are always available. Every method walks or
+    copies the heap, so none of them belongs on a request path.
+    """
+
+    def __init__(self, max_snapshots: int = 16):
+        """Configure how many snapshots are kept.
+
+        Args:
+            max_snapshots: Most snapshots kept; the oldest is dropped first.
+        """
+        self.max_snapshots = max_snapshots
+        self._snapshots: 'OrderedDict[str, MemorySnapshot]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        """Return whether tracemalloc is recording allocations."""
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> None:
+        """Start recording allocations.
+
+        Args:
+            frames: Stack frames stored per allocation.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        """Stop recording allocations, discarding the recorded traces."""
+        tracemalloc.stop()
+
+    def traced_memory(self) -> Dict[str, int]:
+        """Return the current and peak size of the traced allocations."""
+        current, peak = tracemalloc.get_traced_memory()
+        return {'current': current, 'peak': peak}
+
+    def take_snapshot(self, name: str) -> MemorySnapshot:
+        """Capture the memory state under a name, replacing any previous one.
+
+        Args:
+            name: Name of the snapshot.
+
+        Returns:
+            MemorySnapshot: The captured snapshot.
+        """
+        snapshot = self._capture(name)
+        with self._lock:
+            self._snapshots.pop(name, None)
+            self._snapshots[name] = snapshot
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def snapshots(self) -> List[MemorySnapshot]:
+        """Return the kept snapshots, oldest first."""
+        with self._lock:
+            return list(self._snapshots.values())
+
+    def compare(
+        self,
+        base: str,
+        current: Optional[str] = None,
+        group_by: str = 'lineno',
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Return the largest changes between two snapshots.
+
+        Args:
+            base: Name of the earlier snapshot.
+            current: Name of the later snapshot; a fresh one when omitted.
+            group_by: ``lineno``, ``filename`` or ``type``.
+            limit: Most entries returned.
+
+        Returns:
+            List[Dict[str, Any]]: Changes, largest first.
+
+        Raises:
+            KeyError: When a named snapshot does not exist.
+            ValueError: When the grouping is unknown, or allocations are
+                compared but a snapshot was taken without tracemalloc.
+        """
+        if group_by not in GROUPINGS:
+            raise ValueError(f'group_by must be one of {", ".join(GROUPINGS)}')
+        with self._lock:
+            before = self._snapshots[base]
+            after = self._snapshots[current] if current else None
+        if after is None:
+            after = self._capture('now')
+        if group_by == 'type':
+            difference = Counter(after.type_counts)
+            difference.subtract(before.type_counts)
+            changed = sorted(
+                (item for item in difference.items() if item[1]),
+                key=lambda item: abs(item[1]),
+                reverse=True,
+            )
+            return [
+                {
+                    'type': name,
+                    'count': after.type_counts[name],
+                    'count_diff': count_diff,
+                }
+                for name, count_diff in changed[:limit]
+            ]
+        if before.traces is None or after.traces is None:
+            raise ValueError('both snapshots must be taken while tracemalloc runs')
+        return [
+            {
+                'location': str(statistic.traceback),
+                'size': statistic.size,
+                'size_diff': statistic.size_diff,
+                'count': statistic.count,
+                'count_diff': statistic.count_diff,
+            }
+            for statistic in after.traces.compare_to(before.traces, group_by)[:limit]
+        ]
+
+    def object_counts(self, types: Mapping[str, type]) -> Dict[str, int]:
+        """Count the live instances of the given types.
+
+        Args:
+            types: Types to count, by the name to report them under.
+
+        Returns:
+            Dict[str, int]: Instance counts by name.
+        """
+        counts = dict.fromkeys(types, 0)
+        names = {cls: name for name, cls in types.items()}
+        for obj in gc.get_objects():
+            name = names.get(type(obj))
+            if name is not None:
+                counts[name] += 1
+        return counts
+
+    def identity_map_sizes(self) -> List[Dict[str, int]]:
+        """Report the entities held by each live todo repository.
+
+        Returns:
+            List[Dict[str, int]]: For each repository, the todos in its
+            identity map and the objects in its session's identity map.
+        """
+        return [
+            {
+                'repository': obj.identity_map_size,
+                'session': len(obj.session.identity_map),
+            }
+            for obj in gc.get_objects()
+            if type(obj) is TodoRepositoryImpl
+        ]
+
+    def _capture(self, name: str) -> MemorySnapshot:
+        traces = None
+        if tracemalloc.is_tracing():
+            traces = tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+        return MemorySnapshot(name, time.time(), _type_counts(), traces)
@@ -0,0 +1,29 @@
+"""Expose the in-process delivery of todo events."""
+
+from __future__ import annotations
+
+from .broadcaster import (
+    Broadcaster,
+    BroadcasterStats,
+    SlowSubscriberPolicy,
+    Subscription,
+)
+from .todo_event_broadcaster import TodoEventBroadcaster
+from .todo_event_dispatcher import (
+    TodoEventDispatcher,
+    TodoEventDispatcherStats,
+    TodoEventHandler,
+)
+from .todo_event_json import encode_todo_event
+
+__all__ = (
+    'Broadcaster',
+    'BroadcasterStats',
+    'SlowSubscriberPolicy',
+    'Subscription',
+    'TodoEventBroadcaster',
+    'TodoEventDispatcher',
+    'TodoEventDispatcherStats',
+    'TodoEventHandler',
+    'encode_todo_event',
+)
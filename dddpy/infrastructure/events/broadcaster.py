@@ -0,0 +1,201 @@
+"""Fan Server-Sent Events frames out to many asyncio subscribers."""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, Optional, Set, Tuple
+
+HEARTBEAT_FRAME = b': keep-alive\n\n'
+RESET_FRAME = b'event: reset\ndata: \n\n'
+
+
+class SlowSubscriberPolicy(Enum):
+    """Enumerate what happens to a subscriber whose queue is full."""
+
+    DROP_OLDEST = 'drop_oldest'
+    DISCONNECT = 'disconnect'
+
+
+@dataclass(frozen=True)
+class BroadcasterStats:
+    """Snapshot of a broadcaster's counters.
+
+    Attributes:
+        subscribers: Currently connected subscribers.
+        published: Frames published since start.
+        dropped: Frames dropped from full subscriber queues.
+        disconnected: Subscribers disconnected for falling behind.
+    """
+
+    subscribers: int
+    published: int
+    dropped: int
+    disconnected: int
+
+
+class Subscription:
+    """Receive the frames published after subscribing, in order.
+
+    Iterating yields every frame queued since the previous step joined into
+    one chunk, and ends once the subscription is closed. An idle
+    subscription holds only an empty queue and an unset event.
+    """
+
+    __slots__ = ('_broadcaster', '_queue', '_ready', 'closed')
+
+    def __init__(self, broadcaster: 'Broadcaster'):
+        self._broadcaster = broadcaster
+        self._queue: Deque[bytes] = deque()
+        self._ready = asyncio.Event()
+        self.closed = False
+
+    def __aiter__(self) -> 'Subscription':
+        return self
+
+    async def __anext__(self) -> bytes:
+        while not self._queue:
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        chunk = b''.join(self._queue)
+        self._queue.clear()
+        return chunk
+
+    def close(self) -> None:
+        """Stop receiving frames and end the iteration."""
+        if not self.closed:
+            self.closed = True
+            self._broadcaster._subscribers.discard(self)
+        self._ready.set()
+
+    def _put(self, frame: bytes) -> None:
+        broadcaster = self._broadcaster
+        if len(self._queue) >= broadcaster.queue_size:
+            if broadcaster.policy == SlowSubscriberPolicy.DISCONNECT:
+                broadcaster._disconnected += 1
+                self._queue.clear()
+                self.close()
+                return
+            self._queue.popleft()
+            broadcaster._dropped += 1
+        self._queue.append(frame)
+        self._ready.set()
+
+
+class Broadcaster:
+    """Deliver each published frame to every subscriber.
+
+    Frames are numbered and the most recent ones are kept in a ring buffer,
+    so a client reconnecting with ``Last-Event-ID`` receives what it missed.
+    Each subscriber has a bounded queue; a subscriber that falls behind
+    either loses its oldest frames or is disconnected, depending on the
+    policy, so a slow client never holds up the others.
+
+    Subscribers live on one event loop. ``publish`` may be called from any
+    thread and hands the frame over to that loop.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 256,
+        history_size: int = 1024,
+        policy: SlowSubscriberPolicy = SlowSubscriberPolicy.DROP_OLDEST,
+    ):
+        """Configure queue bounds and the slow-subscriber policy.
+
+        Args:
+            queue_size: Most frames waiting for one subscriber.
+            history_size: Most recent frames kept for resuming clients.
+            policy: What to do with a subscriber whose queue is full.
+        """
+        self.queue_size = queue_size
+        self.policy = policy
+        self._history: Deque[Tuple[int, bytes]] = deque(maxlen=history_size)
+        self._subscribers: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_id = 0
+        self._dropped = 0
+        self._disconnected = 0
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the broadcaster to the event loop its subscribers run on.
+
+        Args:
+            loop: Loop serving the streaming responses.
+        """
+        self._loop = loop
+
+    def publish(self, event: str, data: str) -> None:
+        """Publish a frame to every subscriber from any thread.
+
+        Frames published before the broadcaster is attached are discarded.
+
+        Args:
+            event: SSE event name.
+            data: Single-line event payload.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        body = f'event: {event}\ndata: {data}\n\n'.encode()
+        loop.call_soon_threadsafe(self._deliver, body)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscription:
+        """Subscribe to frames, resuming after ``last_event_id`` when given.
+
+        When the frames following ``last_event_id`` are no longer buffered,
+        a ``reset`` event tells the client to reload its state instead.
+
+        Args:
+            last_event_id: Identifier of the last frame the client received.
+
+        Returns:
+            Subscription: Iterator of frame chunks.
+        """
+        subscription = Subscription(self)
+        self._subscribers.add(subscription)
+        if last_event_id is not None and last_event_id != self._last_id:
+            oldest = self._history[0][0] if self._history else self._last_id + 1
+            if not oldest - 1 <= last_event_id <= self._last_id:
+                subscription._put(RESET_FRAME)
+            else:
+                for frame_id, frame in self._history:
+                    if frame_id > last_event_id:
+                        subscription._put(frame)
+        return subscription
+
+    def heartbeat(self) -> None:
+        """Send a comment to idle subscribers so proxies keep them open."""
+        for subscription in self._subscribers:
+            if not subscription._queue:
+                subscription._put(HEARTBEAT_FRAME)
+
+    async def run_heartbeat(self, interval_seconds: float = 15.0) -> None:
+        """Send heartbeats periodically until cancelled.
+
+        Args:
+            interval_seconds: Pause between heartbeats.
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.heartbeat()
+
+    def close(self) -> None:
+        """Close every subscription, ending their streams."""
+        for subscription in list(self._subscribers):
+            subscription.close()
+
+    def stats(self) -> BroadcasterStats:
+        """Return a snapshot of the broadcaster's counters."""
+        return BroadcasterStats(
+            len(self._subscribers), self._last_id, self._dropped, self._disconnected
+        )
+
+    def _deliver(self, body: bytes) -> None:
+        self._last_id += 1
+        frame = b'id: %d\n' % self._last_id + body
+        self._history.append((self._last_id, frame))
+        for subscription in list(self._subscribers):
+            subscription._put(frame)
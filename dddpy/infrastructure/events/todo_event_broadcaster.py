@@ -0,0 +1,33 @@
+"""Publish committed todo events to Server-Sent Events subscribers."""
+
+from typing import Sequence
+
+from dddpy.domain.todo.events import TodoEvent
+from dddpy.infrastructure.events.broadcaster import Broadcaster
+from dddpy.infrastructure.events.todo_event_json import encode_todo_event
+from dddpy.usecase.todo import TodoEventPublisher
+
+
+class TodoEventBroadcaster(TodoEventPublisher):
+    """Encode todo events once and fan them out through a broadcaster.
+
+    Each event is serialized in the publishing thread and named after its
+    kind.
+    """
+
+    def __init__(self, broadcaster: Broadcaster):
+        """Store the broadcaster dependency.
+
+        Args:
+            broadcaster: Broadcaster serving the stream subscribers.
+        """
+        self.broadcaster = broadcaster
+
+    def publish(self, events: Sequence[TodoEvent]) -> None:
+        """Hand each event to the broadcaster.
+
+        Args:
+            events: Events of one transaction, in the order they were recorded.
+        """
+        for event in events:
+            self.broadcaster.publish(event.kind.value, encode_todo_event(event))
@@ -0,0 +1,189 @@
+"""Deliver committed todo events to subscribers on a pool of worker threads."""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from dddpy.domain.todo.events import TodoEvent
+from dddpy.usecase.todo import TodoEventPublisher
+
+logger = logging.getLogger(__name__)
+
+TodoEventHandler = Callable[[Sequence[TodoEvent]], None]
+
+
+@dataclass(frozen=True)
+class TodoEventDispatcherStats:
+    """Snapshot of a dispatcher's counters.
+
+    Attributes:
+        published: Events accepted for delivery.
+        dropped: Events rejected because the queue was full.
+        batches: Batches handed to the subscribers.
+        failures: Subscriber calls that raised.
+        queued: Events waiting for a worker.
+    """
+
+    published: int
+    dropped: int
+    batches: int
+    failures: int
+    queued: int
+
+
+class _Subscriber:
+    __slots__ = ('handler', 'turn', 'next_batch')
+
+    def __init__(self, handler: TodoEventHandler):
+        self.handler = handler
+        self.turn = threading.Condition()
+        self.next_batch = 0
+
+
+class TodoEventDispatcher(TodoEventPublisher):
+    """Queue committed events and deliver them off the request path.
+
+    ``publish`` only appends to one bounded queue, so its cost does not
+    depend on the number of subscribers. Workers take whatever is queued,
+    up to ``batch_size`` events, as a numbered batch and pass it to every
+    subscriber. Each subscriber receives the batches one at a time and in
+    order, so events reach it in publishing order; workers overlap by
+    delivering different batches to different subscribers.
+
+    When the queue is full, the events that do not fit are dropped and
+    counted right away, so a slow subscriber never holds up a request.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 10_000,
+        batch_size: int = 100,
+    ):
+        """Configure the worker pool and queue bounds.
+
+        Args:
+            workers: Threads delivering batches.
+            queue_size: Most events waiting for delivery.
+            batch_size: Most events handed to subscribers at once.
+        """
+        self.workers = workers
+        self.batch_size = batch_size
+        self._queue: queue.Queue[Optional[TodoEvent]] = queue.Queue(queue_size)
+        self._subscribers: List[_Subscriber] = []
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._take_lock = threading.Lock()
+        self._next_batch = 0
+        self._published = 0
+        self._dropped = 0
+        self._batches = 0
+        self._failures = 0
+
+    def subscribe(self, handler: TodoEventHandler) -> None:
+        """Register a handler called with each batch of events.
+
+        Handlers must be registered before the workers start; they run on
+        worker threads, one batch at a time.
+
+        Args:
+            handler: Callable receiving a batch of events.
+        """
+        self._subscribers = self._subscribers + [_Subscriber(handler)]
+
+    def publish(self, events: Sequence[TodoEvent]) -> None:
+        """Queue events for delivery, dropping those that do not fit.
+
+        Events published while the workers are not running are dropped.
+
+        Args:
+            events: Events of one transaction, in the order they were recorded.
+        """
+        accepted = 0
+        if self._threads:
+            for event in events:
+                try:
+                    self._queue.put_nowait(event)
+                except queue.Full:
+                    break
+                accepted += 1
+        with self._lock:
+            self._published += accepted
+            self._dropped += len(events) - accepted
+        if accepted < len(events):
+            logger.warning('Dropped %d todo events', len(events) - accepted)
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        if self._threads:
+            return
+        self._threads = [
+            threading.Thread(target=self._work, name=f'todo-events-{i}', daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout_seconds: float = 5.0) -> None:
+        """Deliver the queued events, then stop the worker threads.
+
+        Args:
+            timeout_seconds: Longest time to wait for each worker.
+        """
+        threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout_seconds)
+
+    def stats(self) -> TodoEventDispatcherStats:
+        """Return a snapshot of the dispatcher's counters."""
+        with self._lock:
+            return TodoEventDispatcherStats(
+                self._published,
+                self._dropped,
+                self._batches,
+                self._failures,
+                self._queue.qsize(),
+            )
+
+    def _work(self) -> None:
+        stopping = False
+        while not stopping:
+            with self._take_lock:
+                event = self._queue.get()
+                if event is None:
+                    return
+                batch = [event]
+                while len(batch) < self.batch_size:
+                    try:
+                        event = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if event is None:
+                        stopping = True
+                        break
+                    batch.append(event)
+                number = self._next_batch
+                self._next_batch += 1
+            self._deliver(number, batch)
+
+    def _deliver(self, number: int, batch: List[TodoEvent]) -> None:
+        failures = 0
+        for subscriber in self._subscribers:
+            with subscriber.turn:
+                while subscriber.next_batch != number:
+                    subscriber.turn.wait()
+            try:
+                subscriber.handler(batch)
+            except Exception:
+                failures += 1
+                logger.exception('Todo event handler %r failed', subscriber.handler)
+            with subscriber.turn:
+                subscriber.next_batch += 1
+                subscriber.turn.notify_all()
+        with self._lock:
+            self._batches += 1
+            self._failures += failures
@@ -0,0 +1,39 @@
+"""Serialize todo events for delivery outside the process."""
+
+import json
+from typing import Any, Dict
+
+from dddpy.domain.todo.events import TodoEvent, TodoSnapshot
+
+
+def encode_todo_event(event: TodoEvent) -> str:
+    """Return the compact JSON payload of a todo event.
+
+    The payload is the todo in the same shape the API returns it, or only
+    the identifier of a deleted todo.
+
+    Args:
+        event: Event to serialize.
+
+    Returns:
+        str: Single-line JSON document.
+    """
+    payload = (
+        _todo_payload(event.todo)
+        if event.todo is not None
+        else {'id': str(event.todo_id.value)}
+    )
+    return json.dumps(payload, separators=(',', ':'))
+
+
+def _todo_payload(todo: TodoSnapshot) -> Dict[str, Any]:
+    return {
+        'id': str(todo.id.value),
+        'title': todo.title.value,
+        'description': todo.description.value if todo.description else '',
+        'status': todo.status.value,
+        'created_at': todo.created_at.value,
+        'updated_at': todo.updated_at.value,
+        'completed_at': todo.completed_at.value if todo.completed_at else None,
+        'version': todo.version,
+    }
@@ -0,0 +1,17 @@
+"""Expose the store used to deduplicate retried requests."""
+
+from __future__ import annotations
+
+from .idempotency_store import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInFlightError,
+    IdempotencyStore,
+    StoredResponse,
+)
+
+__all__ = (
+    'IdempotencyKeyConflictError',
+    'IdempotencyKeyInFlightError',
+    'IdempotencyStore',
+    'StoredResponse',
+)
@@ -0,0 +1,205 @@
+"""In-memory store of responses keyed by client-supplied idempotency keys."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    """Hold a serialized response for replay.
+
+    Attributes:
+        status_code: HTTP status code of the first response.
+        body: Serialized response body.
+        fingerprint: Digest of the request the response answered.
+    """
+
+    status_code: int
+    body: bytes
+    fingerprint: bytes
+
+
+class IdempotencyKeyConflictError(Exception):
+    """Raise when a key is reused for a request with a different payload."""
+
+    message = 'The Idempotency-Key was already used for a different request.'
+
+    def __str__(self):
+        """Return the default human-readable error message."""
+        return IdempotencyKeyConflictError.message
+
+
+class IdempotencyKeyInFlightError(Exception):
+    """Raise when a request with the same key is still being processed."""
+
+    message = 'A request with the same Idempotency-Key is still being processed.'
+
+    def __str__(self):
+        """Return the default human-readable error message."""
+        return IdempotencyKeyInFlightError.message
+
+
+class _Pending:
+    __slots__ = ('fingerprint', 'done')
+
+    def __init__(self, fingerprint: bytes):
+        self.fingerprint = fingerprint
+        self.done = threading.Event()
+
+
+class IdempotencyStore:
+    """Remember the first response for each idempotency key for a while.
+
+    Completed responses are kept in insertion order, which is also expiry
+    order because every entry lives for the same TTL. That keeps both the
+    size bound (dropping the oldest entry) and expiry (popping expired
+    entries from the front) O(1) per entry. Requests reusing a key that is
+    still being processed wait for the first one to finish.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 24 * 60 * 60,
+        max_entries: int = 100_000,
+        wait_timeout_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Configure retention and waiting limits.
+
+        Args:
+            ttl_seconds: How long a stored response is replayed.
+            max_entries: Upper bound on stored responses; the oldest is
+                dropped first when it is reached.
+            wait_timeout_seconds: How long a duplicate waits for the request
+                holding its key before giving up.
+            clock: Monotonic time source in seconds.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._responses: OrderedDict[str, Tuple[float, StoredResponse]] = OrderedDict()
+        self._pending: Dict[str, _Pending] = {}
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def begin(self, key: str, fingerprint: bytes) -> Optional[StoredResponse]:
+        """Claim a key, or return the response already stored for it.
+
+        When ``None`` is returned the caller holds the key and must call
+        ``complete`` or ``release`` once it is done. A request holding the
+        same key makes this call wait until that request finishes.
+
+        Args:
+            key: Client-supplied idempotency key.
+            fingerprint: Digest of the request payload.
+
+        Returns:
+            Optional[StoredResponse]: Response to replay, or None if the
+            caller now holds the key.
+
+        Raises:
+            IdempotencyKeyConflictError: If the key belongs to another payload.
+            IdempotencyKeyInFlightError: If the request holding the key does
+                not finish in time.
+        """
+        deadline = self._clock() + self.wait_timeout_seconds
+        while True:
+            with self._lock:
+                stored = self._lookup(key)
+                if stored is not None:
+                    if stored.fingerprint != fingerprint:
+                        raise IdempotencyKeyConflictError
+                    return stored
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = _Pending(fingerprint)
+                    return None
+                if pending.fingerprint != fingerprint:
+                    raise IdempotencyKeyConflictError
+
+            remaining = deadline - self._clock()
+            if remaining <= 0 or not pending.done.wait(remaining):
+                raise IdempotencyKeyInFlightError
+
+    def complete(self, key: str, response: StoredResponse) -> None:
+        """Store the response for a claimed key and wake waiting duplicates.
+
+        Args:
+            key: Key previously claimed with ``begin``.
+            response: Response to replay for later requests with the key.
+        """
+        with self._lock:
+            self._responses[key] = (self._clock() + self.ttl_seconds, response)
+            while len(self._responses) > self.max_entries:
+                self._responses.popitem(last=False)
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.done.set()
+
+    def release(self, key: str) -> None:
+        """Give up a claimed key without storing a response.
+
+        A waiting duplicate then claims the key and runs the request itself.
+
+        Args:
+            key: Key previously claimed with ``begin``.
+        """
+        with self._lock:
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.done.set()
+
+    def evict_expired(self, batch_size: int = 1000) -> int:
+        """Drop up to ``batch_size`` expired responses.
+
+        Args:
+            batch_size: Most entries to drop while holding the lock.
+
+        Returns:
+            int: Number of entries dropped; less than ``batch_size`` means no
+            expired entries are left.
+        """
+        now = self._clock()
+        evicted = 0
+        with self._lock:
+            while evicted < batch_size and self._responses:
+                key, (expires_at, _) = next(iter(self._responses.items()))
+                if expires_at > now:
+                    break
+                del self._responses[key]
+                evicted += 1
+        return evicted
+
+    async def run_eviction(
+        self, interval_seconds: float = 60.0, batch_size: int = 1000
+    ) -> None:
+        """Periodically drop expired responses until cancelled.
+
+        Expired entries are dropped in batches, yielding to the event loop
+        between batches so request handling is never blocked for long.
+
+        Args:
+            interval_seconds: Pause between eviction passes.
+            batch_size: Most entries to drop per batch.
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            while self.evict_expired(batch_size) == batch_size:
+                await asyncio.sleep(0)
+
+    def _lookup(self, key: str) -> Optional[StoredResponse]:
+        entry = self._responses.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= self._clock():
+            del self._responses[key]
+            return None
+        return response
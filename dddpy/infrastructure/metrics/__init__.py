@@ -0,0 +1,30 @@
+"""Expose the in-process metrics registry and its instrumentation."""
+
+from __future__ import annotations
+
+from .instrumentation import instrument_engine_pool, time_methods
+from .registry import (
+    LATENCY_BUCKETS,
+    CallbackGauge,
+    Counter,
+    CounterChild,
+    Gauge,
+    GaugeChild,
+    Histogram,
+    HistogramChild,
+    MetricsRegistry,
+)
+
+__all__ = (
+    'LATENCY_BUCKETS',
+    'CallbackGauge',
+    'Counter',
+    'CounterChild',
+    'Gauge',
+    'GaugeChild',
+    'Histogram',
+    'HistogramChild',
+    'MetricsRegistry',
+    'instrument_engine_pool',
+    'time_methods',
+)
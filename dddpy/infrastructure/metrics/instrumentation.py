@@ -0,0 +1,108 @@
+"""Attach timing and pool metrics to application classes and the engine."""
+
+import functools
+import time
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from dddpy.infrastructure.metrics.registry import Histogram, MetricsRegistry
+
+
+def time_methods(cls: type, method_names: Iterable[str], histogram: Histogram) -> None:
+    """Record the duration of every call to the named methods of a class.
+
+    The methods are replaced in place once, when the application is wired,
+    so instances created afterwards need no extra dependency. Each method
+    observes into the child labelled with the class and method names;
+    calls that raise are timed as well.
+
+    Args:
+        cls: Class whose methods are wrapped.
+        method_names: Names of the methods to time.
+        histogram: Family labelled by class and method, in that order.
+    """
+    for name in method_names:
+        method = getattr(cls, name)
+        if getattr(method, '__timed__', False):
+            continue
+        setattr(cls, name, _timed(method, histogram.labels(cls.__name__, name)))
+
+
+def _timed(method: Callable[..., Any], child: Any) -> Callable[..., Any]:
+    observe = child.observe
+    perf_counter = time.perf_counter
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            observe(perf_counter() - started)
+
+    wrapper.__timed__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def instrument_engine_pool(engine: Engine, registry: MetricsRegistry) -> None:
+    """Count and time connection checkouts from the engine's pool.
+
+    The wait for a connection is measured around the pool's ``connect``,
+    so it includes time spent blocked on an exhausted pool; the pool that
+    replaces it when the engine is disposed is measured as well. Pool occupancy
+    is read from the pool itself at each scrape.
+
+    Args:
+        engine: Engine whose pool is observed.
+        registry: Registry receiving the pool metrics.
+    """
+    checkouts = registry.counter(
+        'db_pool_checkouts_total', 'Connections checked out of the pool.'
+    ).labels()
+    wait = registry.histogram(
+        'db_pool_checkout_wait_seconds', 'Time spent waiting for a pooled connection.'
+    ).labels()
+
+    @event.listens_for(engine, 'checkout')
+    def _count_checkout(*_: Any) -> None:
+        checkouts.inc()
+
+    perf_counter = time.perf_counter
+
+    def time_connect(pool: Any) -> None:
+        connect = pool.connect
+
+        def timed_connect() -> Any:
+            started = perf_counter()
+            try:
+                return connect()
+            finally:
+                wait.observe(perf_counter() - started)
+
+        pool.connect = timed_connect
+
+    time_connect(engine.pool)
+
+    @event.listens_for(engine, 'engine_disposed')
+    def _time_new_pool(*_: Any) -> None:
+        # Disposing the engine replaces its pool with a fresh one.
+        time_connect(engine.pool)
+
+    def occupancy() -> Dict[Tuple[str, ...], float]:
+        # Only queue-based pools report their occupancy.
+        current = engine.pool
+        values: Dict[Tuple[str, ...], float] = {}
+        for state in ('size', 'checkedout', 'checkedin', 'overflow'):
+            read = getattr(current, state, None)
+            if read is not None:
+                values[(state,)] = float(read())
+        return values
+
+    registry.callback_gauge(
+        'db_pool_connections',
+        'Connections of the pool by state.',
+        ('state',),
+        occupancy,
+    )
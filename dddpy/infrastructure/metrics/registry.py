@@ -0,0 +1,350 @@
+"""Counters, gauges and histograms rendered in the Prometheus text format."""
+
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Generic, List, Sequence, Tuple, TypeVar, cast
+
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+C = TypeVar('C')
+
+
+class _ThreadToken:
+    """Live in a thread's local storage, so it is collected when the thread ends."""
+
+    __slots__ = ('__weakref__',)
+
+
+class _Shards:
+    """Hold one list of values per thread, summed when collected.
+
+    Each thread only writes its own list, so updates need no lock and are
+    never lost; the lock is only taken the first time a thread writes. When
+    a thread ends, its list is folded into a base total and dropped, so
+    short-lived threads do not accumulate lists.
+    """
+
+    __slots__ = ('_base', '_local', '_lists', '_lock', '_width')
+
+    def __init__(self, width: int):
+        self._base = [0.0] * width
+        self._local = threading.local()
+        self._lists: Dict[int, List[float]] = {}
+        self._lock = threading.Lock()
+        self._width = width
+
+    def mine(self) -> List[float]:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = [0.0] * self._width
+            with self._lock:
+                self._lists[id(values)] = values
+            token = _ThreadToken()
+            weakref.finalize(token, self._retire, values)
+            self._local.token = token
+            self._local.values = values
+            return values
+
+    def total(self) -> List[float]:
+        with self._lock:
+            lists = [self._base, *self._lists.values()]
+        return [sum(column) for column in zip(*lists, strict=True)]
+
+    def _retire(self, values: List[float]) -> None:
+        with self._lock:
+            del self._lists[id(values)]
+            self._base = [
+                base + value for base, value in zip(self._base, values, strict=True)
+            ]
+
+
+class CounterChild:
+    """Count events for one set of label values."""
+
+    __slots__ = ('_shards',)
+
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add ``amount`` to the counter."""
+        self._shards.mine()[0] += amount
+
+    def value(self) -> float:
+        """Return the current total."""
+        return self._shards.total()[0]
+
+
+class GaugeChild(CounterChild):
+    """Track a value that goes up and down for one set of label values."""
+
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Subtract ``amount`` from the gauge."""
+        self._shards.mine()[0] -= amount
+
+
+class HistogramChild:
+    """Record the distribution of observations for one set of label values."""
+
+    __slots__ = ('_bounds', '_shards')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        self._shards = _Shards(len(bounds) + 3)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        values = self._shards.mine()
+        values[bisect_left(self._bounds, value)] += 1
+        values[-2] += value
+        values[-1] += 1
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """Return the per-bucket counts, the sum and the count."""
+        values = self._shards.total()
+        return values[:-2], values[-2], values[-1]
+
+
+class _Metric(ABC):
+    kind = ''
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def samples(self) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        """Return the name, labels and value of every sample to render."""
+
+    def _label_pairs(self, values: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(zip(self.labelnames, values, strict=True))
+
+
+class _Family(_Metric, Generic[C]):
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._children: Dict[Tuple[str, ...], C] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> C:
+        """Return the child for the given label values, creating it once.
+
+        Args:
+            *values: One value per label name, in order.
+
+        Returns:
+            The child recording values for these labels.
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f'{self.name} expects labels {self.labelnames}')
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> C:
+        """Return a new child for one set of label values."""
+
+
+class Counter(_Family[CounterChild]):
+    """Monotonic counter family."""
+
+    kind = 'counter'
+
+    def samples(self) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        return [
+            (self.name, self._label_pairs(values), child.value())
+            for values, child in list(self._children.items())
+        ]
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+
+class Gauge(_Family[GaugeChild]):
+    """Gauge family updated by increments and decrements."""
+
+    kind = 'gauge'
+
+    def samples(self) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        return [
+            (self.name, self._label_pairs(values), child.value())
+            for values, child in list(self._children.items())
+        ]
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+
+class CallbackGauge(_Metric):
+    """Gauge family whose values are read from a callback at collection time."""
+
+    kind = 'gauge'
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[Tuple[str, ...], float]],
+    ):
+        super().__init__(name, help, labelnames)
+        self.callback = callback
+
+    def samples(self) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        return [
+            (self.name, self._label_pairs(values), value)
+            for values, value in self.callback().items()
+        ]
+
+
+class Histogram(_Family[HistogramChild]):
+    """Histogram family with fixed bucket bounds."""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def samples(self) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        samples = []
+        for values, child in list(self._children.items()):
+            labels = self._label_pairs(values)
+            counts, total, count = child.snapshot()
+            cumulative = 0.0
+            for bound, bucket in zip(
+                self.buckets + (float('inf'),), counts, strict=True
+            ):
+                cumulative += bucket
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                samples.append(
+                    (f'{self.name}_bucket', labels + (('le', le),), cumulative)
+                )
+            samples.append((f'{self.name}_sum', labels, total))
+            samples.append((f'{self.name}_count', labels, count))
+        return samples
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+
+M = TypeVar('M', bound=_Metric)
+
+
+class MetricsRegistry:
+    """Hold metric families and render them for a scrape.
+
+    Families are looked up by name, so asking twice for the same metric
+    returns the same family.
+    """
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Return the counter family with the name, creating it once."""
+        return self._get_or_add(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Return the gauge family with the name, creating it once."""
+        return self._get_or_add(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram family with the name, creating it once."""
+        return self._get_or_add(Histogram(name, help, labelnames, buckets))
+
+    def callback_gauge(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[Tuple[str, ...], float]],
+    ) -> CallbackGauge:
+        """Register a gauge family read from ``callback`` at each scrape.
+
+        Args:
+            name: Metric name.
+            help: Description shown in the exposition.
+            labelnames: Names of the labels keyed in the callback result.
+            callback: Returns the current value for each set of label values.
+
+        Returns:
+            CallbackGauge: The registered family.
+        """
+        return self._get_or_add(CallbackGauge(name, help, labelnames, callback))
+
+    def render(self) -> str:
+        """Render every family in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, labels, value in metric.samples():
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def _get_or_add(self, metric: M) -> M:
+        with self._lock:
+            existing = self._metrics.setdefault(metric.name, metric)
+        if type(existing) is not type(metric):
+            raise ValueError(
+                f'{metric.name} is already registered as a {existing.kind}'
+            )
+        return cast(M, existing)
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return '{' + pairs + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
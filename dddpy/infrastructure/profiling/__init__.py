@@ -0,0 +1,8 @@
+"""Expose on-demand profiling of individual requests."""
+
+from __future__ import annotations
+
+from .profile_store import ProfileStore, StoredProfile
+from .request_profiler import ProfileFormat, RequestProfiler
+
+__all__ = ('ProfileFormat', 'ProfileStore', 'RequestProfiler', 'StoredProfile')
@@ -0,0 +1,94 @@
+"""Keep the most recent request profiles in memory."""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+from dddpy.infrastructure.profiling.request_profiler import ProfileFormat
+
+
+@dataclass(frozen=True)
+class StoredProfile:
+    """Profile of one request.
+
+    Attributes:
+        id: Identifier under which the profile is served.
+        created_at: Unix time at which the profile was stored.
+        method: HTTP method of the request.
+        path: Path of the request.
+        profile_format: Format of ``data``.
+        duration_ms: Time spent under the profiler.
+        data: Collapsed stacks or a marshalled pstats dump.
+    """
+
+    id: str
+    created_at: float
+    method: str
+    path: str
+    profile_format: ProfileFormat
+    duration_ms: float
+    data: bytes
+
+
+class ProfileStore:
+    """Bounded store of request profiles; the oldest are dropped first."""
+
+    def __init__(self, capacity: int = 32):
+        """Configure the store size.
+
+        Args:
+            capacity: Most profiles kept.
+        """
+        self.capacity = capacity
+        self._profiles: 'OrderedDict[str, StoredProfile]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        profile_format: ProfileFormat,
+        duration_ms: float,
+        data: bytes,
+    ) -> StoredProfile:
+        """Store a profile under a new identifier.
+
+        Args:
+            method: HTTP method of the request.
+            path: Path of the request.
+            profile_format: Format of ``data``.
+            duration_ms: Time spent under the profiler.
+            data: Rendered profile.
+
+        Returns:
+            StoredProfile: The stored profile.
+        """
+        profile = StoredProfile(
+            uuid.uuid4().hex,
+            time.time(),
+            method,
+            path,
+            profile_format,
+            duration_ms,
+            data,
+        )
+        with self._lock:
+            self._profiles[profile.id] = profile
+            while len(self._profiles) > self.capacity:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def get(self, profile_id: str) -> Optional[StoredProfile]:
+        """Return the profile with the identifier, if still stored."""
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[StoredProfile]:
+        """Return the stored profiles, most recent first."""
+        with self._lock:
+            profiles = list(self._profiles.values())
+        profiles.reverse()
+        return profiles
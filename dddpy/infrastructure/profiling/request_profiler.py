@@ -0,0 +1,166 @@
+"""Profile one request with a sampling or a deterministic profiler."""
+
+import cProfile
+import marshal
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from enum import Enum
+from types import FrameType
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class ProfileFormat(Enum):
+    """Enumerate the profiles a request can ask for."""
+
+    COLLAPSED = 'collapsed'
+    PSTATS = 'pstats'
+
+
+class _Sampler:
+    """Count the stacks of one thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval_seconds: float):
+        self.thread_id = thread_id
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._sample, name='request-profiler', daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+
+
+def _collapse(frame: Optional[FrameType]) -> str:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get('__name__', '?')
+        names.append(f'{module}:{code.co_qualname}')
+        frame = frame.f_back
+    names.reverse()
+    return ';'.join(names)
+
+
+class RequestProfiler:
+    """Profile the calls made on behalf of one request.
+
+    The collapsed format samples the calling thread's stack every
+    ``interval_seconds`` and renders one ``frame;frame;frame count`` line
+    per distinct stack, the input of flame graph tools. The pstats format
+    runs ``cProfile`` and renders a dump readable with ``pstats.Stats``.
+    """
+
+    def __init__(
+        self,
+        profile_format: ProfileFormat = ProfileFormat.COLLAPSED,
+        interval_seconds: float = 0.001,
+    ):
+        """Configure the profiler.
+
+        Args:
+            profile_format: Kind of profile to record.
+            interval_seconds: Pause between samples of the collapsed format.
+        """
+        self.profile_format = profile_format
+        self.interval_seconds = interval_seconds
+        self.samples = 0
+        self.seconds = 0.0
+        self._stacks: Counter[str] = Counter()
+        self._stats: Optional[pstats.Stats] = None
+
+    def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``function`` in this thread under the profiler.
+
+        Args:
+            function: Callable to profile.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            The result of the call.
+        """
+        started = time.perf_counter()
+        if self.profile_format == ProfileFormat.PSTATS:
+            profile = cProfile.Profile()
+            try:
+                return profile.runcall(function, *args, **kwargs)
+            finally:
+                self._add_stats(profile, started)
+        sampler = _Sampler(threading.get_ident(), self.interval_seconds)
+        sampler.start()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            sampler.stop()
+            self._add_stacks(sampler, started)
+
+    async def run_async(
+        self, function: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Await ``function`` under the profiler.
+
+        Other tasks running on the event loop meanwhile are profiled too.
+
+        Args:
+            function: Coroutine function to profile.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            The result of the call.
+        """
+        started = time.perf_counter()
+        if self.profile_format == ProfileFormat.PSTATS:
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                profile.disable()
+                self._add_stats(profile, started)
+        sampler = _Sampler(threading.get_ident(), self.interval_seconds)
+        sampler.start()
+        try:
+            return await function(*args, **kwargs)
+        finally:
+            sampler.stop()
+            self._add_stacks(sampler, started)
+
+    def render(self) -> bytes:
+        """Return the recorded profile in the requested format."""
+        if self.profile_format == ProfileFormat.PSTATS:
+            if self._stats is None:
+                return marshal.dumps({})
+            return marshal.dumps(self._stats.stats)  # type: ignore[attr-defined]
+        return ''.join(
+            f'{stack} {count}\n' for stack, count in self._stacks.most_common()
+        ).encode()
+
+    def _add_stats(self, profile: cProfile.Profile, started: float) -> None:
+        self.seconds += time.perf_counter() - started
+        if self._stats is None:
+            self._stats = pstats.Stats(profile)
+        else:
+            self._stats.add(profile)
+
+    def _add_stacks(self, sampler: _Sampler, started: float) -> None:
+        self.seconds += time.perf_counter() - started
+        self._stacks.update(sampler.stacks)
+        self.samples += sum(sampler.stacks.values())
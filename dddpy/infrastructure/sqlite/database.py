@@ -1,9 +1,12 @@
 """Database configuration and session management for SQLite."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from dddpy.infrastructure.sqlite.slow_query_log import SlowQueryLog
+
 SQLALCHEMY_DATABASE_URL = 'sqlite:///./db/sqlite.db'
 
 engine = create_engine(
@@ -21,7 +24,47 @@ SessionLocal = sessionmaker(
 
 Base = declarative_base()
 
+# Columns added to existing tables after their first release, as
+# (table, column, SQLite column definition). ``create_all`` only creates
+# missing tables, so databases created before a column was added get it
+# from ``create_tables``. Existing todos are stored ones, so they start at
+# version 1; version 0 means a todo that was never saved.
+ADDED_COLUMNS = (('todo', 'version', 'INTEGER NOT NULL DEFAULT 1'),)
+
+
+def create_tables(bind: Engine = engine):
+    """Create all database tables and add columns missing from older databases.
+
+    Args:
+        bind: Engine of the database to set up.
+    """
+    Base.metadata.create_all(bind=bind)
+    with bind.begin() as connection:
+        inspector = inspect(connection)
+        for table, column, definition in ADDED_COLUMNS:
+            existing = {info['name'] for info in inspector.get_columns(table)}
+            if column not in existing:
+                connection.execute(
+                    text(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+                )
+
+
+def enable_slow_query_log(
+    threshold_ms: float = 100.0, redact_parameters: bool = True
+) -> SlowQueryLog:
+    """Start logging the application's statements slower than a threshold.
+
+    Args:
+        threshold_ms: Duration from which a statement is logged.
+        redact_parameters: Whether to hide the statement parameters.
 
-def create_tables():
-    """Create all database tables defined in SQLAlchemy models."""
-    Base.metadata.create_all(bind=engine)
+    Returns:
+        SlowQueryLog: Installed log; call ``remove`` to stop it.
+    """
+    slow_query_log = SlowQueryLog(
+        engine,
+        threshold_seconds=threshold_ms / 1000,
+        redact_parameters=redact_parameters,
+    )
+    slow_query_log.install()
+    return slow_query_log
@@ -0,0 +1,186 @@
+"""Log slow SQL statements with their query plans, off the request path."""
+
+import logging
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from types import FrameType
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SLOW_QUERY_LOGGER = 'dddpy.slow_query'
+
+
+class _QueryPlanHandler(logging.Handler):
+    """Add the cached query plan to slow-query records, then forward them."""
+
+    def __init__(
+        self, engine: Engine, handlers: Sequence[logging.Handler], cache_size: int
+    ):
+        super().__init__()
+        self.engine = engine
+        self.handlers = list(handlers)
+        self.cache_size = cache_size
+        self._plans: 'OrderedDict[str, str]' = OrderedDict()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        statement = getattr(record, 'statement', None)
+        if statement is not None:
+            plan = self._plan(statement, getattr(record, 'parameters', None))
+            record.msg = f'{record.msg}\n{plan}'
+            record.parameters = None
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _plan(self, statement: str, parameters: Any) -> str:
+        plan = self._plans.get(statement)
+        if plan is not None:
+            self._plans.move_to_end(statement)
+            return plan
+        if isinstance(parameters, list):
+            parameters = parameters[0] if parameters else None
+        try:
+            with self.engine.connect() as connection:
+                rows = connection.exec_driver_sql(
+                    f'EXPLAIN QUERY PLAN {statement}', parameters or ()
+                ).all()
+            plan = '\n'.join(f'  {row[-1]}' for row in rows) or '  (no plan)'
+        except Exception as e:
+            plan = f'  (plan unavailable: {e})'
+        self._plans[statement] = plan
+        if len(self._plans) > self.cache_size:
+            self._plans.popitem(last=False)
+        return plan
+
+
+class SlowQueryLog:
+    """Log statements slower than a threshold with their query plan.
+
+    The request thread only measures each statement; a slow one becomes a
+    log record handed to a ``QueueHandler``, so neither the query plan nor
+    the output handlers ever delay the request. A listener thread runs
+    ``EXPLAIN QUERY PLAN`` the first time it sees a statement, keeps the
+    plan in a bounded cache and writes the record to the handlers.
+
+    Each record names the first calling function in ``caller_package``,
+    typically the repository method that issued the statement.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        threshold_seconds: float = 0.1,
+        redact_parameters: bool = True,
+        handlers: Optional[Sequence[logging.Handler]] = None,
+        caller_package: str = 'dddpy.infrastructure.sqlite.todo',
+        plan_cache_size: int = 1024,
+    ):
+        """Configure the log; nothing is recorded until it is installed.
+
+        Args:
+            engine: Engine whose statements are observed.
+            threshold_seconds: Duration from which a statement is logged.
+            redact_parameters: Whether to log parameter counts instead of values.
+            handlers: Handlers writing the records; defaults to the root
+                logger's handlers at install time.
+            caller_package: Module prefix of the callers to report.
+            plan_cache_size: Most query plans kept.
+        """
+        self.engine = engine
+        self.threshold_seconds = threshold_seconds
+        self.redact_parameters = redact_parameters
+        self.caller_package = caller_package
+        self.plan_cache_size = plan_cache_size
+        self._handlers = handlers
+        self._queue: 'queue.SimpleQueue[logging.LogRecord]' = queue.SimpleQueue()
+        self._logger = logging.getLogger(SLOW_QUERY_LOGGER)
+        self._queue_handler = QueueHandler(self._queue)
+        self._listener: Optional[QueueListener] = None
+        self._lock = threading.Lock()
+
+    def install(self) -> None:
+        """Start observing the engine and writing records."""
+        with self._lock:
+            if self._listener is not None:
+                return
+            handlers = self._handlers
+            if handlers is None:
+                handlers = logging.getLogger().handlers
+            self._listener = QueueListener(
+                self._queue,
+                _QueryPlanHandler(self.engine, handlers, self.plan_cache_size),
+            )
+            self._listener.start()
+            self._logger.addHandler(self._queue_handler)
+            self._logger.setLevel(logging.WARNING)
+            self._logger.propagate = False
+            event.listen(self.engine, 'before_cursor_execute', self._start)
+            event.listen(self.engine, 'after_cursor_execute', self._finish)
+            event.listen(self.engine, 'handle_error', self._discard)
+
+    def remove(self) -> None:
+        """Stop observing the engine and write the records still queued."""
+        with self._lock:
+            listener, self._listener = self._listener, None
+            if listener is None:
+                return
+            event.remove(self.engine, 'before_cursor_execute', self._start)
+            event.remove(self.engine, 'after_cursor_execute', self._finish)
+            event.remove(self.engine, 'handle_error', self._discard)
+            self._logger.removeHandler(self._queue_handler)
+            listener.stop()
+
+    def _start(self, conn: Any, *_: Any) -> None:
+        conn.info.setdefault('slow_query_started', []).append(time.perf_counter())
+
+    def _finish(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        started = conn.info.get('slow_query_started')
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        if elapsed < self.threshold_seconds or statement.startswith('EXPLAIN'):
+            return
+        self._logger.warning(
+            'Slow query %.1f ms in %s: %s; parameters: %s',
+            elapsed * 1000,
+            self._caller(),
+            statement,
+            self._describe(parameters),
+            extra={'statement': statement, 'parameters': parameters},
+        )
+
+    def _discard(self, context: Any) -> None:
+        if context.connection is not None:
+            started = context.connection.info.get('slow_query_started')
+            if started:
+                started.pop()
+
+    def _caller(self) -> str:
+        frame: Optional[FrameType] = sys._getframe(1)
+        while frame is not None:
+            module = frame.f_globals.get('__name__', '')
+            if module.startswith(self.caller_package):
+                return f'{module}.{frame.f_code.co_qualname}'
+            frame = frame.f_back
+        return 'unknown caller'
+
+    def _describe(self, parameters: Any) -> str:
+        if not self.redact_parameters:
+            return repr(parameters)
+        if isinstance(parameters, list):
+            return f'<redacted: {len(parameters)} rows>'
+        return f'<redacted: {len(parameters or ())} values>'
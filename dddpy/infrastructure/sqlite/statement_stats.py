@@ -0,0 +1,109 @@
+"""Count and time the SQL statements executed within a scope."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class StatementStats:
+    """Statements executed within one tracked scope, such as a request."""
+
+    __slots__ = ('count', 'seconds', '_by_text')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self._by_text: Dict[str, int] = {}
+
+    def add(self, statement: str, seconds: float) -> None:
+        """Record one executed statement.
+
+        Args:
+            statement: SQL text sent to the driver.
+            seconds: Time the driver took to execute it.
+        """
+        self.count += 1
+        self.seconds += seconds
+        self._by_text[statement] = self._by_text.get(statement, 0) + 1
+
+    def repeated(self, min_count: int) -> Dict[str, int]:
+        """Return the statements executed at least ``min_count`` times.
+
+        The same statement run again and again with different parameters
+        usually means rows are loaded one by one where a single query
+        would do.
+
+        Args:
+            min_count: Executions from which a statement is reported.
+
+        Returns:
+            Dict[str, int]: Execution count by SQL text.
+        """
+        return {
+            statement: count
+            for statement, count in self._by_text.items()
+            if count >= min_count
+        }
+
+
+_current: ContextVar[Optional[StatementStats]] = ContextVar(
+    'statement_stats', default=None
+)
+
+
+@contextmanager
+def track_statements() -> Iterator[StatementStats]:
+    """Record the statements executed in the current context.
+
+    Work started from the block, including threads that copy the context,
+    is recorded as well.
+
+    Yields:
+        StatementStats: Statistics filled in as statements run.
+    """
+    stats = StatementStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def current_statement_stats() -> Optional[StatementStats]:
+    """Return the statistics of the enclosing tracked scope, if any."""
+    return _current.get()
+
+
+def instrument_statement_stats(engine: Engine) -> None:
+    """Report the engine's statements to the enclosing tracked scope.
+
+    Statements executed outside ``track_statements`` only cost a context
+    variable lookup.
+
+    Args:
+        engine: Engine whose statements are recorded.
+    """
+    perf_counter = time.perf_counter
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _start(conn: Any, *_: Any) -> None:
+        if _current.get() is not None:
+            conn.info.setdefault('statement_started', []).append(perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _finish(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+        stats = _current.get()
+        started = conn.info.get('statement_started')
+        if stats is not None and started:
+            stats.add(statement, perf_counter() - started.pop())
+
+    @event.listens_for(engine, 'handle_error')
+    def _discard(context: Any) -> None:
+        if context.connection is not None:
+            started = context.connection.info.get('statement_started')
+            if started:
+                started.pop()
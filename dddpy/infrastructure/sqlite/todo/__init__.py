@@ -3,6 +3,29 @@
 from __future__ import annotations
 
 from .todo_dto import TodoDTO
+from .todo_id_bloom_filter import TodoIdBloomFilter, TodoIdBloomFilterStats
+from .todo_outbox_dto import TodoOutboxCursorDTO, TodoOutboxDTO
+from .todo_outbox_relay import (
+    TodoOutboxHandler,
+    TodoOutboxMessage,
+    TodoOutboxRelay,
+    TodoOutboxRelayStats,
+    log_todo_outbox_messages,
+)
 from .todo_repository import TodoRepositoryImpl
+from .todo_unit_of_work import TodoUnitOfWorkImpl
 
-__all__ = ('TodoDTO', 'TodoRepositoryImpl')
+__all__ = (
+    'TodoDTO',
+    'TodoIdBloomFilter',
+    'TodoIdBloomFilterStats',
+    'TodoOutboxCursorDTO',
+    'TodoOutboxDTO',
+    'TodoOutboxHandler',
+    'TodoOutboxMessage',
+    'TodoOutboxRelay',
+    'TodoOutboxRelayStats',
+    'TodoRepositoryImpl',
+    'TodoUnitOfWorkImpl',
+    'log_todo_outbox_messages',
+)
@@ -1,6 +1,5 @@
 """Map todo entities to and from SQLite persistence models."""
 
-from datetime import datetime, timezone
 from uuid import UUID
 
 from sqlalchemy import String
@@ -11,6 +10,7 @@ from dddpy.domain.todo.value_objects import (
     TodoDescription,
     TodoId,
     TodoStatus,
+    TodoTimestamp,
     TodoTitle,
 )
 from dddpy.infrastructure.sqlite.database import Base
@@ -27,6 +27,7 @@ class TodoDTO(Base):
     created_at: Mapped[int] = mapped_column(index=True, nullable=False)
     updated_at: Mapped[int] = mapped_column(index=True, nullable=False)
     completed_at: Mapped[int] = mapped_column(index=True, nullable=True)
+    version: Mapped[int] = mapped_column(nullable=False)
 
     def to_entity(self) -> Todo:
         """Convert the DTO into a domain entity.
@@ -39,11 +40,10 @@ class TodoDTO(Base):
             TodoTitle(self.title),
             TodoDescription(self.description) if self.description else None,
             TodoStatus(self.status),
-            datetime.fromtimestamp(self.created_at / 1000, tz=timezone.utc),
-            datetime.fromtimestamp(self.updated_at / 1000, tz=timezone.utc),
-            datetime.fromtimestamp(self.completed_at / 1000, tz=timezone.utc)
-            if self.completed_at
-            else None,
+            TodoTimestamp(self.created_at),
+            TodoTimestamp(self.updated_at),
+            TodoTimestamp(self.completed_at) if self.completed_at is not None else None,
+            self.version,
         )
 
     @staticmethod
@@ -61,9 +61,8 @@ class TodoDTO(Base):
             title=todo.title.value,
             description=todo.description.value if todo.description else None,
             status=todo.status.value,
-            created_at=int(todo.created_at.timestamp() * 1000),
-            updated_at=int(todo.updated_at.timestamp() * 1000),
-            completed_at=int(todo.completed_at.timestamp() * 1000)
-            if todo.completed_at
-            else None,
+            created_at=todo.created_at.value,
+            updated_at=todo.updated_at.value,
+            completed_at=todo.completed_at.value if todo.completed_at else None,
+            version=todo.version,
         )
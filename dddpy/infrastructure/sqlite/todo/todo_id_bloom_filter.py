@@ -0,0 +1,262 @@
+"""Bloom filter of the todo identifiers stored in SQLite."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm.session import Session
+
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.infrastructure.sqlite.todo.todo_dto import TodoDTO
+
+_MASK_64 = (1 << 64) - 1
+
+
+@dataclass(frozen=True)
+class TodoIdBloomFilterStats:
+    """Snapshot of a todo id filter's counters.
+
+    Attributes:
+        lookups: Identifiers checked against the filter.
+        queries_avoided: Lookups answered as absent without a query.
+        false_positives: Lookups the filter let through that found no todo.
+        items: Identifiers added since the last rebuild, including its rows.
+        deletes: Todos deleted since the last rebuild; still in the filter.
+        capacity: Items the filter holds at its configured false-positive rate.
+        rebuilds: Completed rebuilds.
+    """
+
+    lookups: int
+    queries_avoided: int
+    false_positives: int
+    items: int
+    deletes: int
+    capacity: int
+    rebuilds: int
+
+
+class _Bits:
+    __slots__ = ('array', 'size', 'hashes', 'capacity')
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        self.capacity = capacity
+        self.size = max(
+            8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.array = bytearray((self.size + 7) // 8)
+
+    def positions(self, value: UUID) -> Iterable[int]:
+        # Identifiers are random UUIDs, so their halves serve as the two
+        # independent hashes of double hashing.
+        h1 = value.int & _MASK_64
+        h2 = (value.int >> 64) | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, value: UUID) -> None:
+        array = self.array
+        for position in self.positions(value):
+            array[position >> 3] |= 1 << (position & 7)
+
+    def contains(self, value: UUID) -> bool:
+        array = self.array
+        return all(
+            array[position >> 3] & (1 << (position & 7))
+            for position in self.positions(value)
+        )
+
+
+class TodoIdBloomFilter:
+    """Tell which todo identifiers are definitely not stored.
+
+    The filter is built by streaming every primary key from the todo table
+    and is kept current by adding identifiers as todos are staged, before
+    they can be committed. Deleted identifiers cannot be removed from a
+    Bloom filter; they, and growth beyond the sized capacity, are dropped by
+    the next rebuild. Until the first build completes every identifier is
+    reported as possibly present.
+
+    Identifiers staged shortly before a rebuild may commit after it has
+    taken its snapshot, so additions from the last ``journal_seconds`` are
+    replayed into the rebuilt filter.
+
+    The filter only knows about todos written through this process, so it
+    must not be used while other processes write to the same database.
+
+    Lookups take no lock: the bit array is replaced whole on rebuild, and
+    the lookup counters are statistics that may miss a few concurrent
+    increments.
+    """
+
+    def __init__(
+        self,
+        false_positive_rate: float = 0.01,
+        min_capacity: int = 1024,
+        headroom: float = 2.0,
+        journal_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Configure the filter's sizing.
+
+        Args:
+            false_positive_rate: Share of absent identifiers reported as
+                possibly present when the filter is at capacity.
+            min_capacity: Smallest number of identifiers the filter is sized for.
+            headroom: Capacity of a rebuilt filter relative to its row count.
+            journal_seconds: How long additions are remembered for replay into
+                a rebuilt filter; must exceed the longest transaction.
+            clock: Monotonic time source in seconds.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError('false_positive_rate must be between 0 and 1')
+        self.false_positive_rate = false_positive_rate
+        self.min_capacity = min_capacity
+        self.headroom = headroom
+        self.journal_seconds = journal_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._bits = _Bits(min_capacity, false_positive_rate)
+        self._ready = False
+        self._rebuilding = False
+        self._journal: Deque[Tuple[float, UUID]] = deque()
+        self._lookups = 0
+        self._queries_avoided = 0
+        self._false_positives = 0
+        self._items = 0
+        self._deletes = 0
+        self._rebuilds = 0
+
+    @property
+    def ready(self) -> bool:
+        """Return whether the filter has been built at least once."""
+        return self._ready
+
+    def might_contain(self, todo_id: TodoId) -> bool:
+        """Return whether a todo with the identifier may be stored.
+
+        Args:
+            todo_id: Identifier to check.
+
+        Returns:
+            bool: False only when no such todo is stored.
+        """
+        present = not self._ready or self._bits.contains(todo_id.value)
+        self._lookups += 1
+        if not present:
+            self._queries_avoided += 1
+        return present
+
+    def add(self, todo_id: TodoId) -> None:
+        """Record the identifier of a todo about to be stored.
+
+        Args:
+            todo_id: Identifier of the staged todo.
+        """
+        now = self._clock()
+        with self._lock:
+            self._bits.add(todo_id.value)
+            self._items += 1
+            self._journal.append((now, todo_id.value))
+            if not self._rebuilding:
+                while (
+                    self._journal and self._journal[0][0] < now - self.journal_seconds
+                ):
+                    self._journal.popleft()
+
+    def discard(self, todo_id: TodoId) -> None:
+        """Note that a todo was deleted; it leaves the filter on rebuild.
+
+        Args:
+            todo_id: Identifier of the deleted todo.
+        """
+        with self._lock:
+            self._deletes += 1
+
+    def record_false_positive(self) -> None:
+        """Count a lookup the filter let through that found no todo."""
+        with self._lock:
+            self._false_positives += 1
+
+    def rebuild(
+        self, session_factory: Callable[[], Session], chunk_size: int = 10_000
+    ) -> None:
+        """Rebuild the filter from the stored identifiers.
+
+        Identifiers are read in primary key order with one short query per
+        chunk, so neither memory use nor the time a read lock is held grows
+        with the table. The new filter replaces the current one once built.
+
+        Args:
+            session_factory: Factory of sessions bound to the todo database.
+            chunk_size: Identifiers read per query.
+        """
+        with self._lock:
+            self._rebuilding = True
+        try:
+            with session_factory() as session:
+                count = session.scalar(select(func.count()).select_from(TodoDTO))
+                bits = _Bits(
+                    max(self.min_capacity, math.ceil((count or 0) * self.headroom)),
+                    self.false_positive_rate,
+                )
+                items = 0
+                statement = select(TodoDTO.id).order_by(TodoDTO.id).limit(chunk_size)
+                chunk = session.execute(statement).scalars().all()
+                while chunk:
+                    for value in chunk:
+                        bits.add(value)
+                    items += len(chunk)
+                    if len(chunk) < chunk_size:
+                        break
+                    chunk = (
+                        session.execute(statement.where(TodoDTO.id > chunk[-1]))
+                        .scalars()
+                        .all()
+                    )
+            with self._lock:
+                for _, value in self._journal:
+                    bits.add(value)
+                self._bits = bits
+                self._items = items + len(self._journal)
+                self._deletes = 0
+                self._rebuilds += 1
+                self._ready = True
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    async def run_rebuild(
+        self,
+        session_factory: Callable[[], Session],
+        interval_seconds: float = 60 * 60,
+    ) -> None:
+        """Build the filter now and rebuild it periodically until cancelled.
+
+        Rebuilds run in a worker thread so request handling is not blocked.
+
+        Args:
+            session_factory: Factory of sessions bound to the todo database.
+            interval_seconds: Pause between rebuilds.
+        """
+        while True:
+            await asyncio.to_thread(self.rebuild, session_factory)
+            await asyncio.sleep(interval_seconds)
+
+    def stats(self) -> TodoIdBloomFilterStats:
+        """Return a snapshot of the filter's counters."""
+        with self._lock:
+            return TodoIdBloomFilterStats(
+                self._lookups,
+                self._queries_avoided,
+                self._false_positives,
+                self._items,
+                self._deletes,
+                self._bits.capacity,
+                self._rebuilds,
+            )
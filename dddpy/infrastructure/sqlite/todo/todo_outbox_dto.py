@@ -0,0 +1,30 @@
+"""Define the SQLite tables of the todo event outbox."""
+
+from uuid import UUID
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dddpy.infrastructure.sqlite.database import Base
+
+
+class TodoOutboxDTO(Base):
+    """Represent a todo event written in the transaction that caused it."""
+
+    __tablename__ = 'todo_outbox'
+    # Ids must never be reused once pruned, or new rows would fall behind
+    # the relay cursors and never be delivered.
+    __table_args__ = {'sqlite_autoincrement': True}
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    todo_id: Mapped[UUID] = mapped_column(nullable=False)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    payload: Mapped[str] = mapped_column(nullable=False)
+    created_at: Mapped[int] = mapped_column(nullable=False)
+
+
+class TodoOutboxCursorDTO(Base):
+    """Represent the last outbox row a relay has delivered."""
+
+    __tablename__ = 'todo_outbox_cursor'
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    position: Mapped[int] = mapped_column(nullable=False)
@@ -0,0 +1,255 @@
+"""Deliver the rows of the todo event outbox outside the request."""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm.session import Session
+
+from dddpy.infrastructure.sqlite.todo.todo_outbox_dto import (
+    TodoOutboxCursorDTO,
+    TodoOutboxDTO,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TodoOutboxMessage:
+    """Carry one outbox row to its handlers.
+
+    Attributes:
+        id: Position of the row in the outbox; increases in commit order.
+        todo_id: Identifier of the changed todo.
+        kind: Kind of change, as in ``TodoEventKind``.
+        payload: JSON payload of the event.
+        created_at: Time the row was written, in epoch milliseconds.
+    """
+
+    id: int
+    todo_id: UUID
+    kind: str
+    payload: str
+    created_at: int
+
+
+TodoOutboxHandler = Callable[[Sequence[TodoOutboxMessage]], None]
+
+
+@dataclass(frozen=True)
+class TodoOutboxRelayStats:
+    """Snapshot of a relay's counters.
+
+    Attributes:
+        delivered: Messages handed to every handler.
+        batches: Batches delivered.
+        failures: Batches a handler failed, to be retried.
+        pruned: Delivered rows deleted from the outbox.
+        cursor: Position of the last delivered row.
+        last_lag_ms: Age of the newest message of the last batch at delivery.
+        max_lag_ms: Largest age of a message at delivery.
+    """
+
+    delivered: int
+    batches: int
+    failures: int
+    pruned: int
+    cursor: int
+    last_lag_ms: int
+    max_lag_ms: int
+
+
+def log_todo_outbox_messages(messages: Sequence[TodoOutboxMessage]) -> None:
+    """Log relayed messages; a stand-in for an external consumer.
+
+    Args:
+        messages: Batch of messages in outbox order.
+    """
+    logger.debug('Relayed todo events %d..%d', messages[0].id, messages[-1].id)
+
+
+class TodoOutboxRelay:
+    """Drain the outbox in batches and hand the rows to handlers.
+
+    Rows are read in primary key order after a persisted cursor, which only
+    advances once every handler has accepted a batch. A batch a handler
+    fails is read again on the next poll, so delivery is at least once and
+    handlers must tolerate duplicates. Delivered rows are pruned once they
+    are older than the retention period.
+    """
+
+    CURSOR_NAME = 'relay'
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 500,
+        retention_seconds: float = 60 * 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Configure batch size and retention.
+
+        Args:
+            session_factory: Factory of sessions bound to the todo database.
+            batch_size: Most rows read and delivered at once.
+            retention_seconds: How long delivered rows are kept.
+            clock: Wall-clock time source in seconds.
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.retention_seconds = retention_seconds
+        self._clock = clock
+        self._handlers: List[TodoOutboxHandler] = []
+        self._lock = threading.Lock()
+        self._delivered = 0
+        self._batches = 0
+        self._failures = 0
+        self._pruned = 0
+        self._cursor = 0
+        self._last_lag_ms = 0
+        self._max_lag_ms = 0
+
+    def subscribe(self, handler: TodoOutboxHandler) -> None:
+        """Register a handler called with each batch of messages.
+
+        Args:
+            handler: Callable receiving a batch of messages in outbox order.
+        """
+        self._handlers = self._handlers + [handler]
+
+    def relay_once(self) -> int:
+        """Deliver the next batch of rows after the cursor.
+
+        Returns:
+            int: Number of messages delivered; 0 when none are pending or a
+            handler failed.
+        """
+        with self.session_factory() as session:
+            cursor = self._load_cursor(session)
+            rows = session.execute(
+                select(
+                    TodoOutboxDTO.id,
+                    TodoOutboxDTO.todo_id,
+                    TodoOutboxDTO.kind,
+                    TodoOutboxDTO.payload,
+                    TodoOutboxDTO.created_at,
+                )
+                .where(TodoOutboxDTO.id > cursor)
+                .order_by(TodoOutboxDTO.id)
+                .limit(self.batch_size)
+            ).tuples()
+            messages = [TodoOutboxMessage(*row) for row in rows]
+            if not messages:
+                return 0
+
+            for handler in self._handlers:
+                try:
+                    handler(messages)
+                except Exception:
+                    logger.exception('Todo outbox handler %r failed', handler)
+                    with self._lock:
+                        self._failures += 1
+                    return 0
+
+            position = messages[-1].id
+            session.execute(
+                insert(TodoOutboxCursorDTO)
+                .values(name=self.CURSOR_NAME, position=position)
+                .on_conflict_do_update(
+                    index_elements=[TodoOutboxCursorDTO.name],
+                    set_={'position': position},
+                )
+            )
+            session.commit()
+
+        lag_ms = max(0, int(self._clock() * 1000) - messages[-1].created_at)
+        oldest_lag_ms = max(0, int(self._clock() * 1000) - messages[0].created_at)
+        with self._lock:
+            self._delivered += len(messages)
+            self._batches += 1
+            self._cursor = position
+            self._last_lag_ms = lag_ms
+            self._max_lag_ms = max(self._max_lag_ms, oldest_lag_ms)
+        return len(messages)
+
+    def prune(self) -> int:
+        """Delete delivered rows older than the retention period.
+
+        Returns:
+            int: Number of rows deleted.
+        """
+        cutoff = int((self._clock() - self.retention_seconds) * 1000)
+        with self.session_factory() as session:
+            cursor = self._load_cursor(session)
+            if not cursor:
+                return 0
+            result = session.execute(
+                delete(TodoOutboxDTO).where(
+                    TodoOutboxDTO.id <= cursor, TodoOutboxDTO.created_at < cutoff
+                )
+            )
+            session.commit()
+        with self._lock:
+            self._pruned += result.rowcount
+        return result.rowcount
+
+    def pending(self) -> int:
+        """Return the number of rows written but not yet delivered."""
+        with self.session_factory() as session:
+            cursor = self._load_cursor(session)
+            return (
+                session.scalar(
+                    select(func.count())
+                    .select_from(TodoOutboxDTO)
+                    .where(TodoOutboxDTO.id > cursor)
+                )
+                or 0
+            )
+
+    async def run(
+        self, poll_interval_seconds: float = 1.0, prune_interval_seconds: float = 60.0
+    ) -> None:
+        """Relay batches and prune delivered rows until cancelled.
+
+        Full batches are relayed back to back; otherwise the relay waits for
+        the poll interval. Database work runs in a worker thread.
+
+        Args:
+            poll_interval_seconds: Pause after draining the outbox.
+            prune_interval_seconds: Pause between pruning passes.
+        """
+        next_prune = self._clock() + prune_interval_seconds
+        while True:
+            delivered = await asyncio.to_thread(self.relay_once)
+            if self._clock() >= next_prune:
+                await asyncio.to_thread(self.prune)
+                next_prune = self._clock() + prune_interval_seconds
+            if delivered < self.batch_size:
+                await asyncio.sleep(poll_interval_seconds)
+
+    def _load_cursor(self, session: Session) -> int:
+        position = session.scalar(
+            select(TodoOutboxCursorDTO.position).where(
+                TodoOutboxCursorDTO.name == self.CURSOR_NAME
+            )
+        )
+        return position or 0
+
+    def stats(self) -> TodoOutboxRelayStats:
+        """Return a snapshot of the relay's counters."""
+        with self._lock:
+            return TodoOutboxRelayStats(
+                self._delivered,
+                self._batches,
+                self._failures,
+                self._pruned,
+                self._cursor,
+                self._last_lag_ms,
+                self._max_lag_ms,
+            )
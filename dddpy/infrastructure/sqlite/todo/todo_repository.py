@@ -1,43 +1,103 @@
 """SQLite implementation of Todo repository."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
 
-from sqlalchemy import desc
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy import Update, bindparam, delete, desc, select, update
 from sqlalchemy.orm.session import Session
 
-from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.clocks import Clock, SystemClock
+from dddpy.domain.todo.entities import Todo, TodoBatch
+from dddpy.domain.todo.events import TodoEvent
+from dddpy.domain.todo.exceptions import TodoVersionConflictError
 from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.domain.todo.value_objects import TodoId
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTimestamp
+from dddpy.infrastructure.events import encode_todo_event
 from dddpy.infrastructure.sqlite.todo import TodoDTO
+from dddpy.infrastructure.sqlite.todo.todo_id_bloom_filter import TodoIdBloomFilter
+from dddpy.infrastructure.sqlite.todo.todo_outbox_dto import TodoOutboxDTO
+
+_todo_table = TodoDTO.__table__
+
+_update_statements: Dict[Tuple[str, ...], Update] = {}
+
+
+def _update_by_version(fields: Tuple[str, ...]) -> Update:
+    """Return the compare-and-swap UPDATE that writes only ``fields``."""
+    statement = _update_statements.get(fields)
+    if statement is None:
+        statement = (
+            _todo_table.update()
+            .where(_todo_table.c.id == bindparam('_id', type_=_todo_table.c.id.type))
+            .where(_todo_table.c.version == bindparam('_version'))
+            .values({field: bindparam(field) for field in fields + ('version',)})
+        )
+        _update_statements[fields] = statement
+    return statement
 
 
 class TodoRepositoryImpl(TodoRepository):
-    """Persist todos using SQLAlchemy and a SQLite backend."""
+    """Persist todos using SQLAlchemy and a SQLite backend.
 
-    def __init__(self, session: Session):
-        """Store the SQLAlchemy session dependency.
+    The repository keeps an identity map of the todos it has loaded or been
+    given, so each todo is read at most once per session. ``save`` only stages
+    a todo; staged todos are written together by ``flush``.
+
+    Given a todo id filter, lookups of identifiers the filter knows to be
+    absent are answered without querying the database.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        todo_id_filter: Optional[TodoIdBloomFilter] = None,
+        clock: Optional[Clock] = None,
+    ):
+        """Store the SQLAlchemy session, todo id filter and clock dependencies.
 
         Args:
             session: Active SQLAlchemy session bound to the SQLite engine.
+            todo_id_filter: Filter of stored todo identifiers, if any.
+            clock: Clock timestamping outbox rows; the system clock by default.
         """
         self.session = session
+        self.todo_id_filter = todo_id_filter
+        self.clock = clock if clock is not None else SystemClock()
+        self._identity_map: Dict[UUID, Todo] = {}
+        self._new: Dict[UUID, Todo] = {}
+        self._dirty: Dict[UUID, Todo] = {}
+        self._events: List[TodoEvent] = []
+
+    @property
+    def identity_map_size(self) -> int:
+        """Return the number of todos tracked by this repository."""
+        return len(self._identity_map)
 
     def find_by_id(self, todo_id: TodoId) -> Optional[Todo]:
         """Return a todo matching the provided identifier.
 
+        Todos already loaded or staged in this session are returned without
+        querying the database.
+
         Args:
             todo_id: Identifier of the todo to fetch.
 
         Returns:
             Optional[Todo]: The matching todo when found; otherwise None.
         """
-        try:
-            row = self.session.query(TodoDTO).filter_by(id=todo_id.value).one()
-        except NoResultFound:
+        todo = self._identity_map.get(todo_id.value)
+        if todo is not None:
+            return todo
+        if not self._might_exist(todo_id):
             return None
 
-        return row.to_entity()
+        row = self.session.execute(
+            select(TodoDTO).where(TodoDTO.id == todo_id.value)
+        ).scalar_one_or_none()
+        if row is None:
+            self._missed()
+            return None
+        return self._track(row.to_entity())
 
     def find_all(self) -> List[Todo]:
         """Return todos ordered by creation date with an upper limit.
@@ -45,51 +105,321 @@ class TodoRepositoryImpl(TodoRepository):
         Returns:
             List[Todo]: Up to 20 todos sorted by newest first.
         """
-        rows = (
-            self.session.query(TodoDTO)
-            .order_by(desc(TodoDTO.created_at))
-            .limit(20)
-            .all()
+        self.flush()
+        rows = self.session.execute(
+            select(TodoDTO).order_by(desc(TodoDTO.created_at)).limit(20)
+        ).scalars()
+        return [
+            self._identity_map.get(todo_dto.id) or self._track(todo_dto.to_entity())
+            for todo_dto in rows
+        ]
+
+    def find_all_as_batch(self) -> TodoBatch:
+        """Return every todo as a columnar batch built straight from result rows.
+
+        Returns:
+            TodoBatch: All persisted todos.
+        """
+        self.flush()
+        rows = self.session.execute(
+            select(
+                TodoDTO.id,
+                TodoDTO.title,
+                TodoDTO.description,
+                TodoDTO.status,
+                TodoDTO.created_at,
+                TodoDTO.updated_at,
+                TodoDTO.completed_at,
+            )
         )
-        return [todo_dto.to_entity() for todo_dto in rows]
+        return TodoBatch.from_rows(rows.tuples())
 
     def save(self, todo: Todo) -> None:
-        """Persist new or updated todo data.
+        """Stage a new or changed todo to be written on the next flush.
 
         Args:
             todo: Todo entity to create or update.
         """
-        todo_dto = TodoDTO.from_entity(todo)
-        try:
-            existing_todo = (
-                self.session.query(TodoDTO).filter_by(id=todo.id.value).one()
+        self._track(todo)
+        if todo.version == 0:
+            if self.todo_id_filter is not None:
+                self.todo_id_filter.add(todo.id)
+            self._new[todo.id.value] = todo
+        else:
+            self._dirty[todo.id.value] = todo
+
+    def flush(self) -> None:
+        """Write all staged todos.
+
+        New todos are inserted with one batched INSERT. Changed todos are
+        written with a compare-and-swap UPDATE on the version each todo was
+        loaded with, so a concurrent write that landed first makes this one
+        fail instead of being silently overwritten. Each UPDATE sets only the
+        columns the todo reports as changed, batched per set of columns;
+        staged todos without changes are not written. The events recorded by
+        the written todos are kept for ``pull_events``.
+
+        Raises:
+            TodoVersionConflictError: If a stored todo no longer has the
+                version the entity was loaded with.
+        """
+        new, dirty = list(self._new.values()), list(self._dirty.values())
+        self._new.clear()
+        self._dirty.clear()
+
+        if new:
+            self.session.execute(
+                TodoDTO.__table__.insert(),
+                [self._insert_values(todo) for todo in new],
             )
-        except NoResultFound:
-            self.session.add(todo_dto)
+        dirty = [todo for todo in dirty if todo.changed_fields]
+        batches: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for todo in dirty:
+            fields = todo.changed_fields
+            batches.setdefault(fields, []).append(self._update_values(todo, fields))
+        for fields, values in batches.items():
+            result = self.session.execute(_update_by_version(fields), values)
+            if result.rowcount != len(values):
+                for todo in dirty:
+                    self._identity_map.pop(todo.id.value, None)
+                raise TodoVersionConflictError
 
-        else:
-            existing_todo.title = todo_dto.title
-            existing_todo.description = todo_dto.description
-            existing_todo.status = todo_dto.status
-            existing_todo.updated_at = todo_dto.updated_at
-            existing_todo.completed_at = todo_dto.completed_at
+        for todo in new + dirty:
+            todo.mark_persisted()
+            self._events.extend(todo.pull_events())
+
+    def pull_events(self) -> List[TodoEvent]:
+        """Return the events of the todos written so far and forget them.
+
+        Returns:
+            List[TodoEvent]: Events in the order their todos were flushed.
+        """
+        events, self._events = self._events, []
+        return events
+
+    def append_to_outbox(self, events: Sequence[TodoEvent]) -> None:
+        """Write events to the outbox with one batched INSERT.
+
+        The rows belong to the session's open transaction, so they are
+        committed or rolled back together with the changes they describe.
+
+        Args:
+            events: Events to store, in the order they were recorded.
+        """
+        if not events:
+            return
+        created_at = self.clock.now().value
+        self.session.execute(
+            TodoOutboxDTO.__table__.insert(),
+            [
+                {
+                    'todo_id': event.todo_id.value,
+                    'kind': event.kind.value,
+                    'payload': encode_todo_event(event),
+                    'created_at': created_at,
+                }
+                for event in events
+            ],
+        )
+
+    def clear(self) -> None:
+        """Forget every loaded and staged todo and their events."""
+        self._identity_map.clear()
+        self._new.clear()
+        self._dirty.clear()
+        self._events.clear()
+
+    def find_statuses(self, todo_ids: Sequence[TodoId]) -> Dict[TodoId, TodoStatus]:
+        """Return the current status of each existing todo with one SELECT.
+
+        Args:
+            todo_ids: Identifiers of the todos to look up.
+
+        Returns:
+            Dict[TodoId, TodoStatus]: Status by identifier; missing todos are
+            left out.
+        """
+        self.flush()
+        rows = self.session.execute(
+            select(TodoDTO.id, TodoDTO.status).where(
+                TodoDTO.id.in_([todo_id.value for todo_id in todo_ids])
+            )
+        )
+        return {TodoId(id): TodoStatus(status) for id, status in rows.tuples()}
 
-    def delete(self, todo_id: TodoId) -> None:
-        """Remove a todo by its identifier.
+    def start(self, todo_id: TodoId, now: TodoTimestamp) -> Optional[Todo]:
+        """Start a todo with a single conditional UPDATE ... RETURNING statement.
+
+        Args:
+            todo_id: Identifier of the todo to start.
+            now: Time recorded as the todo's update timestamp.
+
+        Returns:
+            Optional[Todo]: The started todo, or None when no not-started todo
+            matches the identifier.
+        """
+        return self._transition(
+            todo_id,
+            TodoStatus.NOT_STARTED,
+            status=TodoStatus.IN_PROGRESS.value,
+            updated_at=now.value,
+        )
+
+    def complete(self, todo_id: TodoId, now: TodoTimestamp) -> Optional[Todo]:
+        """Complete a todo with a single conditional UPDATE ... RETURNING statement.
+
+        Args:
+            todo_id: Identifier of the todo to complete.
+            now: Time recorded as the completion and update timestamp.
+
+        Returns:
+            Optional[Todo]: The completed todo, or None when no in-progress todo
+            matches the identifier.
+        """
+        return self._transition(
+            todo_id,
+            TodoStatus.IN_PROGRESS,
+            status=TodoStatus.COMPLETED.value,
+            updated_at=now.value,
+            completed_at=now.value,
+        )
+
+    def start_many(self, todo_ids: Sequence[TodoId], now: TodoTimestamp) -> List[Todo]:
+        """Start todos with a single set-based UPDATE ... RETURNING statement.
+
+        Args:
+            todo_ids: Identifiers of the todos to start.
+            now: Time recorded as the todos' update timestamp.
+
+        Returns:
+            List[Todo]: The started todos, in no particular order.
+        """
+        return self._transition_many(
+            todo_ids,
+            TodoStatus.NOT_STARTED,
+            status=TodoStatus.IN_PROGRESS.value,
+            updated_at=now.value,
+        )
+
+    def complete_many(
+        self, todo_ids: Sequence[TodoId], now: TodoTimestamp
+    ) -> List[Todo]:
+        """Complete todos with a single set-based UPDATE ... RETURNING statement.
+
+        Args:
+            todo_ids: Identifiers of the todos to complete.
+            now: Time recorded as the completion and update timestamp.
+
+        Returns:
+            List[Todo]: The completed todos, in no particular order.
+        """
+        return self._transition_many(
+            todo_ids,
+            TodoStatus.IN_PROGRESS,
+            status=TodoStatus.COMPLETED.value,
+            updated_at=now.value,
+            completed_at=now.value,
+        )
+
+    def delete(self, todo_id: TodoId) -> bool:
+        """Remove a todo by its identifier with a single DELETE statement.
 
         Args:
             todo_id: Identifier of the todo to delete.
+
+        Returns:
+            bool: True when a todo was deleted; False when none matched.
         """
-        self.session.query(TodoDTO).filter_by(id=todo_id.value).delete()
+        self.flush()
+        self._identity_map.pop(todo_id.value, None)
+        if not self._might_exist(todo_id):
+            return False
+        result = self.session.execute(
+            delete(TodoDTO).where(TodoDTO.id == todo_id.value)
+        )
+        if result.rowcount == 0:
+            self._missed()
+            return False
+        if self.todo_id_filter is not None:
+            self.todo_id_filter.discard(todo_id)
+        return True
+
+    def _transition(
+        self, todo_id: TodoId, from_status: TodoStatus, **values: object
+    ) -> Optional[Todo]:
+        self.flush()
+        if not self._might_exist(todo_id):
+            return None
+        row = self.session.execute(
+            update(TodoDTO)
+            .where(TodoDTO.id == todo_id.value, TodoDTO.status == from_status.value)
+            .values(version=TodoDTO.version + 1, **values)
+            .returning(TodoDTO)
+        ).scalar_one_or_none()
+        return self._track(row.to_entity()) if row is not None else None
+
+    def _transition_many(
+        self, todo_ids: Sequence[TodoId], from_status: TodoStatus, **values: object
+    ) -> List[Todo]:
+        self.flush()
+        rows = self.session.execute(
+            update(TodoDTO)
+            .where(
+                TodoDTO.id.in_([todo_id.value for todo_id in todo_ids]),
+                TodoDTO.status == from_status.value,
+            )
+            .values(version=TodoDTO.version + 1, **values)
+            .returning(TodoDTO)
+        ).scalars()
+        return [self._track(row.to_entity()) for row in rows]
+
+    def _might_exist(self, todo_id: TodoId) -> bool:
+        return self.todo_id_filter is None or self.todo_id_filter.might_contain(todo_id)
+
+    def _missed(self) -> None:
+        if self.todo_id_filter is not None and self.todo_id_filter.ready:
+            self.todo_id_filter.record_false_positive()
+
+    def _track(self, todo: Todo) -> Todo:
+        self._identity_map[todo.id.value] = todo
+        return todo
+
+    @staticmethod
+    def _insert_values(todo: Todo) -> Dict[str, Any]:
+        return {
+            'id': todo.id.value,
+            'title': todo.title.value,
+            'description': todo.description.value if todo.description else None,
+            'status': todo.status.value,
+            'created_at': todo.created_at.value,
+            'updated_at': todo.updated_at.value,
+            'completed_at': todo.completed_at.value if todo.completed_at else None,
+            'version': todo.version + 1,
+        }
+
+    @staticmethod
+    def _update_values(todo: Todo, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        values: Dict[str, Any] = {
+            '_id': todo.id.value,
+            '_version': todo.version,
+            'version': todo.version + 1,
+        }
+        for field in fields:
+            value = getattr(todo, field)
+            values[field] = value.value if value is not None else None
+        return values
 
 
-def new_todo_repository(session: Session) -> TodoRepository:
+def new_todo_repository(
+    session: Session, todo_id_filter: Optional[TodoIdBloomFilter] = None
+) -> TodoRepository:
     """Instantiate a SQLite-backed todo repository.
 
     Args:
         session: Active SQLAlchemy session bound to the SQLite engine.
+        todo_id_filter: Filter of stored todo identifiers, if any.
 
     Returns:
         TodoRepository: Configured repository implementation.
     """
-    return TodoRepositoryImpl(session)
+    return TodoRepositoryImpl(session, todo_id_filter)
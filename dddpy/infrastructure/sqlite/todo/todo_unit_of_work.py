@@ -0,0 +1,115 @@
+"""SQLite implementation of the todo unit of work."""
+
+import logging
+from typing import List, Optional
+
+from sqlalchemy.orm.session import Session
+
+from dddpy.domain.todo.clocks import Clock
+from dddpy.domain.todo.events import TodoEvent
+from dddpy.infrastructure.sqlite.todo.todo_id_bloom_filter import TodoIdBloomFilter
+from dddpy.infrastructure.sqlite.todo.todo_repository import TodoRepositoryImpl
+from dddpy.usecase.todo import TodoEventPublisher, TodoUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class TodoUnitOfWorkImpl(TodoUnitOfWork):
+    """Commit the todos staged in a session-scoped repository together."""
+
+    todos: TodoRepositoryImpl
+
+    def __init__(
+        self,
+        session: Session,
+        todo_id_filter: Optional[TodoIdBloomFilter] = None,
+        event_publisher: Optional[TodoEventPublisher] = None,
+        outbox: bool = False,
+        clock: Optional[Clock] = None,
+    ):
+        """Bind the unit of work and its repository to a session.
+
+        Args:
+            session: Active SQLAlchemy session bound to the SQLite engine.
+            todo_id_filter: Filter of stored todo identifiers, if any.
+            event_publisher: Publisher of committed events, if any.
+            outbox: Write the events to the outbox table in the transaction.
+            clock: Clock timestamping outbox rows; the system clock by default.
+        """
+        self.session = session
+        self.todos = TodoRepositoryImpl(session, todo_id_filter, clock)
+        self.event_publisher = event_publisher
+        self.outbox = outbox
+        self._events: List[TodoEvent] = []
+
+    def record(self, event: TodoEvent) -> None:
+        """Queue an event to be published once the transaction commits.
+
+        Args:
+            event: Change made within the current transaction.
+        """
+        self._collect()
+        self._events.append(event)
+
+    def flush(self) -> None:
+        """Write the staged todos inside the session's open transaction.
+
+        Raises:
+            TodoVersionConflictError: If a staged todo was modified concurrently.
+        """
+        self.todos.flush()
+        self._collect()
+
+    def commit(self) -> None:
+        """Flush the staged todos, commit, then publish the recorded events.
+
+        Published events are those recorded with ``record`` and those the
+        written todos recorded themselves. With the outbox enabled they are
+        also written to it before the commit. The changes are already
+        committed when events are published, so a failing publisher is
+        logged instead of failing the caller.
+
+        Raises:
+            TodoVersionConflictError: If a staged todo was modified concurrently.
+        """
+        self.flush()
+        if self.outbox:
+            self.todos.append_to_outbox(self._events)
+        self.session.commit()
+        events, self._events = self._events, []
+        if events and self.event_publisher is not None:
+            try:
+                self.event_publisher.publish(events)
+            except Exception:
+                logger.exception('Failed to publish %d todo events', len(events))
+
+    def rollback(self) -> None:
+        """Forget the tracked todos and events and roll back the transaction."""
+        self.todos.clear()
+        self._events.clear()
+        self.session.rollback()
+
+    def _collect(self) -> None:
+        self._events.extend(self.todos.pull_events())
+
+
+def new_todo_unit_of_work(
+    session: Session,
+    todo_id_filter: Optional[TodoIdBloomFilter] = None,
+    event_publisher: Optional[TodoEventPublisher] = None,
+    outbox: bool = False,
+    clock: Optional[Clock] = None,
+) -> TodoUnitOfWork:
+    """Instantiate a SQLite-backed todo unit of work.
+
+    Args:
+        session: Active SQLAlchemy session bound to the SQLite engine.
+        todo_id_filter: Filter of stored todo identifiers, if any.
+        event_publisher: Publisher of committed events, if any.
+        outbox: Write the events to the outbox table in the transaction.
+        clock: Clock timestamping outbox rows; the system clock by default.
+
+    Returns:
+        TodoUnitOfWork: Configured unit of work implementation.
+    """
+    return TodoUnitOfWorkImpl(session, todo_id_filter, event_publisher, outbox, clock)
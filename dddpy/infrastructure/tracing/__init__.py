@@ -0,0 +1,20 @@
+"""Expose in-process tracing of requests across the application layers."""
+
+from __future__ import annotations
+
+from .exporters import OtlpJsonFileSpanExporter, RingBufferSpanExporter, encode_otlp
+from .instrumentation import instrument_sql_spans, trace_methods
+from .tracer import Span, SpanExporter, SpanKind, Tracer, current_span
+
+__all__ = (
+    'OtlpJsonFileSpanExporter',
+    'RingBufferSpanExporter',
+    'Span',
+    'SpanExporter',
+    'SpanKind',
+    'Tracer',
+    'current_span',
+    'encode_otlp',
+    'instrument_sql_spans',
+    'trace_methods',
+)
@@ -0,0 +1,172 @@
+"""Span exporters: an in-memory ring buffer and an OTLP JSON file writer."""
+
+import json
+import queue
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from dddpy.infrastructure.tracing.tracer import Span, SpanExporter
+
+SERVICE_NAME = 'dddpy'
+
+
+def encode_otlp(traces: Sequence[Sequence[Span]]) -> Dict[str, Any]:
+    """Encode traces as an OTLP/JSON ``ExportTraceServiceRequest``.
+
+    Args:
+        traces: Spans of each trace.
+
+    Returns:
+        Dict[str, Any]: Document accepted by OTLP/HTTP JSON receivers.
+    """
+    return {
+        'resourceSpans': [
+            {
+                'resource': {'attributes': [_attribute('service.name', SERVICE_NAME)]},
+                'scopeSpans': [
+                    {
+                        'scope': {'name': 'dddpy.infrastructure.tracing'},
+                        'spans': [
+                            _encode_span(span) for spans in traces for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _encode_span(span: Span) -> Dict[str, Any]:
+    encoded: Dict[str, Any] = {
+        'traceId': f'{span.trace_id:032x}',
+        'spanId': f'{span.span_id:016x}',
+        'name': span.name,
+        'kind': span.kind.value,
+        'startTimeUnixNano': str(span.start_ns),
+        'endTimeUnixNano': str(span.end_ns),
+        'attributes': [
+            _attribute(key, value) for key, value in span.attributes.items()
+        ],
+        'status': (
+            {'code': 2, 'message': span.error}
+            if span.error is not None
+            else {'code': 1}
+        ),
+    }
+    if span.parent_id is not None:
+        encoded['parentSpanId'] = f'{span.parent_id:016x}'
+    return encoded
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
+
+
+class RingBufferSpanExporter(SpanExporter):
+    """Keep the most recent traces in memory for inspection."""
+
+    def __init__(self, capacity: int = 256):
+        """Configure the buffer size.
+
+        Args:
+            capacity: Most traces kept; older ones are discarded.
+        """
+        self._traces: Deque[Tuple[Span, ...]] = deque(maxlen=capacity)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Store the spans of one trace.
+
+        Args:
+            spans: Finished spans of the trace.
+        """
+        self._traces.append(tuple(spans))
+
+    def shutdown(self) -> None:
+        """Keep the stored traces; the buffer holds no other resources."""
+
+    def traces(self, limit: Optional[int] = None) -> List[Tuple[Span, ...]]:
+        """Return the stored traces, most recent first.
+
+        Args:
+            limit: Most traces returned.
+
+        Returns:
+            List[Tuple[Span, ...]]: Spans of each trace, root span last.
+        """
+        traces = list(self._traces)
+        traces.reverse()
+        return traces[:limit]
+
+
+class OtlpJsonFileSpanExporter(SpanExporter):
+    """Append traces to a file as OTLP/JSON, one request per line.
+
+    Traces are queued and written by a background thread, so exporting
+    never waits on the disk. The file can be replayed into an OpenTelemetry
+    collector with its OTLP JSON file receiver.
+    """
+
+    def __init__(self, path: str, queue_size: int = 10_000):
+        """Configure the destination file.
+
+        Args:
+            path: File the traces are appended to.
+            queue_size: Most traces waiting to be written; more are dropped.
+        """
+        self.path = path
+        self._queue: 'queue.Queue[Optional[Tuple[Span, ...]]]' = queue.Queue(queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Queue the spans of one trace for writing.
+
+        Args:
+            spans: Finished spans of the trace.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._write, name='otlp-json-writer', daemon=True
+                )
+                self._thread.start()
+        try:
+            self._queue.put_nowait(tuple(spans))
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        """Write the queued traces and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _write(self) -> None:
+        with open(self.path, 'a', encoding='utf-8') as file:
+            while True:
+                spans = self._queue.get()
+                if spans is None:
+                    return
+                traces = [spans]
+                while True:
+                    try:
+                        more = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if more is None:
+                        self._queue.put(None)
+                        break
+                    traces.append(more)
+                file.write(json.dumps(encode_otlp(traces), separators=(',', ':')))
+                file.write('\n')
+                file.flush()
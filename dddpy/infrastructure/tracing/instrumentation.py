@@ -0,0 +1,91 @@
+"""Attach spans to application classes and to SQL execution."""
+
+import functools
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from dddpy.infrastructure.tracing.tracer import SpanKind, Tracer, current_span
+
+
+def trace_methods(cls: type, method_names: Iterable[str], tracer: Tracer) -> None:
+    """Record a span for every call to the named methods of a class.
+
+    Spans are named ``Class.method`` and only recorded inside a sampled
+    trace; other calls cost a context variable lookup.
+
+    Args:
+        cls: Class whose methods are wrapped.
+        method_names: Names of the methods to trace.
+        tracer: Tracer recording the spans.
+    """
+    for name in method_names:
+        method = getattr(cls, name)
+        if getattr(method, '__traced__', False):
+            continue
+        setattr(cls, name, _traced(method, f'{cls.__name__}.{name}', tracer))
+
+
+def _traced(
+    method: Callable[..., Any], name: str, tracer: Tracer
+) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        parent = current_span()
+        if parent is None:
+            return method(*args, **kwargs)
+        span, token = tracer.begin(name, SpanKind.INTERNAL, None, parent)
+        try:
+            result = method(*args, **kwargs)
+        except BaseException as e:
+            tracer.end(span, token, e)
+            raise
+        tracer.end(span, token)
+        return result
+
+    wrapper.__traced__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def instrument_sql_spans(engine: Engine, tracer: Tracer) -> None:
+    """Record a client span for every statement run inside a sampled trace.
+
+    Args:
+        engine: Engine whose statements are traced.
+        tracer: Tracer recording the spans.
+    """
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _start(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        parent = current_span()
+        if parent is not None:
+            # A statement span has no children, so it is not made current.
+            span, _ = tracer.begin(
+                statement.split(None, 1)[0],
+                SpanKind.CLIENT,
+                {'db.system': 'sqlite', 'db.statement': statement},
+                parent,
+                make_current=False,
+            )
+            conn.info.setdefault('trace_spans', []).append(span)
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _finish(conn: Any, *_: Any) -> None:
+        spans = conn.info.get('trace_spans')
+        if spans:
+            tracer.end(spans.pop(), None)
+
+    @event.listens_for(engine, 'handle_error')
+    def _fail(context: Any) -> None:
+        if context.connection is not None:
+            spans = context.connection.info.get('trace_spans')
+            if spans:
+                tracer.end(spans.pop(), None, context.original_exception)
@@ -0,0 +1,244 @@
+"""Lightweight spans propagated through context variables."""
+
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SpanKind(Enum):
+    """Enumerate span kinds, numbered as in OTLP."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+class Span:
+    """One timed operation of a trace.
+
+    Spans of a trace share the list of finished spans of its root span,
+    which is exported once the root ends.
+    """
+
+    __slots__ = (
+        'trace_id',
+        'span_id',
+        'parent_id',
+        'name',
+        'kind',
+        'start_ns',
+        'end_ns',
+        'attributes',
+        'error',
+        '_finished',
+    )
+
+    def __init__(
+        self,
+        trace_id: int,
+        parent_id: Optional[int],
+        name: str,
+        kind: SpanKind,
+        attributes: Optional[Dict[str, Any]],
+        finished: List['Span'],
+    ):
+        self.trace_id = trace_id
+        self.span_id = random.getrandbits(64) or 1
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes if attributes is not None else {}
+        self.error: Optional[str] = None
+        self._finished = finished
+
+    @property
+    def duration_ms(self) -> float:
+        """Return the span's duration in milliseconds."""
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+
+class SpanExporter(ABC):
+    """Receive the spans of each finished trace."""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Take the spans of one trace, root span last.
+
+        Args:
+            spans: Finished spans of the trace.
+        """
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Release resources; called once when the application stops."""
+
+
+_current: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+
+
+class Tracer:
+    """Start spans and hand finished traces to the exporters.
+
+    A trace is started at the edge of the application, for a share
+    ``sample_rate`` of the requests. Spans started anywhere else become
+    children of the current span and are skipped when there is none, so an
+    unsampled request only pays a context variable lookup per instrumented
+    call. The current span follows ``contextvars``, including into the
+    worker threads that copy the context.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        exporters: Sequence[SpanExporter] = (),
+        sampler: Callable[[], float] = random.random,
+    ):
+        """Configure sampling and exporters.
+
+        Args:
+            sample_rate: Share of traces recorded, from 0 to 1.
+            exporters: Destinations of the finished traces.
+            sampler: Source of uniform numbers in [0, 1).
+        """
+        self.sample_rate = sample_rate
+        self.exporters = list(exporters)
+        self._sampler = sampler
+
+    @contextmanager
+    def start_trace(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.SERVER,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Optional[Span]]:
+        """Record a new trace when sampled, or a child of the current span.
+
+        Args:
+            name: Name of the root span.
+            kind: Kind of the root span.
+            attributes: Initial attributes of the root span.
+
+        Yields:
+            Optional[Span]: The span, or None when the trace is not sampled.
+        """
+        parent = _current.get()
+        if parent is None and not (
+            self.sample_rate and self._sampler() < self.sample_rate
+        ):
+            yield None
+            return
+        span, token = self.begin(name, kind, attributes, parent)
+        try:
+            yield span
+        except BaseException as e:
+            self.end(span, token, e)
+            raise
+        self.end(span, token)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Optional[Span]]:
+        """Record a child of the current span, if a trace is being recorded.
+
+        Args:
+            name: Name of the span.
+            kind: Kind of the span.
+            attributes: Initial attributes of the span.
+
+        Yields:
+            Optional[Span]: The span, or None outside a recorded trace.
+        """
+        parent = _current.get()
+        if parent is None:
+            yield None
+            return
+        span, token = self.begin(name, kind, attributes, parent)
+        try:
+            yield span
+        except BaseException as e:
+            self.end(span, token, e)
+            raise
+        self.end(span, token)
+
+    def begin(
+        self,
+        name: str,
+        kind: SpanKind,
+        attributes: Optional[Dict[str, Any]],
+        parent: Optional[Span],
+        make_current: bool = True,
+    ) -> Tuple[Span, Optional[Token]]:
+        """Start a span under ``parent``.
+
+        Prefer ``start_trace`` and ``span``; this is for instrumentation
+        that cannot use a context manager.
+
+        Args:
+            name: Name of the span.
+            kind: Kind of the span.
+            attributes: Initial attributes of the span.
+            parent: Parent span, or None to start a trace.
+            make_current: Whether spans started next become its children.
+
+        Returns:
+            Tuple[Span, Optional[Token]]: The span and, when made current, the
+            token restoring the previous span.
+        """
+        if parent is None:
+            span = Span(random.getrandbits(128) or 1, None, name, kind, attributes, [])
+        else:
+            span = Span(
+                parent.trace_id,
+                parent.span_id,
+                name,
+                kind,
+                attributes,
+                parent._finished,
+            )
+        return span, _current.set(span) if make_current else None
+
+    def end(
+        self, span: Span, token: Optional[Token], error: Optional[BaseException] = None
+    ) -> None:
+        """Finish a span, exporting its trace when it is the root.
+
+        Args:
+            span: Span to finish.
+            token: Token returned by ``begin``, or None if not made current.
+            error: Exception that ended the span, if any.
+        """
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = type(error).__name__
+        if token is not None:
+            _current.reset(token)
+        span._finished.append(span)
+        if span.parent_id is None:
+            for exporter in self.exporters:
+                try:
+                    exporter.export(span._finished)
+                except Exception:
+                    logger.exception('Span exporter %r failed', exporter)
+
+    def shutdown(self) -> None:
+        """Shut every exporter down."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+def current_span() -> Optional[Span]:
+    """Return the span of the current context, if a trace is being recorded."""
+    return _current.get()
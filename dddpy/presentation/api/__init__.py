@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from . import todo
+from . import debug, metrics, todo
 
-__all__ = ('todo',)
+__all__ = ('debug', 'metrics', 'todo')
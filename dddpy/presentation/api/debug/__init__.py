@@ -0,0 +1,9 @@
+"""Expose debug API components."""
+
+from __future__ import annotations
+
+from . import handlers
+from .profiling_middleware import ProfiledRoute, ProfilingMiddleware
+from .tracing_middleware import TracingMiddleware
+
+__all__ = ('ProfiledRoute', 'ProfilingMiddleware', 'TracingMiddleware', 'handlers')
@@ -0,0 +1,7 @@
+"""Expose debug API route handlers."""
+
+from __future__ import annotations
+
+from .debug_api_route_handler import DebugApiRouteHandler
+
+__all__ = ('DebugApiRouteHandler',)
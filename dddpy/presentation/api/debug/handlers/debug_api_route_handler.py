@@ -0,0 +1,323 @@
+"""Controller exposing diagnostics of the running process."""
+
+from typing import Any, Dict, FrozenSet, Optional, Sequence
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.infrastructure.di.injection import (
+    get_debug_allowed_hosts,
+    get_memory_diagnostics,
+    get_profile_store,
+    get_trace_buffer,
+)
+from dddpy.infrastructure.diagnostics import GROUPINGS, MemoryDiagnostics
+from dddpy.infrastructure.profiling import ProfileFormat, ProfileStore
+from dddpy.infrastructure.sqlite.todo import TodoDTO
+from dddpy.infrastructure.tracing import RingBufferSpanExporter, Span
+from dddpy.presentation.api.todo.schemas import TodoSchema
+
+_COUNTED_TYPES = {'Todo': Todo, 'TodoDTO': TodoDTO, 'TodoSchema': TodoSchema}
+
+_PROFILE_FILES = {
+    ProfileFormat.COLLAPSED: ('text/plain; charset=utf-8', 'collapsed.txt'),
+    ProfileFormat.PSTATS: ('application/octet-stream', 'pstats'),
+}
+
+
+def _require_allowed_client(
+    request: Request,
+    allowed_hosts: FrozenSet[str] = Depends(get_debug_allowed_hosts),
+) -> None:
+    if request.client is None or request.client.host not in allowed_hosts:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+
+_ALLOWED_CLIENTS_ONLY = [Depends(_require_allowed_client)]
+
+
+def _trace_to_dict(spans: Sequence[Span]) -> Dict[str, Any]:
+    root = spans[-1]
+    return {
+        'trace_id': f'{root.trace_id:032x}',
+        'name': root.name,
+        'duration_ms': root.duration_ms,
+        'spans': [
+            {
+                'span_id': f'{span.span_id:016x}',
+                'parent_id': (
+                    f'{span.parent_id:016x}' if span.parent_id is not None else None
+                ),
+                'name': span.name,
+                'kind': span.kind.name.lower(),
+                'offset_ms': (span.start_ns - root.start_ns) / 1_000_000,
+                'duration_ms': span.duration_ms,
+                'attributes': span.attributes,
+                'error': span.error,
+            }
+            for span in sorted(spans, key=lambda span: span.start_ns)
+        ],
+    }
+
+
+class DebugApiRouteHandler:
+    """Register endpoints for inspecting the running process.
+
+    Every route answers 403 to clients outside the allowed hosts, as they
+    expose internals and some of them are costly to serve.
+    """
+
+    def register_routes(self, app: FastAPI):
+        """Attach the debug routes to the provided FastAPI application.
+
+        Args:
+            app: FastAPI instance that receives the debug routes.
+        """
+        self._register_trace_routes(app)
+        self._register_profile_routes(app)
+        self._register_memory_routes(app)
+
+    def _register_trace_routes(self, app: FastAPI):
+        """Attach the route listing the recorded traces.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
+
+        @app.get(
+            '/debug/traces', include_in_schema=False, dependencies=_ALLOWED_CLIENTS_ONLY
+        )
+        def get_traces(
+            limit: int = Query(20, ge=1, le=1000),
+            min_duration_ms: Optional[float] = Query(None, ge=0),
+            trace_buffer: RingBufferSpanExporter = Depends(get_trace_buffer),
+        ):
+            """Return the most recent sampled traces, newest first.
+
+            Args:
+                limit: Most traces returned.
+                min_duration_ms: Only return traces lasting at least this long.
+                trace_buffer: Buffer of the recorded traces.
+
+            Returns:
+                dict: Traces with their spans ordered by start time.
+            """
+            traces = trace_buffer.traces()
+            if min_duration_ms is not None:
+                traces = [
+                    spans
+                    for spans in traces
+                    if spans[-1].duration_ms >= min_duration_ms
+                ]
+            return {'traces': [_trace_to_dict(spans) for spans in traces[:limit]]}
+
+    def _register_profile_routes(self, app: FastAPI):
+        """Attach the routes listing and serving request profiles.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
+
+        @app.get(
+            '/debug/profiles',
+            include_in_schema=False,
+            dependencies=_ALLOWED_CLIENTS_ONLY,
+        )
+        def get_profiles(
+            profile_store: ProfileStore = Depends(get_profile_store),
+        ):
+            """List the stored request profiles, newest first.
+
+            Args:
+                profile_store: Store of the request profiles.
+
+            Returns:
+                dict: Metadata of each profile and the URL serving it.
+            """
+            return {
+                'profiles': [
+                    {
+                        'id': profile.id,
+                        'created_at': profile.created_at,
+                        'method': profile.method,
+                        'path': profile.path,
+                        'format': profile.profile_format.value,
+                        'duration_ms': profile.duration_ms,
+                        'size': len(profile.data),
+                        'url': f'/debug/profiles/{profile.id}',
+                    }
+                    for profile in profile_store.list()
+                ]
+            }
+
+        @app.get(
+            '/debug/profiles/{profile_id}',
+            include_in_schema=False,
+            dependencies=_ALLOWED_CLIENTS_ONLY,
+        )
+        def get_profile(
+            profile_id: str,
+            profile_store: ProfileStore = Depends(get_profile_store),
+        ):
+            """Download a stored request profile.
+
+            Args:
+                profile_id: Identifier returned in ``X-Profile-Id``.
+                profile_store: Store of the request profiles.
+
+            Returns:
+                Response: Collapsed stacks as text, or a pstats dump.
+
+            Raises:
+                HTTPException: When no such profile is stored.
+            """
+            profile = profile_store.get(profile_id)
+            if profile is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+            media_type, extension = _PROFILE_FILES[profile.profile_format]
+            return Response(
+                profile.data,
+                media_type=media_type,
+                headers={
+                    'Content-Disposition': (
+                        f'attachment; filename="{profile.id}.{extension}"'
+                    )
+                },
+            )
+
+    def _register_memory_routes(self, app: FastAPI):
+        """Attach the routes inspecting and tracing memory.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
+
+        @app.get(
+            '/debug/memory', include_in_schema=False, dependencies=_ALLOWED_CLIENTS_ONLY
+        )
+        def get_memory(
+            diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+        ):
+            """Report live todo objects, identity maps and traced memory.
+
+            Args:
+                diagnostics: Memory diagnostics of the process.
+
+            Returns:
+                dict: Counts of live objects and the state of tracemalloc.
+            """
+            return {
+                'tracing': diagnostics.tracing,
+                'traced_memory': diagnostics.traced_memory(),
+                'object_counts': diagnostics.object_counts(_COUNTED_TYPES),
+                'identity_maps': diagnostics.identity_map_sizes(),
+                'snapshots': [
+                    {
+                        'name': snapshot.name,
+                        'created_at': snapshot.created_at,
+                        'traced': snapshot.traces is not None,
+                    }
+                    for snapshot in diagnostics.snapshots()
+                ],
+            }
+
+        @app.post(
+            '/debug/memory/tracemalloc/start',
+            include_in_schema=False,
+            dependencies=_ALLOWED_CLIENTS_ONLY,
+        )
+        def start_tracemalloc(
+            frames: int = Query(1, ge=1, le=100),
+            diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+        ):
+            """Start recording allocations.
+
+            Args:
+                frames: Stack frames stored per allocation.
+                diagnostics: Memory diagnostics of the process.
+
+            Returns:
+                dict: Whether allocations are being recorded.
+            """
+            diagnostics.start(frames)
+            return {'tracing': diagnostics.tracing}
+
+        @app.post(
+            '/debug/memory/tracemalloc/stop',
+            include_in_schema=False,
+            dependencies=_ALLOWED_CLIENTS_ONLY,
+        )
+        def stop_tracemalloc(
+            diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+        ):
+            """Stop recording allocations.
+
+            Args:
+                diagnostics: Memory diagnostics of the process.
+
+            Returns:
+                dict: Whether allocations are being recorded.
+            """
+            diagnostics.stop()
+            return {'tracing': diagnostics.tracing}
+
+        @app.post(
+            '/debug/memory/snapshots/{name}',
+            include_in_schema=False,
+            dependencies=_ALLOWED_CLIENTS_ONLY,
+        )
+        def take_memory_snapshot(
+            name: str,
+            diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+        ):
+            """Capture the memory state under a name.
+
+            Args:
+                name: Name of the snapshot.
+                diagnostics: Memory diagnostics of the process.
+
+            Returns:
+                dict: Name of the snapshot and whether it holds allocations.
+            """
+            snapshot = diagnostics.take_snapshot(name)
+            return {'name': snapshot.name, 'traced': snapshot.traces is not None}
+
+        @app.get(
+            '/debug/memory/diff',
+            include_in_schema=False,
+            dependencies=_ALLOWED_CLIENTS_ONLY,
+        )
+        def diff_memory_snapshots(
+            base: str,
+            current: Optional[str] = None,
+            group_by: str = Query('lineno', pattern=f'^({"|".join(GROUPINGS)})$'),
+            limit: int = Query(20, ge=1, le=1000),
+            diagnostics: MemoryDiagnostics = Depends(get_memory_diagnostics),
+        ):
+            """Return the largest memory changes since a snapshot.
+
+            Args:
+                base: Name of the earlier snapshot.
+                current: Name of the later snapshot; the present when omitted.
+                group_by: ``lineno``, ``filename`` or ``type``.
+                limit: Most entries returned.
+                diagnostics: Memory diagnostics of the process.
+
+            Returns:
+                dict: Changes, largest first.
+
+            Raises:
+                HTTPException: When a snapshot is missing or lacks allocations.
+            """
+            try:
+                changes = diagnostics.compare(base, current, group_by, limit)
+            except KeyError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f'Snapshot {e.args[0]} not found',
+                ) from e
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT, detail=str(e)
+                ) from e
+            return {'group_by': group_by, 'changes': changes}
@@ -0,0 +1,127 @@
+"""Profile requests that ask for it with an ``X-Profile`` header."""
+
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from dddpy.infrastructure.profiling import ProfileFormat, ProfileStore, RequestProfiler
+from dddpy.presentation.api.metrics import ServerTimingRoute
+
+_PROFILE_HEADER = b'x-profile'
+
+_FORMATS = {
+    b'1': ProfileFormat.COLLAPSED,
+    b'collapsed': ProfileFormat.COLLAPSED,
+    b'pstats': ProfileFormat.PSTATS,
+}
+
+_current: ContextVar[Optional[RequestProfiler]] = ContextVar(
+    'request_profiler', default=None
+)
+
+
+class ProfiledRoute(ServerTimingRoute):
+    """API route running its endpoint under the request's profiler, if any.
+
+    Endpoints run in the event loop or in a worker thread; wrapping the
+    endpoint itself lets the profiler observe the thread doing the work.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _profiled(endpoint), **kwargs)
+
+
+def _profiled(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _current.get()
+            if profiler is None:
+                return await endpoint(*args, **kwargs)
+            return await profiler.run_async(endpoint, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profiler = _current.get()
+        if profiler is None:
+            return endpoint(*args, **kwargs)
+        return profiler.run(endpoint, *args, **kwargs)
+
+    return wrapper
+
+
+class ProfilingMiddleware:
+    """Profile requests carrying ``X-Profile`` from an allowed client.
+
+    ``X-Profile: 1`` or ``collapsed`` records sampled stacks in the
+    collapsed format of flame graph tools; ``X-Profile: pstats`` records a
+    ``cProfile`` dump. The profile is kept in the store and the response
+    names it in ``X-Profile-Id`` and ``X-Profile-Url``. Any other request
+    costs one scan of its headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: ProfileStore,
+        allowed_hosts: Sequence[str] = ('127.0.0.1', '::1'),
+        interval_seconds: float = 0.001,
+    ):
+        """Wrap the application.
+
+        Args:
+            app: Application being wrapped.
+            store: Store receiving the profiles.
+            allowed_hosts: Client addresses allowed to request a profile.
+            interval_seconds: Pause between stack samples.
+        """
+        self.app = app
+        self.store = store
+        self.allowed_hosts = frozenset(allowed_hosts)
+        self.interval_seconds = interval_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        requested = next(
+            (value for name, value in scope['headers'] if name == _PROFILE_HEADER),
+            None,
+        )
+        if requested is None:
+            await self.app(scope, receive, send)
+            return
+        profile_format = _FORMATS.get(requested.strip().lower())
+        client = scope.get('client')
+        if profile_format is None or not client or client[0] not in self.allowed_hosts:
+            await self.app(scope, receive, send)
+            return
+
+        profiler = RequestProfiler(profile_format, self.interval_seconds)
+
+        async def send_with_profile(message: Message) -> None:
+            if message['type'] == 'http.response.start' and profiler.seconds:
+                profile = self.store.add(
+                    scope['method'],
+                    scope['path'],
+                    profile_format,
+                    profiler.seconds * 1000,
+                    profiler.render(),
+                )
+                headers = MutableHeaders(scope=message)
+                headers.append('X-Profile-Id', profile.id)
+                headers.append('X-Profile-Url', f'/debug/profiles/{profile.id}')
+            await send(message)
+
+        token = _current.set(profiler)
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            _current.reset(token)
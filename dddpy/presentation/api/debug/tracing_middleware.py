@@ -0,0 +1,51 @@
+"""ASGI middleware starting a trace for each sampled request."""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from dddpy.infrastructure.tracing import Tracer
+
+
+class TracingMiddleware:
+    """Record each sampled request as the root span of a trace.
+
+    The span is named after the method and the route template once routing
+    has matched, and the response of a sampled request carries its trace id
+    in ``X-Trace-Id`` so it can be found under ``/debug/traces``.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer):
+        """Wrap the application.
+
+        Args:
+            app: Application being wrapped.
+            tracer: Tracer deciding which requests are recorded.
+        """
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        with self.tracer.start_trace(f'{scope["method"]} {scope["path"]}') as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_trace_id(message: Message) -> None:
+                if message['type'] == 'http.response.start':
+                    span.attributes['http.status_code'] = message['status']
+                    MutableHeaders(scope=message).append(
+                        'X-Trace-Id', f'{span.trace_id:032x}'
+                    )
+                await send(message)
+
+            span.attributes['http.method'] = scope['method']
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                route = getattr(scope.get('route'), 'path', None)
+                if route is not None:
+                    span.name = f'{scope["method"]} {route}'
+                    span.attributes['http.route'] = route
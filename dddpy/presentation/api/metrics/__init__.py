@@ -0,0 +1,15 @@
+"""Expose metrics API components."""
+
+from __future__ import annotations
+
+from . import handlers
+from .request_metrics_middleware import RequestMetricsMiddleware
+from .server_timing import ServerTimingMiddleware, ServerTimingRoute, statement_count
+
+__all__ = (
+    'RequestMetricsMiddleware',
+    'ServerTimingMiddleware',
+    'ServerTimingRoute',
+    'handlers',
+    'statement_count',
+)
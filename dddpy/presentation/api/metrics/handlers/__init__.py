@@ -0,0 +1,7 @@
+"""Expose metrics API route handlers."""
+
+from __future__ import annotations
+
+from .metrics_api_route_handler import MetricsApiRouteHandler
+
+__all__ = ('MetricsApiRouteHandler',)
@@ -0,0 +1,31 @@
+"""Controller exposing the application metrics for scraping."""
+
+from fastapi import Depends, FastAPI, Response
+
+from dddpy.infrastructure.di.injection import get_metrics_registry
+from dddpy.infrastructure.metrics import MetricsRegistry
+
+
+class MetricsApiRouteHandler:
+    """Register the endpoint serving the metrics registry."""
+
+    def register_routes(self, app: FastAPI):
+        """Attach the metrics route to the provided FastAPI application.
+
+        Args:
+            app: FastAPI instance that receives the metrics route.
+        """
+
+        @app.get('/metrics', response_class=Response, include_in_schema=False)
+        def get_metrics(
+            registry: MetricsRegistry = Depends(get_metrics_registry),
+        ):
+            """Return every metric in the Prometheus text format.
+
+            Args:
+                registry: Registry of the application metrics.
+
+            Returns:
+                Response: Plain-text exposition of the metrics.
+            """
+            return Response(registry.render(), media_type=registry.CONTENT_TYPE)
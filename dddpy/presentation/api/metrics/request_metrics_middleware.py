@@ -0,0 +1,67 @@
+"""ASGI middleware recording request latency per route."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from dddpy.infrastructure.metrics import MetricsRegistry
+
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class RequestMetricsMiddleware:
+    """Time each HTTP request and count responses by route and status.
+
+    Requests are labelled with the path template of the route that served
+    them, such as ``/todos/{todo_id}``, so identifiers do not multiply the
+    series; requests matching no route share one label. The latency of a
+    streaming response covers the whole stream.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry):
+        """Create the request metrics in the registry.
+
+        Args:
+            app: Application being wrapped.
+            registry: Registry receiving the request metrics.
+        """
+        self.app = app
+        self._latency = registry.histogram(
+            'http_request_duration_seconds',
+            'Time to serve a request, by route.',
+            ('method', 'route'),
+        )
+        self._responses = registry.counter(
+            'http_responses_total',
+            'Responses sent, by route and status code.',
+            ('method', 'route', 'status'),
+        )
+        self._in_flight = registry.gauge(
+            'http_requests_in_flight', 'Requests being served.', ('method',)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        method = scope['method']
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        in_flight = self._in_flight.labels(method)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_flight.dec()
+            # The router records the matched route in the shared scope.
+            route = getattr(scope.get('route'), 'path', UNMATCHED_ROUTE)
+            self._latency.labels(method, route).observe(elapsed)
+            self._responses.labels(method, route, str(status_code)).inc()
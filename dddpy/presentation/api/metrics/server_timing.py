@@ -0,0 +1,155 @@
+"""Report where each request spent its time in a Server-Timing header."""
+
+import functools
+import inspect
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from dddpy.infrastructure.sqlite.statement_stats import (
+    StatementStats,
+    track_statements,
+)
+
+logger = logging.getLogger(__name__)
+
+REPEATED_STATEMENT_THRESHOLD = 5
+
+_STATEMENT_COUNT = re.compile(r'(?:^|,)\s*db;[^,]*desc="(\d+) statements"')
+
+
+class _RequestTiming:
+    __slots__ = ('started', 'endpoint_returned', 'statements')
+
+    def __init__(self, started: float, statements: StatementStats):
+        self.started = started
+        self.endpoint_returned: Optional[float] = None
+        self.statements = statements
+
+    def header(self, now: float) -> str:
+        total = now - self.started
+        db = self.statements.seconds
+        serialize = now - self.endpoint_returned if self.endpoint_returned else 0.0
+        app = max(0.0, total - db - serialize)
+        return (
+            f'db;dur={db * 1000:.3f};desc="{self.statements.count} statements", '
+            f'app;dur={app * 1000:.3f}, serialize;dur={serialize * 1000:.3f}'
+        )
+
+
+_current: ContextVar[Optional[_RequestTiming]] = ContextVar(
+    'request_timing', default=None
+)
+
+
+class ServerTimingRoute(APIRoute):
+    """API route noting when its endpoint returns.
+
+    The time between the endpoint returning and the response starting is
+    spent validating and encoding the response, reported as ``serialize``.
+    Install it as the router's ``route_class`` before registering routes.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _note_return(endpoint), **kwargs)
+
+
+def _note_return(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    def returned() -> None:
+        timing = _current.get()
+        if timing is not None:
+            timing.endpoint_returned = time.perf_counter()
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await endpoint(*args, **kwargs)
+            returned()
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = endpoint(*args, **kwargs)
+        returned()
+        return result
+
+    return wrapper
+
+
+class ServerTimingMiddleware:
+    """Add a ``Server-Timing`` header splitting each request into phases.
+
+    ``db`` is the time spent executing SQL statements, with their number
+    in its description; ``serialize`` is the time from the endpoint
+    returning to the response starting; ``app`` is the rest. Requests that
+    run the same statement ``repeated_statement_threshold`` times or more,
+    the usual sign of an N+1 query pattern, are logged as warnings.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        repeated_statement_threshold: int = REPEATED_STATEMENT_THRESHOLD,
+    ):
+        """Wrap the application.
+
+        Args:
+            app: Application being wrapped.
+            repeated_statement_threshold: Executions of one statement within
+                a request from which it is reported.
+        """
+        self.app = app
+        self.repeated_statement_threshold = repeated_statement_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        with track_statements() as statements:
+            timing = _RequestTiming(time.perf_counter(), statements)
+
+            async def send_with_timing(message: Message) -> None:
+                if message['type'] == 'http.response.start':
+                    headers = MutableHeaders(scope=message)
+                    headers.append('Server-Timing', timing.header(time.perf_counter()))
+                await send(message)
+
+            token = _current.set(timing)
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                _current.reset(token)
+
+        for statement, count in statements.repeated(
+            self.repeated_statement_threshold
+        ).items():
+            logger.warning(
+                '%s %s ran the same statement %d times: %s',
+                scope['method'],
+                getattr(scope.get('route'), 'path', scope['path']),
+                count,
+                statement,
+            )
+
+
+def statement_count(server_timing: str) -> Optional[int]:
+    """Read the number of SQL statements from a ``Server-Timing`` header.
+
+    Args:
+        server_timing: Header value written by ``ServerTimingMiddleware``.
+
+    Returns:
+        Optional[int]: Statements run by the request, or None when absent.
+    """
+    match = _STATEMENT_COUNT.search(server_timing)
+    return int(match.group(1)) if match else None
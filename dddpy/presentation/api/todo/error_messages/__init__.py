@@ -6,10 +6,12 @@ from .todo_already_completed_error_message import ErrorMessageTodoAlreadyComplet
 from .todo_already_started_error_message import ErrorMessageTodoAlreadyStarted
 from .todo_not_found_error_message import ErrorMessageTodoNotFound
 from .todo_not_started_error_message import ErrorMessageTodoNotStarted
+from .todo_version_conflict_error_message import ErrorMessageTodoVersionConflict
 
 __all__ = (
     'ErrorMessageTodoAlreadyCompleted',
     'ErrorMessageTodoAlreadyStarted',
     'ErrorMessageTodoNotFound',
     'ErrorMessageTodoNotStarted',
+    'ErrorMessageTodoVersionConflict',
 )
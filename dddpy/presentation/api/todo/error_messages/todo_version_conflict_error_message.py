@@ -0,0 +1,11 @@
+"""Expose the error schema when a todo was modified concurrently."""
+
+from pydantic import BaseModel, Field
+
+from dddpy.domain.todo.exceptions import TodoVersionConflictError
+
+
+class ErrorMessageTodoVersionConflict(BaseModel):
+    """Represent the version-conflict error response payload."""
+
+    detail: str = Field(examples=[TodoVersionConflictError.message])
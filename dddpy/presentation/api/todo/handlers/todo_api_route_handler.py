@@ -1,39 +1,214 @@
 """Controller for handling Todo-related HTTP requests."""
 
-from typing import List
+import hashlib
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 from uuid import UUID
 
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 
+from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.exceptions import (
     TodoAlreadyCompletedError,
     TodoAlreadyStartedError,
     TodoNotFoundError,
+    TodoNotStartedError,
+    TodoVersionConflictError,
 )
 from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
 from dddpy.infrastructure.di.injection import (
     get_complete_todo_usecase,
+    get_complete_todos_usecase,
     get_create_todo_usecase,
+    get_execute_todo_batch_usecase,
     get_find_todo_by_id_usecase,
     get_find_todos_usecase,
+    get_idempotency_store,
     get_start_todo_usecase,
+    get_start_todos_usecase,
+    get_todo_event_broadcaster,
     get_update_todo_usecase,
 )
-from dddpy.presentation.api.todo.error_messages import ErrorMessageTodoNotFound
+from dddpy.infrastructure.events import Broadcaster
+from dddpy.infrastructure.idempotency import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInFlightError,
+    IdempotencyStore,
+    StoredResponse,
+)
+from dddpy.presentation.api.todo.error_messages import (
+    ErrorMessageTodoNotFound,
+    ErrorMessageTodoVersionConflict,
+)
 from dddpy.presentation.api.todo.schemas import (
+    TodoBatchResultSchema,
+    TodoBatchSchema,
+    TodoBulkTransitionResultSchema,
+    TodoBulkTransitionSchema,
     TodoCreateSchema,
+    TodoOperationResultSchema,
+    TodoOperationSchema,
+    TodoPatchSchema,
     TodoSchema,
     TodoUpdateSchema,
 )
 from dddpy.usecase.todo import (
+    CompleteTodosUseCase,
     CompleteTodoUseCase,
     CreateTodoUseCase,
+    ExecuteTodoBatchUseCase,
     FindTodoByIdUseCase,
     FindTodosUseCase,
+    StartTodosUseCase,
     StartTodoUseCase,
+    TodoOperation,
+    TodoOperationKind,
+    TodoOperationOutcome,
+    TodoOperationResult,
     UpdateTodoUseCase,
 )
 
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+_OPERATION_SUCCESS_STATUS = {
+    TodoOperationKind.CREATE: status.HTTP_201_CREATED,
+    TodoOperationKind.UPDATE: status.HTTP_200_OK,
+    TodoOperationKind.START: status.HTTP_200_OK,
+    TodoOperationKind.COMPLETE: status.HTTP_200_OK,
+    TodoOperationKind.DELETE: status.HTTP_204_NO_CONTENT,
+}
+
+_OPERATION_ERROR_STATUS = {
+    TodoNotFoundError: status.HTTP_404_NOT_FOUND,
+    TodoAlreadyStartedError: status.HTTP_400_BAD_REQUEST,
+    TodoAlreadyCompletedError: status.HTTP_400_BAD_REQUEST,
+    TodoNotStartedError: status.HTTP_400_BAD_REQUEST,
+    TodoVersionConflictError: status.HTTP_409_CONFLICT,
+}
+
+
+def _etag(todo: Todo) -> str:
+    return f'"{todo.version}"'
+
+
+def _json_response(
+    body: bytes, status_code: int, headers: Optional[dict] = None
+) -> Response:
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type='application/json',
+        headers=headers,
+    )
+
+
+def _parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Return the event id a client resumes the stream from.
+
+    Args:
+        value: Raw Last-Event-ID header value, if present.
+
+    Returns:
+        Optional[int]: Last received event id, or None to start from now.
+    """
+    if value is None or not value.strip().isdigit():
+        return None
+    return int(value)
+
+
+def _parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """Return the todo version required by an If-Match header.
+
+    Args:
+        if_match: Raw If-Match header value, if present.
+
+    Returns:
+        Optional[int]: Required version, or None when any version is acceptable.
+
+    Raises:
+        HTTPException: When the header cannot match any todo version.
+    """
+    if if_match is None or if_match.strip() == '*':
+        return None
+    tag = if_match.strip().removeprefix('W/').strip('"')
+    try:
+        return int(tag)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=TodoVersionConflictError.message,
+        ) from e
+
+
+@contextmanager
+def _raise_http_errors(if_match: Optional[str] = None) -> Iterator[None]:
+    """Turn errors raised while validating or writing todos into HTTP errors.
+
+    Invalid values are reported as 400 and todo errors with the status of
+    ``_OPERATION_ERROR_STATUS``; a version conflict is 412 instead when the
+    client sent If-Match. Any other error is a 500.
+
+    Args:
+        if_match: Raw If-Match header value of the request, if any.
+
+    Raises:
+        HTTPException: For any error raised by the block.
+    """
+    try:
+        yield
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    except tuple(_OPERATION_ERROR_STATUS) as e:
+        status_code = _OPERATION_ERROR_STATUS[type(e)]
+        if isinstance(e, TodoVersionConflictError) and if_match is not None:
+            status_code = status.HTTP_412_PRECONDITION_FAILED
+        raise HTTPException(status_code=status_code, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        ) from e
+
+
+def _to_operation(data: TodoOperationSchema) -> TodoOperation:
+    """Convert a validated batch operation into a use case command.
+
+    Raises:
+        ValueError: When a value violates the todo value object rules.
+    """
+    present = data.model_fields_set
+    description = TodoDescription(data.description) if data.description else None
+    return TodoOperation(
+        kind=TodoOperationKind(data.op),
+        todo_id=TodoId(data.id) if data.id is not None else None,
+        title=TodoTitle(data.title) if data.title is not None else None,
+        description=description,
+        expected_version=data.version,
+        clear_description='description' in present and description is None,
+    )
+
+
+def _to_result_schema(
+    operation: TodoOperation, result: TodoOperationResult
+) -> TodoOperationResultSchema:
+    if result.outcome == TodoOperationOutcome.SUCCEEDED:
+        status_code = _OPERATION_SUCCESS_STATUS[operation.kind]
+    elif result.error is not None:
+        status_code = _OPERATION_ERROR_STATUS[type(result.error)]
+    else:
+        status_code = status.HTTP_424_FAILED_DEPENDENCY
+    return TodoOperationResultSchema(
+        outcome=result.outcome.value,
+        status_code=status_code,
+        todo=TodoSchema.from_entity(result.todo) if result.todo else None,
+        detail=str(result.error) if result.error else None,
+    )
+
 
 class TodoApiRouteHandler:
     """Register HTTP endpoints that expose todo use cases."""
@@ -44,6 +219,66 @@ class TodoApiRouteHandler:
         Args:
             app: FastAPI instance that receives the todo routes.
         """
+        self._register_stream_route(app)
+        self._register_query_routes(app)
+        self._register_create_route(app)
+        self._register_batch_routes(app)
+        self._register_update_routes(app)
+        self._register_start_route(app)
+        self._register_complete_route(app)
+
+    def _register_stream_route(self, app: FastAPI):
+        """Attach the Server-Sent Events stream of todo changes.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
+
+        @app.get(
+            '/todos/stream',
+            response_class=StreamingResponse,
+            responses={200: {'content': {'text/event-stream': {}}}},
+        )
+        async def stream_todos(
+            last_event_id: Optional[str] = Header(None, alias='Last-Event-ID'),
+            broadcaster: Broadcaster = Depends(get_todo_event_broadcaster),
+        ):
+            """Stream todo changes as Server-Sent Events.
+
+            Each event is named after the change (created, updated, started,
+            completed or deleted) and carries the todo, or only the id of a
+            deleted todo. A reconnecting client sending ``Last-Event-ID``
+            receives the events it missed, or a ``reset`` event when they are
+            no longer available.
+
+            Args:
+                last_event_id: Identifier of the last event the client received.
+                broadcaster: Broadcaster of committed todo events.
+
+            Returns:
+                StreamingResponse: Never-ending event stream.
+            """
+            subscription = broadcaster.subscribe(_parse_last_event_id(last_event_id))
+
+            async def frames():
+                try:
+                    async for chunk in subscription:
+                        yield chunk
+                finally:
+                    subscription.close()
+
+            return StreamingResponse(
+                frames(),
+                media_type='text/event-stream',
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+            )
+
+    def _register_query_routes(self, app: FastAPI):
+        """Attach the routes reading todos.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
 
         @app.get(
             '/todos',
@@ -84,12 +319,14 @@ class TodoApiRouteHandler:
         )
         def get_todo(
             todo_id: UUID,
+            response: Response,
             usecase: FindTodoByIdUseCase = Depends(get_find_todo_by_id_usecase),
         ):
             """Return a single todo by identifier.
 
             Args:
                 todo_id: Identifier of the requested todo.
+                response: Response used to expose the todo version as ETag.
                 usecase: Use case responsible for todo retrieval.
 
             Returns:
@@ -110,8 +347,16 @@ class TodoApiRouteHandler:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 ) from exc
+            response.headers['ETag'] = _etag(todo)
             return TodoSchema.from_entity(todo)
 
+    def _register_create_route(self, app: FastAPI):
+        """Attach the idempotent todo creation route.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
+
         @app.post(
             '/todos',
             response_model=TodoSchema,
@@ -122,19 +367,31 @@ class TodoApiRouteHandler:
         )
         def create_todo(
             data: TodoCreateSchema,
+            idempotency_key: Optional[str] = Header(
+                default=None, max_length=MAX_IDEMPOTENCY_KEY_LENGTH
+            ),
             usecase: CreateTodoUseCase = Depends(get_create_todo_usecase),
+            idempotency_store: IdempotencyStore = Depends(get_idempotency_store),
         ):
             """Create a todo from the request payload.
 
+            With an Idempotency-Key header, the first successful response is
+            stored and replayed for retries carrying the same key and payload
+            without running the use case again. A retry arriving while the
+            first request is still running waits for it to finish.
+
             Args:
                 data: Payload containing todo creation fields.
+                idempotency_key: Optional client-chosen key identifying retries.
                 usecase: Use case responsible for creating todos.
+                idempotency_store: Store of responses by idempotency key.
 
             Returns:
                 TodoSchema: Serialized todo returned to the client.
 
             Raises:
-                HTTPException: When validation or use case execution fails.
+                HTTPException: When validation or use case execution fails, or
+                    the key was used for another payload or is still in use.
             """
             try:
                 title = TodoTitle(data.title)
@@ -147,14 +404,164 @@ class TodoApiRouteHandler:
                     detail=e,
                 ) from e
 
+            if idempotency_key is None:
+                try:
+                    todo = usecase.execute(title, description)
+                except Exception as e:
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    ) from e
+
+                return TodoSchema.from_entity(todo)
+
+            fingerprint = hashlib.sha256(data.model_dump_json().encode()).digest()
+            try:
+                stored = idempotency_store.begin(idempotency_key, fingerprint)
+            except IdempotencyKeyConflictError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=e.message,
+                ) from e
+            except IdempotencyKeyInFlightError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=e.message,
+                ) from e
+            if stored is not None:
+                return _json_response(
+                    stored.body, stored.status_code, {'Idempotent-Replayed': 'true'}
+                )
+
             try:
                 todo = usecase.execute(title, description)
             except Exception as e:
+                idempotency_store.release(idempotency_key)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 ) from e
 
-            return TodoSchema.from_entity(todo)
+            body = TodoSchema.from_entity(todo).model_dump_json().encode()
+            idempotency_store.complete(
+                idempotency_key,
+                StoredResponse(status.HTTP_201_CREATED, body, fingerprint),
+            )
+            return _json_response(body, status.HTTP_201_CREATED)
+
+    def _register_batch_routes(self, app: FastAPI):
+        """Attach the batch and bulk routes.
+
+        They are registered before the single-todo routes so ``batch`` and
+        ``bulk`` are not read as todo identifiers.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
+
+        @app.post(
+            '/todos/batch',
+            response_model=TodoBatchResultSchema,
+            status_code=200,
+            responses={
+                status.HTTP_400_BAD_REQUEST: {},
+            },
+        )
+        def execute_todo_batch(
+            data: TodoBatchSchema,
+            usecase: ExecuteTodoBatchUseCase = Depends(get_execute_todo_batch_usecase),
+        ):
+            """Run an ordered list of todo operations in one transaction.
+
+            Every operation gets its own result with the status code the
+            matching single-todo route would have returned.
+
+            Args:
+                data: Payload listing the operations and the error mode.
+                usecase: Use case responsible for running batches.
+
+            Returns:
+                TodoBatchResultSchema: Per-operation results and whether the
+                batch was committed.
+
+            Raises:
+                HTTPException: When an operation is invalid or execution fails.
+            """
+            with _raise_http_errors():
+                operations = [_to_operation(operation) for operation in data.operations]
+                results = usecase.execute(operations, atomic=data.mode == 'atomic')
+
+            return TodoBatchResultSchema(
+                committed=data.mode == 'independent'
+                or all(
+                    result.outcome == TodoOperationOutcome.SUCCEEDED
+                    for result in results
+                ),
+                results=[
+                    _to_result_schema(operation, result)
+                    for operation, result in zip(operations, results, strict=True)
+                ],
+            )
+
+        @app.patch(
+            '/todos/bulk/start',
+            response_model=TodoBulkTransitionResultSchema,
+            status_code=200,
+        )
+        def start_todos(
+            data: TodoBulkTransitionSchema,
+            usecase: StartTodosUseCase = Depends(get_start_todos_usecase),
+        ):
+            """Start many todos with one set-based update.
+
+            Registered before the single-todo routes so ``bulk`` is not read
+            as a todo identifier.
+
+            Args:
+                data: Payload listing the identifiers of the todos to start.
+                usecase: Use case responsible for starting todos in bulk.
+
+            Returns:
+                TodoBulkTransitionResultSchema: Started, missing and rejected todos.
+
+            Raises:
+                HTTPException: When the use case raises an unexpected error.
+            """
+            with _raise_http_errors():
+                report = usecase.execute([TodoId(todo_id) for todo_id in data.ids])
+
+            return TodoBulkTransitionResultSchema.from_report(report)
+
+        @app.patch(
+            '/todos/bulk/complete',
+            response_model=TodoBulkTransitionResultSchema,
+            status_code=200,
+        )
+        def complete_todos(
+            data: TodoBulkTransitionSchema,
+            usecase: CompleteTodosUseCase = Depends(get_complete_todos_usecase),
+        ):
+            """Complete many todos with one set-based update.
+
+            Args:
+                data: Payload listing the identifiers of the todos to complete.
+                usecase: Use case responsible for completing todos in bulk.
+
+            Returns:
+                TodoBulkTransitionResultSchema: Completed, missing and rejected todos.
+
+            Raises:
+                HTTPException: When the use case raises an unexpected error.
+            """
+            with _raise_http_errors():
+                report = usecase.execute([TodoId(todo_id) for todo_id in data.ids])
+
+            return TodoBulkTransitionResultSchema.from_report(report)
+
+    def _register_update_routes(self, app: FastAPI):
+        """Attach the routes replacing and patching a todo.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
 
         @app.put(
             '/todos/{todo_id}',
@@ -164,18 +571,31 @@ class TodoApiRouteHandler:
                 status.HTTP_404_NOT_FOUND: {
                     'model': ErrorMessageTodoNotFound,
                 },
+                status.HTTP_409_CONFLICT: {
+                    'model': ErrorMessageTodoVersionConflict,
+                },
+                status.HTTP_412_PRECONDITION_FAILED: {
+                    'model': ErrorMessageTodoVersionConflict,
+                },
             },
         )
         def update_todo(
             todo_id: UUID,
             data: TodoUpdateSchema,
+            response: Response,
+            if_match: Optional[str] = Header(default=None),
             usecase: UpdateTodoUseCase = Depends(get_update_todo_usecase),
         ):
             """Update a todo identified by the path parameter.
 
+            A conflicting concurrent write is reported as 412 when the client
+            sent If-Match and as 409 otherwise.
+
             Args:
                 todo_id: Identifier of the todo to update.
                 data: Payload containing fields to update.
+                response: Response used to expose the new version as ETag.
+                if_match: Optional ETag of the version the update is based on.
                 usecase: Use case responsible for updating todos.
 
             Returns:
@@ -184,33 +604,93 @@ class TodoApiRouteHandler:
             Raises:
                 HTTPException: When validation fails or the todo cannot be updated.
             """
-            _id = TodoId(todo_id)
-
-            try:
+            with _raise_http_errors(if_match):
                 title = TodoTitle(data.title)
                 description = (
                     TodoDescription(data.description) if data.description else None
                 )
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=e,
-                ) from e
+                todo = usecase.execute(
+                    TodoId(todo_id), title, description, _parse_if_match(if_match)
+                )
 
-            try:
-                todo = usecase.execute(_id, title, description)
-            except TodoNotFoundError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=e.message,
-                ) from e
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                ) from e
+            response.headers['ETag'] = _etag(todo)
+            return TodoSchema.from_entity(todo)
+
+        @app.patch(
+            '/todos/{todo_id}',
+            response_model=TodoSchema,
+            status_code=200,
+            openapi_extra={
+                'requestBody': {
+                    'content': {
+                        'application/merge-patch+json': {
+                            'schema': {'$ref': '#/components/schemas/TodoPatchSchema'},
+                        },
+                    },
+                },
+            },
+            responses={
+                status.HTTP_404_NOT_FOUND: {
+                    'model': ErrorMessageTodoNotFound,
+                },
+                status.HTTP_409_CONFLICT: {
+                    'model': ErrorMessageTodoVersionConflict,
+                },
+                status.HTTP_412_PRECONDITION_FAILED: {
+                    'model': ErrorMessageTodoVersionConflict,
+                },
+            },
+        )
+        def patch_todo(
+            todo_id: UUID,
+            data: TodoPatchSchema,
+            response: Response,
+            if_match: Optional[str] = Header(default=None),
+            usecase: UpdateTodoUseCase = Depends(get_update_todo_usecase),
+        ):
+            """Apply a JSON Merge Patch to a todo.
+
+            Only the members present in the patch are validated and changed,
+            so the stored row is rewritten for those columns only. A null
+            description removes it.
+
+            Args:
+                todo_id: Identifier of the todo to patch.
+                data: Merge patch document with the members to change.
+                response: Response used to expose the new version as ETag.
+                if_match: Optional ETag of the version the patch is based on.
+                usecase: Use case responsible for updating todos.
 
+            Returns:
+                TodoSchema: Serialized todo returned to the client.
+
+            Raises:
+                HTTPException: When validation fails or the todo cannot be updated.
+            """
+            with _raise_http_errors(if_match):
+                title = TodoTitle(data.title) if data.title is not None else None
+                description = (
+                    TodoDescription(data.description) if data.description else None
+                )
+                todo = usecase.execute(
+                    TodoId(todo_id),
+                    title,
+                    description,
+                    _parse_if_match(if_match),
+                    clear_description='description' in data.model_fields_set
+                    and description is None,
+                )
+
+            response.headers['ETag'] = _etag(todo)
             return TodoSchema.from_entity(todo)
 
+    def _register_start_route(self, app: FastAPI):
+        """Attach the route starting a todo.
+
+        Args:
+            app: FastAPI instance that receives the routes.
+        """
+
         @app.patch(
             '/todos/{todo_id}/start',
             response_model=TodoSchema,
@@ -250,6 +730,11 @@ class TodoApiRouteHandler:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=e.message,
                 ) from e
+            except TodoAlreadyCompletedError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=e.message,
+                ) from e
             except Exception as e:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -257,6 +742,13 @@ class TodoApiRouteHandler:
 
             return TodoSchema.from_entity(todo)
 
+    def _register_complete_route(self, app: FastAPI):
+        """Attach the route completing a todo.
+
+        Args:
+            app: FastAPI instance that receives the route.
+        """
+
         @app.patch(
             '/todos/{todo_id}/complete',
             response_model=TodoSchema,
@@ -291,7 +783,7 @@ class TodoApiRouteHandler:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=e.message,
                 ) from e
-            except TodoAlreadyStartedError as e:
+            except TodoNotStartedError as e:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=e.message,
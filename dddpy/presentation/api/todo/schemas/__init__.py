@@ -2,8 +2,32 @@
 
 from __future__ import annotations
 
+from .todo_batch_schema import (
+    TodoBatchResultSchema,
+    TodoBatchSchema,
+    TodoOperationResultSchema,
+    TodoOperationSchema,
+)
+from .todo_bulk_transition_schema import (
+    TodoBulkTransitionResultSchema,
+    TodoBulkTransitionSchema,
+    TodoTransitionRejectionSchema,
+)
 from .todo_create_schema import TodoCreateSchema
+from .todo_patch_schema import TodoPatchSchema
 from .todo_schema import TodoSchema
 from .todo_update_schema import TodoUpdateSchema
 
-__all__ = ('TodoCreateSchema', 'TodoSchema', 'TodoUpdateSchema')
+__all__ = (
+    'TodoBatchResultSchema',
+    'TodoBatchSchema',
+    'TodoBulkTransitionResultSchema',
+    'TodoBulkTransitionSchema',
+    'TodoCreateSchema',
+    'TodoOperationResultSchema',
+    'TodoOperationSchema',
+    'TodoPatchSchema',
+    'TodoSchema',
+    'TodoTransitionRejectionSchema',
+    'TodoUpdateSchema',
+)
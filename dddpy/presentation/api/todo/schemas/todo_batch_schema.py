@@ -0,0 +1,79 @@
+"""Define request and response schemas for batched todo operations."""
+
+from typing import List, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+from dddpy.presentation.api.todo.schemas.todo_schema import TodoSchema
+
+MAX_BATCH_OPERATIONS = 100
+
+
+class TodoOperationSchema(BaseModel):
+    """Validate one operation of a batch.
+
+    ``update`` follows merge-patch rules: omitted members are left unchanged
+    and a null description removes it.
+    """
+
+    op: Literal['create', 'update', 'start', 'complete', 'delete'] = Field(
+        examples=['create']
+    )
+    id: UUID | None = Field(
+        default=None, examples=['123e4567-e89b-12d3-a456-426614174000']
+    )
+    title: str | None = Field(
+        default=None, min_length=1, max_length=100, examples=['Complete the project']
+    )
+    description: str | None = Field(
+        default=None,
+        max_length=1000,
+        examples=['Finish implementing the DDD architecture'],
+    )
+    version: int | None = Field(default=None, examples=[1])
+
+    @model_validator(mode='after')
+    def check_required_members(self) -> 'TodoOperationSchema':
+        """Require the members the operation cannot run without.
+
+        Raises:
+            ValueError: If create lacks a title or another operation lacks an id.
+        """
+        if self.op == 'create':
+            if self.title is None:
+                raise ValueError('A create operation requires a title')
+        elif self.id is None:
+            raise ValueError(f'A {self.op} operation requires an id')
+        return self
+
+
+class TodoBatchSchema(BaseModel):
+    """Validate a batch of todo operations run in one transaction.
+
+    In ``atomic`` mode the first failing operation rolls back the whole
+    batch; in ``independent`` mode the succeeded operations are committed.
+    """
+
+    mode: Literal['atomic', 'independent'] = Field(
+        default='atomic', examples=['atomic']
+    )
+    operations: List[TodoOperationSchema] = Field(
+        min_length=1, max_length=MAX_BATCH_OPERATIONS
+    )
+
+
+class TodoOperationResultSchema(BaseModel):
+    """Represent the outcome of one operation of a batch."""
+
+    outcome: str = Field(examples=['succeeded'])
+    status_code: int = Field(examples=[200])
+    todo: TodoSchema | None = None
+    detail: str | None = Field(default=None, examples=[None])
+
+
+class TodoBatchResultSchema(BaseModel):
+    """Represent the outcome of a batch."""
+
+    committed: bool = Field(examples=[True])
+    results: List[TodoOperationResultSchema]
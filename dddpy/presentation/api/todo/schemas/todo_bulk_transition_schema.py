@@ -0,0 +1,55 @@
+"""Define request and response schemas for bulk todo state transitions."""
+
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from dddpy.presentation.api.todo.schemas.todo_schema import TodoSchema
+from dddpy.usecase.todo import TodoTransitionReport
+
+MAX_BULK_TRANSITION_IDS = 500
+
+
+class TodoBulkTransitionSchema(BaseModel):
+    """Validate the identifiers of todos to transition together."""
+
+    ids: List[UUID] = Field(
+        min_length=1,
+        max_length=MAX_BULK_TRANSITION_IDS,
+        examples=[['123e4567-e89b-12d3-a456-426614174000']],
+    )
+
+
+class TodoTransitionRejectionSchema(BaseModel):
+    """Represent a todo whose current status forbids the transition."""
+
+    id: str = Field(examples=['123e4567-e89b-12d3-a456-426614174000'])
+    detail: str = Field(examples=['The Todo is already completed.'])
+
+
+class TodoBulkTransitionResultSchema(BaseModel):
+    """Represent the outcome of a bulk state transition."""
+
+    transitioned: List[TodoSchema]
+    not_found: List[str] = Field(examples=[['123e4567-e89b-12d3-a456-426614174000']])
+    rejected: List[TodoTransitionRejectionSchema]
+
+    @staticmethod
+    def from_report(report: TodoTransitionReport) -> 'TodoBulkTransitionResultSchema':
+        """Build a schema instance from a transition report.
+
+        Args:
+            report: Report returned by a bulk transition use case.
+
+        Returns:
+            TodoBulkTransitionResultSchema: Pydantic model ready for serialization.
+        """
+        return TodoBulkTransitionResultSchema(
+            transitioned=[TodoSchema.from_entity(todo) for todo in report.transitioned],
+            not_found=[str(todo_id) for todo_id in report.not_found],
+            rejected=[
+                TodoTransitionRejectionSchema(id=str(todo_id), detail=str(error))
+                for todo_id, error in report.rejected
+            ],
+        )
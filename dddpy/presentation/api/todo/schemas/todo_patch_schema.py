@@ -0,0 +1,33 @@
+"""Define request schema for partially updating todos."""
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class TodoPatchSchema(BaseModel):
+    """Validate a JSON Merge Patch (RFC 7396) document for a todo.
+
+    Members absent from the document leave the todo unchanged; use
+    ``model_fields_set`` to tell them apart from members set to null.
+    A null ``description`` removes the description.
+    """
+
+    title: str | None = Field(
+        default=None, min_length=1, max_length=100, examples=['Complete the project']
+    )
+    description: str | None = Field(
+        default=None,
+        max_length=1000,
+        examples=['Finish implementing the DDD architecture'],
+    )
+
+    @field_validator('title')
+    @classmethod
+    def title_cannot_be_removed(cls, value: str | None) -> str | None:
+        """Reject a null title, since every todo must have one.
+
+        Raises:
+            ValueError: If the patch sets the title to null.
+        """
+        if value is None:
+            raise ValueError('Title cannot be removed')
+        return value
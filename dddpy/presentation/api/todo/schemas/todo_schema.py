@@ -15,6 +15,7 @@ class TodoSchema(BaseModel):
     created_at: int = Field(examples=[1136214245000])
     updated_at: int = Field(examples=[1136214245000])
     completed_at: int | None = Field(examples=[1136214245000])
+    version: int = Field(examples=[1])
 
     class Config:
         """Configure ORM compatibility for the schema."""
@@ -36,9 +37,8 @@ class TodoSchema(BaseModel):
             title=todo.title.value if todo.title else '',
             description=todo.description.value if todo.description else '',
             status=todo.status.value,
-            created_at=int(todo.created_at.timestamp() * 1000),
-            updated_at=int(todo.updated_at.timestamp() * 1000),
-            completed_at=int(todo.completed_at.timestamp() * 1000)
-            if todo.completed_at
-            else None,
+            created_at=todo.created_at.value,
+            updated_at=todo.updated_at.value,
+            completed_at=todo.completed_at.value if todo.completed_at else None,
+            version=todo.version,
         )
@@ -1,25 +1,29 @@
 """This package provides use cases for Todo entity operations."""
 
-from dddpy.usecase.todo.create_todo_usecase import (
-    CreateTodoUseCase,
-    new_create_todo_usecase,
-)
-from dddpy.usecase.todo.start_todo_usecase import (
-    StartTodoUseCase,
-    new_start_todo_usecase,
-)
 from dddpy.usecase.todo.complete_todo_usecase import (
     CompleteTodoUseCase,
     new_complete_todo_usecase,
 )
-from dddpy.usecase.todo.update_todo_usecase import (
-    UpdateTodoUseCase,
-    new_update_todo_usecase,
+from dddpy.usecase.todo.complete_todos_usecase import (
+    CompleteTodosUseCase,
+    new_complete_todos_usecase,
+)
+from dddpy.usecase.todo.create_todo_usecase import (
+    CreateTodoUseCase,
+    new_create_todo_usecase,
 )
 from dddpy.usecase.todo.delete_todo_usecase import (
     DeleteTodoUseCase,
     new_delete_todo_usecase,
 )
+from dddpy.usecase.todo.execute_todo_batch_usecase import (
+    ExecuteTodoBatchUseCase,
+    TodoOperation,
+    TodoOperationKind,
+    TodoOperationOutcome,
+    TodoOperationResult,
+    new_execute_todo_batch_usecase,
+)
 from dddpy.usecase.todo.find_todo_by_id_usecase import (
     FindTodoByIdUseCase,
     new_find_todo_by_id_usecase,
@@ -28,20 +32,51 @@ from dddpy.usecase.todo.find_todos_usecase import (
     FindTodosUseCase,
     new_find_todos_usecase,
 )
+from dddpy.usecase.todo.single_flight import SingleFlight, SingleFlightStats
+from dddpy.usecase.todo.start_todo_usecase import (
+    StartTodoUseCase,
+    new_start_todo_usecase,
+)
+from dddpy.usecase.todo.start_todos_usecase import (
+    StartTodosUseCase,
+    new_start_todos_usecase,
+)
+from dddpy.usecase.todo.todo_event_publisher import TodoEventPublisher
+from dddpy.usecase.todo.todo_transition_report import TodoTransitionReport
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
+from dddpy.usecase.todo.update_todo_usecase import (
+    UpdateTodoUseCase,
+    new_update_todo_usecase,
+)
 
 __all__ = [
+    'SingleFlight',
+    'SingleFlightStats',
+    'TodoEventPublisher',
+    'TodoUnitOfWork',
+    'TodoTransitionReport',
     'CreateTodoUseCase',
     'StartTodoUseCase',
     'CompleteTodoUseCase',
+    'StartTodosUseCase',
+    'CompleteTodosUseCase',
     'UpdateTodoUseCase',
     'DeleteTodoUseCase',
     'FindTodoByIdUseCase',
     'FindTodosUseCase',
+    'ExecuteTodoBatchUseCase',
+    'TodoOperation',
+    'TodoOperationKind',
+    'TodoOperationOutcome',
+    'TodoOperationResult',
     'new_create_todo_usecase',
     'new_start_todo_usecase',
     'new_complete_todo_usecase',
+    'new_start_todos_usecase',
+    'new_complete_todos_usecase',
     'new_update_todo_usecase',
     'new_delete_todo_usecase',
     'new_find_todo_by_id_usecase',
     'new_find_todos_usecase',
+    'new_execute_todo_batch_usecase',
 ]
@@ -2,14 +2,16 @@
 
 from abc import ABC, abstractmethod
 
+from dddpy.domain.todo.clocks import Clock
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind
 from dddpy.domain.todo.exceptions import (
     TodoAlreadyCompletedError,
     TodoNotFoundError,
     TodoNotStartedError,
 )
-from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoId, TodoStatus
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
 
 
 class CompleteTodoUseCase(ABC):
@@ -28,18 +30,23 @@ class CompleteTodoUseCase(ABC):
 
 
 class CompleteTodoUseCaseImpl(CompleteTodoUseCase):
-    """Concrete todo completion use case backed by a repository."""
+    """Concrete todo completion use case backed by a unit of work."""
 
-    def __init__(self, todo_repository: TodoRepository):
-        """Store the repository dependency.
+    def __init__(self, unit_of_work: TodoUnitOfWork, clock: Clock):
+        """Store the unit of work and clock dependencies.
 
         Args:
-            todo_repository: Repository used to persist todo updates.
+            unit_of_work: Unit of work used to persist todo updates.
+            clock: Clock used to timestamp changes.
         """
-        self.todo_repository = todo_repository
+        self.unit_of_work = unit_of_work
+        self.clock = clock
 
     def execute(self, todo_id: TodoId) -> Todo:
-        """Complete a todo after validating its lifecycle state.
+        """Complete a todo with a single conditional repository update.
+
+        The current state is only read when the update does not apply, to
+        report why the todo could not be completed.
 
         Args:
             todo_id: Identifier of the todo to complete.
@@ -52,29 +59,45 @@ class CompleteTodoUseCaseImpl(CompleteTodoUseCase):
         Returns:
             Todo: Persisted todo marked as completed.
         """
-        todo = self.todo_repository.find_by_id(todo_id)
-
-        if todo is None:
+        todos = self.unit_of_work.todos
+        todo = todos.complete(todo_id, self.clock.now())
+        if todo is not None:
+            self.unit_of_work.record(
+                TodoEvent(TodoEventKind.COMPLETED, todo_id, todo.snapshot())
+            )
+            self.unit_of_work.commit()
+            return todo
+
+        current = todos.find_by_id(todo_id)
+        if current is None:
             raise TodoNotFoundError
+        raise complete_rejection(current.status)
+
 
-        if todo.status == TodoStatus.NOT_STARTED:
-            raise TodoNotStartedError
+def complete_rejection(status: TodoStatus) -> Exception:
+    """Return the lifecycle error for completing a todo in the given status.
 
-        if todo.is_completed:
-            raise TodoAlreadyCompletedError
+    Args:
+        status: Current status of a todo that could not be completed.
 
-        todo.complete()
-        self.todo_repository.save(todo)
-        return todo
+    Returns:
+        Exception: Error describing why the todo cannot be completed.
+    """
+    if status == TodoStatus.NOT_STARTED:
+        return TodoNotStartedError()
+    return TodoAlreadyCompletedError()
 
 
-def new_complete_todo_usecase(todo_repository: TodoRepository) -> CompleteTodoUseCase:
+def new_complete_todo_usecase(
+    unit_of_work: TodoUnitOfWork, clock: Clock
+) -> CompleteTodoUseCase:
     """Instantiate the todo completion use case.
 
     Args:
-        todo_repository: Repository used to persist todo updates.
+        unit_of_work: Unit of work used to persist todo updates.
+        clock: Clock used to timestamp changes.
 
     Returns:
         CompleteTodoUseCase: Configured use case implementation.
     """
-    return CompleteTodoUseCaseImpl(todo_repository)
+    return CompleteTodoUseCaseImpl(unit_of_work, clock)
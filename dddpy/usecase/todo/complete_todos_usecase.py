@@ -0,0 +1,61 @@
+"""Provide use case implementations for completing many todos at once."""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from dddpy.domain.todo.clocks import Clock
+from dddpy.domain.todo.events import TodoEventKind
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.usecase.todo.complete_todo_usecase import complete_rejection
+from dddpy.usecase.todo.todo_transition_report import TodoTransitionReport
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
+from dddpy.usecase.todo.transition_todos_usecase import TransitionTodosUseCaseImpl
+
+
+class CompleteTodosUseCase(ABC):
+    """Define the application boundary for completing todos in bulk."""
+
+    @abstractmethod
+    def execute(self, todo_ids: Sequence[TodoId]) -> TodoTransitionReport:
+        """Complete every todo identified by the provided IDs.
+
+        Args:
+            todo_ids: Identifiers of the todos to complete.
+
+        Returns:
+            TodoTransitionReport: Todos completed, not found and rejected.
+        """
+
+
+class CompleteTodosUseCaseImpl(TransitionTodosUseCaseImpl, CompleteTodosUseCase):
+    """Concrete bulk todo complete use case backed by a unit of work."""
+
+    def __init__(self, unit_of_work: TodoUnitOfWork, clock: Clock):
+        """Store the unit of work and clock dependencies.
+
+        Args:
+            unit_of_work: Unit of work used to persist todo updates.
+            clock: Clock used to timestamp changes.
+        """
+        super().__init__(
+            unit_of_work,
+            clock,
+            lambda todos, ids, now: todos.complete_many(ids, now),
+            TodoEventKind.COMPLETED,
+            complete_rejection,
+        )
+
+
+def new_complete_todos_usecase(
+    unit_of_work: TodoUnitOfWork, clock: Clock
+) -> CompleteTodosUseCase:
+    """Instantiate the bulk todo complete use case.
+
+    Args:
+        unit_of_work: Unit of work used to persist todo updates.
+        clock: Clock used to timestamp changes.
+
+    Returns:
+        CompleteTodosUseCase: Configured use case implementation.
+    """
+    return CompleteTodosUseCaseImpl(unit_of_work, clock)
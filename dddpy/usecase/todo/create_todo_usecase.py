@@ -3,9 +3,10 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from dddpy.domain.todo.clocks import Clock
 from dddpy.domain.todo.entities import Todo
-from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoDescription, TodoTitle
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
 
 
 class CreateTodoUseCase(ABC):
@@ -27,15 +28,17 @@ class CreateTodoUseCase(ABC):
 
 
 class CreateTodoUseCaseImpl(CreateTodoUseCase):
-    """Concrete todo creation use case backed by a repository."""
+    """Concrete todo creation use case backed by a unit of work."""
 
-    def __init__(self, todo_repository: TodoRepository):
-        """Store the repository dependency.
+    def __init__(self, unit_of_work: TodoUnitOfWork, clock: Clock):
+        """Store the unit of work and clock dependencies.
 
         Args:
-            todo_repository: Repository used to persist todos.
+            unit_of_work: Unit of work used to persist todos.
+            clock: Clock used to timestamp changes.
         """
-        self.todo_repository = todo_repository
+        self.unit_of_work = unit_of_work
+        self.clock = clock
 
     def execute(
         self, title: TodoTitle, description: Optional[TodoDescription] = None
@@ -49,18 +52,22 @@ class CreateTodoUseCaseImpl(CreateTodoUseCase):
         Returns:
             Todo: Newly created todo entity.
         """
-        todo = Todo.create(title=title, description=description)
-        self.todo_repository.save(todo)
+        todo = Todo.create(title=title, description=description, now=self.clock.now())
+        self.unit_of_work.todos.save(todo)
+        self.unit_of_work.commit()
         return todo
 
 
-def new_create_todo_usecase(todo_repository: TodoRepository) -> CreateTodoUseCase:
+def new_create_todo_usecase(
+    unit_of_work: TodoUnitOfWork, clock: Clock
+) -> CreateTodoUseCase:
     """Instantiate the todo creation use case.
 
     Args:
-        todo_repository: Repository used to persist new todos.
+        unit_of_work: Unit of work used to persist new todos.
+        clock: Clock used to timestamp changes.
 
     Returns:
         CreateTodoUseCase: Configured use case implementation.
     """
-    return CreateTodoUseCaseImpl(todo_repository)
+    return CreateTodoUseCaseImpl(unit_of_work, clock)
@@ -2,9 +2,10 @@
 
 from abc import ABC, abstractmethod
 
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind
 from dddpy.domain.todo.exceptions import TodoNotFoundError
-from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoId
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
 
 
 class DeleteTodoUseCase(ABC):
@@ -20,18 +21,18 @@ class DeleteTodoUseCase(ABC):
 
 
 class DeleteTodoUseCaseImpl(DeleteTodoUseCase):
-    """Concrete todo deletion use case backed by a repository."""
+    """Concrete todo deletion use case backed by a unit of work."""
 
-    def __init__(self, todo_repository: TodoRepository):
-        """Store the repository dependency.
+    def __init__(self, unit_of_work: TodoUnitOfWork):
+        """Store the unit of work dependency.
 
         Args:
-            todo_repository: Repository responsible for todo persistence.
+            unit_of_work: Unit of work responsible for todo persistence.
         """
-        self.todo_repository = todo_repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, todo_id: TodoId) -> None:
-        """Delete a todo after ensuring it exists.
+        """Delete a todo, reporting when none was removed.
 
         Args:
             todo_id: Identifier of the todo to delete.
@@ -39,21 +40,20 @@ class DeleteTodoUseCaseImpl(DeleteTodoUseCase):
         Raises:
             TodoNotFoundError: If no todo matches the provided identifier.
         """
-        todo = self.todo_repository.find_by_id(todo_id)
-
-        if todo is None:
+        if not self.unit_of_work.todos.delete(todo_id):
             raise TodoNotFoundError
 
-        self.todo_repository.delete(todo_id)
+        self.unit_of_work.record(TodoEvent(TodoEventKind.DELETED, todo_id))
+        self.unit_of_work.commit()
 
 
-def new_delete_todo_usecase(todo_repository: TodoRepository) -> DeleteTodoUseCase:
+def new_delete_todo_usecase(unit_of_work: TodoUnitOfWork) -> DeleteTodoUseCase:
     """Instantiate the todo deletion use case.
 
     Args:
-        todo_repository: Repository responsible for todo persistence.
+        unit_of_work: Unit of work responsible for todo persistence.
 
     Returns:
         DeleteTodoUseCase: Configured use case implementation.
     """
-    return DeleteTodoUseCaseImpl(todo_repository)
+    return DeleteTodoUseCaseImpl(unit_of_work)
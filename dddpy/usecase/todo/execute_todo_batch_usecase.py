@@ -0,0 +1,261 @@
+"""Provide use case implementations for running many todo operations at once."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence
+
+from dddpy.domain.todo.clocks import Clock
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.events import TodoEvent
+from dddpy.domain.todo.exceptions import (
+    TodoAlreadyCompletedError,
+    TodoAlreadyStartedError,
+    TodoNotFoundError,
+    TodoNotStartedError,
+    TodoVersionConflictError,
+)
+from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from dddpy.usecase.todo.complete_todo_usecase import CompleteTodoUseCaseImpl
+from dddpy.usecase.todo.create_todo_usecase import CreateTodoUseCaseImpl
+from dddpy.usecase.todo.delete_todo_usecase import DeleteTodoUseCaseImpl
+from dddpy.usecase.todo.start_todo_usecase import StartTodoUseCaseImpl
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
+from dddpy.usecase.todo.update_todo_usecase import UpdateTodoUseCaseImpl
+
+if TYPE_CHECKING:
+    from dddpy.domain.todo.repositories import TodoRepository
+
+TODO_OPERATION_ERRORS = (
+    TodoAlreadyCompletedError,
+    TodoAlreadyStartedError,
+    TodoNotFoundError,
+    TodoNotStartedError,
+    TodoVersionConflictError,
+)
+
+
+class TodoOperationKind(Enum):
+    """Enumerate the commands a batch may contain."""
+
+    CREATE = 'create'
+    UPDATE = 'update'
+    START = 'start'
+    COMPLETE = 'complete'
+    DELETE = 'delete'
+
+
+class TodoOperationOutcome(Enum):
+    """Enumerate what happened to an operation of a batch."""
+
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    ROLLED_BACK = 'rolled_back'
+    SKIPPED = 'skipped'
+
+
+@dataclass(frozen=True)
+class TodoOperation:
+    """Describe one command of a batch.
+
+    Attributes:
+        kind: Command to run.
+        todo_id: Target todo; required by every kind except create.
+        title: Title for create, or replacement title for update.
+        description: Description for create, or replacement for update.
+        expected_version: Version an update is based on, if known.
+        clear_description: Remove the description on update.
+    """
+
+    kind: TodoOperationKind
+    todo_id: Optional[TodoId] = None
+    title: Optional[TodoTitle] = None
+    description: Optional[TodoDescription] = None
+    expected_version: Optional[int] = None
+    clear_description: bool = False
+
+
+@dataclass(frozen=True)
+class TodoOperationResult:
+    """Report the outcome of one operation of a batch.
+
+    Attributes:
+        outcome: What happened to the operation.
+        todo: Resulting todo for succeeded create, update, start and complete.
+        error: Domain error raised by a failed operation.
+    """
+
+    outcome: TodoOperationOutcome
+    todo: Optional[Todo] = None
+    error: Optional[Exception] = None
+
+
+class ExecuteTodoBatchUseCase(ABC):
+    """Define the application boundary for running todo operations in bulk."""
+
+    @abstractmethod
+    def execute(
+        self, operations: Sequence[TodoOperation], atomic: bool = True
+    ) -> List[TodoOperationResult]:
+        """Run the operations in order within a single transaction.
+
+        Args:
+            operations: Commands to run, in order.
+            atomic: Roll back every operation when one fails, instead of
+                committing the ones that succeeded.
+
+        Returns:
+            List[TodoOperationResult]: One result per operation, in order.
+        """
+
+
+class _DeferredUnitOfWork(TodoUnitOfWork):
+    """Let the single-todo use cases write without ending the transaction.
+
+    Events recorded by an operation reach the batch's unit of work only once
+    the operation's writes are flushed, so failed operations publish nothing.
+    """
+
+    def __init__(self, unit_of_work: TodoUnitOfWork):
+        self.unit_of_work = unit_of_work
+        self.todos: 'TodoRepository' = unit_of_work.todos
+        self._events: List[TodoEvent] = []
+
+    def record(self, event: TodoEvent) -> None:
+        self._events.append(event)
+
+    def flush(self) -> None:
+        self.unit_of_work.flush()
+
+    def commit(self) -> None:
+        events, self._events = self._events, []
+        self.unit_of_work.flush()
+        for event in events:
+            self.unit_of_work.record(event)
+
+    def rollback(self) -> None:
+        self.unit_of_work.rollback()
+
+
+class ExecuteTodoBatchUseCaseImpl(ExecuteTodoBatchUseCase):
+    """Run batches through the single-todo use cases sharing one transaction."""
+
+    def __init__(self, unit_of_work: TodoUnitOfWork, clock: Clock):
+        """Store the unit of work and clock dependencies.
+
+        Args:
+            unit_of_work: Unit of work committed once per batch.
+            clock: Clock used to timestamp changes.
+        """
+        self.unit_of_work = unit_of_work
+        self.clock = clock
+
+    def execute(
+        self, operations: Sequence[TodoOperation], atomic: bool = True
+    ) -> List[TodoOperationResult]:
+        """Run the operations in order and commit once at the end.
+
+        Each operation writes at most one row with a single statement, and a
+        failing operation raises before or instead of writing, so in
+        non-atomic mode the succeeded operations can be committed alongside
+        failed ones without savepoints.
+
+        Args:
+            operations: Commands to run, in order.
+            atomic: Roll back every operation when one fails, instead of
+                committing the ones that succeeded.
+
+        Raises:
+            ValueError: If an operation lacks the todo identifier it needs.
+
+        Returns:
+            List[TodoOperationResult]: One result per operation, in order.
+        """
+        run = self._runners(_DeferredUnitOfWork(self.unit_of_work))
+        results: List[TodoOperationResult] = []
+        try:
+            for operation in operations:
+                try:
+                    todo = run[operation.kind](operation)
+                except TODO_OPERATION_ERRORS as e:
+                    results.append(
+                        TodoOperationResult(TodoOperationOutcome.FAILED, error=e)
+                    )
+                    if atomic:
+                        self.unit_of_work.rollback()
+                        return _abort(results, len(operations))
+                    continue
+                results.append(
+                    TodoOperationResult(TodoOperationOutcome.SUCCEEDED, todo=todo)
+                )
+            self.unit_of_work.commit()
+        except Exception:
+            self.unit_of_work.rollback()
+            raise
+        return results
+
+    def _runners(
+        self, unit_of_work: TodoUnitOfWork
+    ) -> Dict[TodoOperationKind, Callable[[TodoOperation], Optional[Todo]]]:
+        create = CreateTodoUseCaseImpl(unit_of_work, self.clock)
+        update = UpdateTodoUseCaseImpl(unit_of_work, self.clock)
+        start = StartTodoUseCaseImpl(unit_of_work, self.clock)
+        complete = CompleteTodoUseCaseImpl(unit_of_work, self.clock)
+        delete = DeleteTodoUseCaseImpl(unit_of_work)
+
+        def run_create(operation: TodoOperation) -> Optional[Todo]:
+            if operation.title is None:
+                raise ValueError('A create operation requires a title')
+            return create.execute(operation.title, operation.description)
+
+        def run_update(operation: TodoOperation) -> Optional[Todo]:
+            return update.execute(
+                _target(operation),
+                operation.title,
+                operation.description,
+                operation.expected_version,
+                clear_description=operation.clear_description,
+            )
+
+        def run_delete(operation: TodoOperation) -> Optional[Todo]:
+            delete.execute(_target(operation))
+            return None
+
+        return {
+            TodoOperationKind.CREATE: run_create,
+            TodoOperationKind.UPDATE: run_update,
+            TodoOperationKind.START: lambda op: start.execute(_target(op)),
+            TodoOperationKind.COMPLETE: lambda op: complete.execute(_target(op)),
+            TodoOperationKind.DELETE: run_delete,
+        }
+
+
+def _target(operation: TodoOperation) -> TodoId:
+    if operation.todo_id is None:
+        raise ValueError(f'A {operation.kind.value} operation requires a todo id')
+    return operation.todo_id
+
+
+def _abort(results: List[TodoOperationResult], total: int) -> List[TodoOperationResult]:
+    rolled_back = TodoOperationResult(TodoOperationOutcome.ROLLED_BACK)
+    skipped = TodoOperationResult(TodoOperationOutcome.SKIPPED)
+    return (
+        [rolled_back] * (len(results) - 1)
+        + results[-1:]
+        + [skipped] * (total - len(results))
+    )
+
+
+def new_execute_todo_batch_usecase(
+    unit_of_work: TodoUnitOfWork, clock: Clock
+) -> ExecuteTodoBatchUseCase:
+    """Instantiate the batch todo use case.
+
+    Args:
+        unit_of_work: Unit of work committed once per batch.
+        clock: Clock used to timestamp changes.
+
+    Returns:
+        ExecuteTodoBatchUseCase: Configured use case implementation.
+    """
+    return ExecuteTodoBatchUseCaseImpl(unit_of_work, clock)
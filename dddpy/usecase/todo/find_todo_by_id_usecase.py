@@ -1,11 +1,13 @@
 """Provide use case implementations for retrieving todos by ID."""
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.exceptions import TodoNotFoundError
 from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoId
+from dddpy.usecase.todo.single_flight import SingleFlight
 
 
 class FindTodoByIdUseCase(ABC):
@@ -52,13 +54,53 @@ class FindTodoByIdUseCaseImpl(FindTodoByIdUseCase):
         return todo
 
 
-def new_find_todo_by_id_usecase(todo_repository: TodoRepository) -> FindTodoByIdUseCase:
+class SingleFlightFindTodoByIdUseCase(FindTodoByIdUseCase):
+    """Share one lookup among concurrent requests for the same todo."""
+
+    def __init__(self, usecase: FindTodoByIdUseCase, single_flight: SingleFlight[Todo]):
+        """Store the wrapped use case and the process-wide single-flight group.
+
+        Args:
+            usecase: Use case run when no lookup for the todo is in flight.
+            single_flight: Group shared by every request.
+        """
+        self.usecase = usecase
+        self.single_flight = single_flight
+
+    def execute(self, todo_id: TodoId) -> Todo:
+        """Retrieve a todo, joining a lookup already running for it.
+
+        The shared todo belongs to the session of the request that loaded
+        it, so every caller receives its own copy.
+
+        Args:
+            todo_id: Identifier of the todo to retrieve.
+
+        Raises:
+            TodoNotFoundError: If the todo cannot be located.
+
+        Returns:
+            Todo: Copy of the matching todo entity.
+        """
+        return self.single_flight.do(
+            todo_id, lambda: self.usecase.execute(todo_id)
+        ).copy()
+
+
+def new_find_todo_by_id_usecase(
+    todo_repository: TodoRepository,
+    single_flight: Optional[SingleFlight[Todo]] = None,
+) -> FindTodoByIdUseCase:
     """Instantiate the todo lookup by ID use case.
 
     Args:
         todo_repository: Repository used to retrieve todos.
+        single_flight: Group coalescing concurrent lookups of the same todo.
 
     Returns:
         FindTodoByIdUseCase: Configured use case implementation.
     """
-    return FindTodoByIdUseCaseImpl(todo_repository)
+    usecase = FindTodoByIdUseCaseImpl(todo_repository)
+    if single_flight is None:
+        return usecase
+    return SingleFlightFindTodoByIdUseCase(usecase, single_flight)
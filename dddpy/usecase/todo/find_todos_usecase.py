@@ -1,10 +1,11 @@
 """Provide use case implementations for listing todos."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.usecase.todo.single_flight import SingleFlight
 
 
 class FindTodosUseCase(ABC):
@@ -35,13 +36,47 @@ class FindTodosUseCaseImpl(FindTodosUseCase):
         return self.todo_repository.find_all()
 
 
-def new_find_todos_usecase(todo_repository: TodoRepository) -> FindTodosUseCase:
+class SingleFlightFindTodosUseCase(FindTodosUseCase):
+    """Share one listing query among concurrent requests."""
+
+    def __init__(
+        self, usecase: FindTodosUseCase, single_flight: SingleFlight[List[Todo]]
+    ):
+        """Store the wrapped use case and the process-wide single-flight group.
+
+        Args:
+            usecase: Use case run when no listing is in flight.
+            single_flight: Group shared by every request.
+        """
+        self.usecase = usecase
+        self.single_flight = single_flight
+
+    def execute(self) -> List[Todo]:
+        """Return copies of all todos, joining a listing already running.
+
+        The shared todos belong to the session of the request that loaded
+        them, so every caller receives its own copies.
+        """
+        return [
+            todo.copy()
+            for todo in self.single_flight.do('find_all', self.usecase.execute)
+        ]
+
+
+def new_find_todos_usecase(
+    todo_repository: TodoRepository,
+    single_flight: Optional[SingleFlight[List[Todo]]] = None,
+) -> FindTodosUseCase:
     """Instantiate the todo listing use case.
 
     Args:
         todo_repository: Repository used to retrieve todos.
+        single_flight: Group coalescing concurrent listings.
 
     Returns:
         FindTodosUseCase: Configured use case implementation.
     """
-    return FindTodosUseCaseImpl(todo_repository)
+    usecase = FindTodosUseCaseImpl(todo_repository)
+    if single_flight is None:
+        return usecase
+    return SingleFlightFindTodosUseCase(usecase, single_flight)
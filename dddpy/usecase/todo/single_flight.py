@@ -0,0 +1,115 @@
+"""Coalesce concurrent identical calls into one execution."""
+
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Snapshot of a single-flight group's counters.
+
+    Attributes:
+        calls: Calls made through the group.
+        executions: Calls that ran the underlying function.
+        collapsed: Calls that received another call's result instead.
+        timeouts: Calls that stopped waiting and ran the function themselves.
+    """
+
+    calls: int
+    executions: int
+    collapsed: int
+    timeouts: int
+
+
+class _Call(Generic[T]):
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-flight execution among concurrent calls with the same key.
+
+    The first call for a key runs the function; calls for the same key made
+    while it runs wait and receive its result or a copy of its exception. A
+    waiting call that exceeds the timeout runs the function itself, so a
+    slow execution never blocks its followers for longer than the timeout.
+
+    Every caller receives the same result object, so a mutable result must
+    be copied before it is changed.
+    """
+
+    def __init__(self, timeout_seconds: float = 5.0):
+        """Configure how long followers wait for the running call.
+
+        Args:
+            timeout_seconds: Longest time a call waits for a shared result.
+        """
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call[T]] = {}
+        self._count = 0
+        self._executions = 0
+        self._collapsed = 0
+        self._timeouts = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call with the same key is already running.
+
+        Args:
+            key: Identity of the call; equal keys share one execution.
+            fn: Function producing the result.
+
+        Returns:
+            T: Result of this or the shared execution.
+        """
+        with self._lock:
+            self._count += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+
+        if leader:
+            return self._run(key, call, fn)
+
+        if not call.done.wait(self.timeout_seconds):
+            with self._lock:
+                self._timeouts += 1
+                self._executions += 1
+            return fn()
+        with self._lock:
+            self._collapsed += 1
+        if call.error is not None:
+            # Each follower raises its own exception, so the traceback it
+            # gathers while propagating is never mixed with another thread's.
+            raise copy.copy(call.error) from call.error
+        return call.result  # type: ignore[return-value]
+
+    def stats(self) -> SingleFlightStats:
+        """Return a snapshot of the group's counters."""
+        with self._lock:
+            return SingleFlightStats(
+                self._count, self._executions, self._collapsed, self._timeouts
+            )
+
+    def _run(self, key: Hashable, call: _Call[T], fn: Callable[[], T]) -> T:
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            return call.result
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
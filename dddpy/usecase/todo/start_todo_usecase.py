@@ -2,14 +2,16 @@
 
 from abc import ABC, abstractmethod
 
+from dddpy.domain.todo.clocks import Clock
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind
 from dddpy.domain.todo.exceptions import (
     TodoAlreadyCompletedError,
     TodoAlreadyStartedError,
     TodoNotFoundError,
 )
-from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoId, TodoStatus
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
 
 
 class StartTodoUseCase(ABC):
@@ -28,18 +30,23 @@ class StartTodoUseCase(ABC):
 
 
 class StartTodoUseCaseImpl(StartTodoUseCase):
-    """Concrete todo start use case backed by a repository."""
+    """Concrete todo start use case backed by a unit of work."""
 
-    def __init__(self, todo_repository: TodoRepository):
-        """Store the repository dependency.
+    def __init__(self, unit_of_work: TodoUnitOfWork, clock: Clock):
+        """Store the unit of work and clock dependencies.
 
         Args:
-            todo_repository: Repository used to persist todo updates.
+            unit_of_work: Unit of work used to persist todo updates.
+            clock: Clock used to timestamp changes.
         """
-        self.todo_repository = todo_repository
+        self.unit_of_work = unit_of_work
+        self.clock = clock
 
     def execute(self, todo_id: TodoId) -> Todo:
-        """Start a todo after validating its current lifecycle state.
+        """Start a todo with a single conditional repository update.
+
+        The current state is only read when the update does not apply, to
+        report why the todo could not be started.
 
         Args:
             todo_id: Identifier of the todo to start.
@@ -52,29 +59,45 @@ class StartTodoUseCaseImpl(StartTodoUseCase):
         Returns:
             Todo: Persisted todo marked as in progress.
         """
-        todo = self.todo_repository.find_by_id(todo_id)
-
-        if todo is None:
+        todos = self.unit_of_work.todos
+        todo = todos.start(todo_id, self.clock.now())
+        if todo is not None:
+            self.unit_of_work.record(
+                TodoEvent(TodoEventKind.STARTED, todo_id, todo.snapshot())
+            )
+            self.unit_of_work.commit()
+            return todo
+
+        current = todos.find_by_id(todo_id)
+        if current is None:
             raise TodoNotFoundError
+        raise start_rejection(current.status)
+
 
-        if todo.is_completed:
-            raise TodoAlreadyCompletedError
+def start_rejection(status: TodoStatus) -> Exception:
+    """Return the lifecycle error for starting a todo in the given status.
 
-        if todo.status == TodoStatus.IN_PROGRESS:
-            raise TodoAlreadyStartedError
+    Args:
+        status: Current status of a todo that could not be started.
 
-        todo.start()
-        self.todo_repository.save(todo)
-        return todo
+    Returns:
+        Exception: Error describing why the todo cannot be started.
+    """
+    if status == TodoStatus.COMPLETED:
+        return TodoAlreadyCompletedError()
+    return TodoAlreadyStartedError()
 
 
-def new_start_todo_usecase(todo_repository: TodoRepository) -> StartTodoUseCase:
+def new_start_todo_usecase(
+    unit_of_work: TodoUnitOfWork, clock: Clock
+) -> StartTodoUseCase:
     """Instantiate the todo start use case.
 
     Args:
-        todo_repository: Repository used to persist todo updates.
+        unit_of_work: Unit of work used to persist todo updates.
+        clock: Clock used to timestamp changes.
 
     Returns:
         StartTodoUseCase: Configured use case implementation.
     """
-    return StartTodoUseCaseImpl(todo_repository)
+    return StartTodoUseCaseImpl(unit_of_work, clock)
@@ -0,0 +1,61 @@
+"""Provide use case implementations for starting many todos at once."""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from dddpy.domain.todo.clocks import Clock
+from dddpy.domain.todo.events import TodoEventKind
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.usecase.todo.start_todo_usecase import start_rejection
+from dddpy.usecase.todo.todo_transition_report import TodoTransitionReport
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
+from dddpy.usecase.todo.transition_todos_usecase import TransitionTodosUseCaseImpl
+
+
+class StartTodosUseCase(ABC):
+    """Define the application boundary for starting todos in bulk."""
+
+    @abstractmethod
+    def execute(self, todo_ids: Sequence[TodoId]) -> TodoTransitionReport:
+        """Start every todo identified by the provided IDs.
+
+        Args:
+            todo_ids: Identifiers of the todos to start.
+
+        Returns:
+            TodoTransitionReport: Todos started, not found and rejected.
+        """
+
+
+class StartTodosUseCaseImpl(TransitionTodosUseCaseImpl, StartTodosUseCase):
+    """Concrete bulk todo start use case backed by a unit of work."""
+
+    def __init__(self, unit_of_work: TodoUnitOfWork, clock: Clock):
+        """Store the unit of work and clock dependencies.
+
+        Args:
+            unit_of_work: Unit of work used to persist todo updates.
+            clock: Clock used to timestamp changes.
+        """
+        super().__init__(
+            unit_of_work,
+            clock,
+            lambda todos, ids, now: todos.start_many(ids, now),
+            TodoEventKind.STARTED,
+            start_rejection,
+        )
+
+
+def new_start_todos_usecase(
+    unit_of_work: TodoUnitOfWork, clock: Clock
+) -> StartTodosUseCase:
+    """Instantiate the bulk todo start use case.
+
+    Args:
+        unit_of_work: Unit of work used to persist todo updates.
+        clock: Clock used to timestamp changes.
+
+    Returns:
+        StartTodosUseCase: Configured use case implementation.
+    """
+    return StartTodosUseCaseImpl(unit_of_work, clock)
@@ -0,0 +1,18 @@
+"""Define the port through which committed todo changes are announced."""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from dddpy.domain.todo.events import TodoEvent
+
+
+class TodoEventPublisher(ABC):
+    """Announce todo changes once the transaction making them has committed."""
+
+    @abstractmethod
+    def publish(self, events: Sequence[TodoEvent]) -> None:
+        """Hand committed events to their subscribers without blocking.
+
+        Args:
+            events: Events of one transaction, in the order they were recorded.
+        """
@@ -0,0 +1,52 @@
+"""Define the report returned by bulk todo state transitions."""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus
+
+
+@dataclass
+class TodoTransitionReport:
+    """Report which todos of a bulk transition moved and why others did not.
+
+    Attributes:
+        transitioned: Todos moved to the new status, in request order.
+        not_found: Identifiers that match no todo.
+        rejected: Identifiers whose current status forbids the transition,
+            with the lifecycle error a single-todo transition would raise.
+    """
+
+    transitioned: List[Todo] = field(default_factory=list)
+    not_found: List[TodoId] = field(default_factory=list)
+    rejected: List[Tuple[TodoId, Exception]] = field(default_factory=list)
+
+    @staticmethod
+    def collect(
+        todo_ids: Sequence[TodoId],
+        transitioned: Sequence[Todo],
+        statuses: Dict[TodoId, TodoStatus],
+        rejection: Callable[[TodoStatus], Exception],
+    ) -> 'TodoTransitionReport':
+        """Build a report from the outcome of a set-based transition.
+
+        Args:
+            todo_ids: Requested identifiers, without duplicates.
+            transitioned: Todos the transition applied to.
+            statuses: Current status of the requested todos it did not apply to.
+            rejection: Lifecycle rule mapping a status to the error it causes.
+
+        Returns:
+            TodoTransitionReport: Report ordered like ``todo_ids``.
+        """
+        report = TodoTransitionReport()
+        moved = {todo.id: todo for todo in transitioned}
+        for todo_id in todo_ids:
+            if todo_id in moved:
+                report.transitioned.append(moved[todo_id])
+            elif todo_id in statuses:
+                report.rejected.append((todo_id, rejection(statuses[todo_id])))
+            else:
+                report.not_found.append(todo_id)
+        return report
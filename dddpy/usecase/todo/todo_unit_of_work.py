@@ -0,0 +1,32 @@
+"""Define the unit of work boundary used by todo use cases."""
+
+from abc import ABC, abstractmethod
+
+from dddpy.domain.todo.events import TodoEvent
+from dddpy.domain.todo.repositories import TodoRepository
+
+
+class TodoUnitOfWork(ABC):
+    """Group the todo changes made by one use case into a single transaction.
+
+    Attributes:
+        todos: Repository whose loaded todos are tracked by this unit of work.
+    """
+
+    todos: TodoRepository
+
+    @abstractmethod
+    def record(self, event: TodoEvent) -> None:
+        """Queue an event to be published once the transaction commits."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Write every pending change in one batch without committing."""
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Write every pending change, commit, then publish recorded events."""
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard every pending change and event and roll back the transaction."""
@@ -0,0 +1,71 @@
+"""Provide the shared implementation of bulk todo state transitions."""
+
+from typing import Callable, List, Sequence
+
+from dddpy.domain.todo.clocks import Clock
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTimestamp
+from dddpy.usecase.todo.todo_transition_report import TodoTransitionReport
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
+
+TransitionMany = Callable[[TodoRepository, Sequence[TodoId], TodoTimestamp], List[Todo]]
+
+
+class TransitionTodosUseCaseImpl:
+    """Move many todos to a new status with one set-based update.
+
+    The transition is given as the repository call that applies it, the
+    event recorded for each moved todo and the lifecycle rule explaining
+    why a todo in another status was left alone.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: TodoUnitOfWork,
+        clock: Clock,
+        transition: TransitionMany,
+        event_kind: TodoEventKind,
+        rejection: Callable[[TodoStatus], Exception],
+    ):
+        """Store the dependencies and the transition to apply.
+
+        Args:
+            unit_of_work: Unit of work used to persist todo updates.
+            clock: Clock used to timestamp changes.
+            transition: Repository call moving the eligible todos at once.
+            event_kind: Kind of the event recorded for each moved todo.
+            rejection: Lifecycle rule mapping a status to the error it causes.
+        """
+        self.unit_of_work = unit_of_work
+        self.clock = clock
+        self.transition = transition
+        self.event_kind = event_kind
+        self.rejection = rejection
+
+    def execute(self, todo_ids: Sequence[TodoId]) -> TodoTransitionReport:
+        """Apply the transition with one set-based update and report the outcome.
+
+        Every eligible todo is moved by a single repository update. Only the
+        statuses of the remaining todos are read, to report each with the
+        error a single-todo transition would raise.
+
+        Args:
+            todo_ids: Identifiers of the todos to move; duplicates are ignored.
+
+        Returns:
+            TodoTransitionReport: Todos moved, not found and rejected.
+        """
+        ids = list(dict.fromkeys(todo_ids))
+        todos = self.unit_of_work.todos
+        transitioned = self.transition(todos, ids, self.clock.now())
+        moved = {todo.id for todo in transitioned}
+        remaining = [todo_id for todo_id in ids if todo_id not in moved]
+        statuses = todos.find_statuses(remaining) if remaining else {}
+        for todo in transitioned:
+            self.unit_of_work.record(
+                TodoEvent(self.event_kind, todo.id, todo.snapshot())
+            )
+        self.unit_of_work.commit()
+        return TodoTransitionReport.collect(ids, transitioned, statuses, self.rejection)
@@ -3,10 +3,14 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from dddpy.domain.todo.clocks import Clock
 from dddpy.domain.todo.entities import Todo
-from dddpy.domain.todo.exceptions import TodoNotFoundError
-from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.exceptions import (
+    TodoNotFoundError,
+    TodoVersionConflictError,
+)
 from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from dddpy.usecase.todo.todo_unit_of_work import TodoUnitOfWork
 
 
 class UpdateTodoUseCase(ABC):
@@ -18,6 +22,8 @@ class UpdateTodoUseCase(ABC):
         todo_id: TodoId,
         title: Optional[TodoTitle] = None,
         description: Optional[TodoDescription] = None,
+        expected_version: Optional[int] = None,
+        clear_description: bool = False,
     ) -> Todo:
         """Update a todo using the provided values.
 
@@ -25,6 +31,9 @@ class UpdateTodoUseCase(ABC):
             todo_id: Identifier of the todo to update.
             title: Optional replacement title.
             description: Optional replacement description.
+            expected_version: Version the caller's edit is based on, if known.
+            clear_description: Remove the description instead of leaving it
+                unchanged when ``description`` is None.
 
         Returns:
             Todo: Updated todo entity.
@@ -32,21 +41,25 @@ class UpdateTodoUseCase(ABC):
 
 
 class UpdateTodoUseCaseImpl(UpdateTodoUseCase):
-    """Concrete todo update use case backed by a repository."""
+    """Concrete todo update use case backed by a unit of work."""
 
-    def __init__(self, todo_repository: TodoRepository):
-        """Store the repository dependency.
+    def __init__(self, unit_of_work: TodoUnitOfWork, clock: Clock):
+        """Store the unit of work and clock dependencies.
 
         Args:
-            todo_repository: Repository used to persist todo updates.
+            unit_of_work: Unit of work used to persist todo updates.
+            clock: Clock used to timestamp changes.
         """
-        self.todo_repository = todo_repository
+        self.unit_of_work = unit_of_work
+        self.clock = clock
 
     def execute(
         self,
         todo_id: TodoId,
         title: Optional[TodoTitle] = None,
         description: Optional[TodoDescription] = None,
+        expected_version: Optional[int] = None,
+        clear_description: bool = False,
     ) -> Todo:
         """Update a todo and persist the changes.
 
@@ -54,34 +67,48 @@ class UpdateTodoUseCaseImpl(UpdateTodoUseCase):
             todo_id: Identifier of the todo to update.
             title: Optional replacement title.
             description: Optional replacement description.
+            expected_version: Version the caller's edit is based on, if known.
+            clear_description: Remove the description instead of leaving it
+                unchanged when ``description`` is None.
 
         Raises:
             TodoNotFoundError: If no todo matches the provided identifier.
+            TodoVersionConflictError: If the todo is not at ``expected_version``
+                or is modified concurrently before the update is stored.
 
         Returns:
             Todo: Persisted todo reflecting the latest updates.
         """
-        todo = self.todo_repository.find_by_id(todo_id)
+        todos = self.unit_of_work.todos
+        todo = todos.find_by_id(todo_id)
 
         if todo is None:
             raise TodoNotFoundError
 
+        if expected_version is not None and todo.version != expected_version:
+            raise TodoVersionConflictError
+
+        now = self.clock.now()
         if title is not None:
-            todo.update_title(title)
-        if description is not None:
-            todo.update_description(description)
+            todo.update_title(title, now)
+        if description is not None or clear_description:
+            todo.update_description(description, now)
 
-        self.todo_repository.save(todo)
+        todos.save(todo)
+        self.unit_of_work.commit()
         return todo
 
 
-def new_update_todo_usecase(todo_repository: TodoRepository) -> UpdateTodoUseCase:
+def new_update_todo_usecase(
+    unit_of_work: TodoUnitOfWork, clock: Clock
+) -> UpdateTodoUseCase:
     """Instantiate the todo update use case.
 
     Args:
-        todo_repository: Repository used to persist todo updates.
+        unit_of_work: Unit of work used to persist todo updates.
+        clock: Clock used to timestamp changes.
 
     Returns:
         UpdateTodoUseCase: Configured use case implementation.
     """
-    return UpdateTodoUseCaseImpl(todo_repository)
+    return UpdateTodoUseCaseImpl(unit_of_work, clock)
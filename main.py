@@ -1,12 +1,50 @@
 """Bootstrap the FastAPI application and configure infrastructure."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from logging import config
 
 from fastapi import FastAPI
 
-from dddpy.infrastructure.sqlite.database import create_tables, engine
+from dddpy.infrastructure.di.injection import (
+    PROFILE_ALLOWED_HOSTS,
+    PROFILE_SAMPLE_INTERVAL_SECONDS,
+    SLOW_QUERY_LOG_REDACT_PARAMETERS,
+    SLOW_QUERY_LOG_THRESHOLD_MS,
+    TODO_ID_FILTER_ENABLED,
+    TODO_ID_FILTER_REBUILD_SECONDS,
+    get_idempotency_store,
+    get_metrics_registry,
+    get_profile_store,
+    get_todo_event_broadcaster,
+    get_todo_event_dispatcher,
+    get_todo_id_filter,
+    get_todo_outbox_relay,
+    get_tracer,
+    instrument_app,
+)
+from dddpy.infrastructure.sqlite.database import (
+    SessionLocal,
+    create_tables,
+    enable_slow_query_log,
+    engine,
+)
+from dddpy.presentation.api.debug import (
+    ProfiledRoute,
+    ProfilingMiddleware,
+    TracingMiddleware,
+)
+from dddpy.presentation.api.debug.handlers.debug_api_route_handler import (
+    DebugApiRouteHandler,
+)
+from dddpy.presentation.api.metrics import (
+    RequestMetricsMiddleware,
+    ServerTimingMiddleware,
+)
+from dddpy.presentation.api.metrics.handlers.metrics_api_route_handler import (
+    MetricsApiRouteHandler,
+)
 from dddpy.presentation.api.todo.handlers.todo_api_route_handler import (
     TodoApiRouteHandler,
 )
@@ -17,7 +55,7 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage database setup and teardown for the FastAPI lifespan.
+    """Manage database setup, background jobs and teardown for the FastAPI lifespan.
 
     Args:
         app: FastAPI application instance invoking the lifespan context.
@@ -25,8 +63,42 @@ async def lifespan(app: FastAPI):
     Yields:
         None: Control is yielded back to FastAPI after setup completes.
     """
+    instrument_app()
     create_tables()
+    slow_query_log = (
+        enable_slow_query_log(
+            SLOW_QUERY_LOG_THRESHOLD_MS, SLOW_QUERY_LOG_REDACT_PARAMETERS
+        )
+        if SLOW_QUERY_LOG_THRESHOLD_MS is not None
+        else None
+    )
+    idempotency_eviction = asyncio.create_task(get_idempotency_store().run_eviction())
+    todo_id_filter_rebuild = (
+        asyncio.create_task(
+            get_todo_id_filter().run_rebuild(
+                SessionLocal, TODO_ID_FILTER_REBUILD_SECONDS
+            )
+        )
+        if TODO_ID_FILTER_ENABLED
+        else None
+    )
+    todo_outbox_relay = asyncio.create_task(get_todo_outbox_relay().run())
+    todo_event_dispatcher = get_todo_event_dispatcher()
+    todo_event_dispatcher.start()
+    todo_event_broadcaster = get_todo_event_broadcaster()
+    todo_event_broadcaster.attach(asyncio.get_running_loop())
+    todo_stream_heartbeat = asyncio.create_task(todo_event_broadcaster.run_heartbeat())
     yield
+    todo_event_dispatcher.stop()
+    todo_event_broadcaster.close()
+    todo_stream_heartbeat.cancel()
+    idempotency_eviction.cancel()
+    if todo_id_filter_rebuild is not None:
+        todo_id_filter_rebuild.cancel()
+    todo_outbox_relay.cancel()
+    get_tracer().shutdown()
+    if slow_query_log is not None:
+        slow_query_log.remove()
     engine.dispose()
 
 
@@ -37,5 +109,22 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.router.route_class = ProfiledRoute
+app.add_middleware(
+    ProfilingMiddleware,
+    store=get_profile_store(),
+    allowed_hosts=PROFILE_ALLOWED_HOSTS,
+    interval_seconds=PROFILE_SAMPLE_INTERVAL_SECONDS,
+)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(TracingMiddleware, tracer=get_tracer())
+app.add_middleware(RequestMetricsMiddleware, registry=get_metrics_registry())
+
 todo_route_handler = TodoApiRouteHandler()
 todo_route_handler.register_routes(app)
+
+metrics_route_handler = MetricsApiRouteHandler()
+metrics_route_handler.register_routes(app)
+
+debug_route_handler = DebugApiRouteHandler()
+debug_route_handler.register_routes(app)
@@ -0,0 +1,49 @@
+"""Tests for the clock implementations."""
+
+from unittest.mock import patch
+
+from dddpy.domain.todo.clocks import CoarseClock, FixedClock, SystemClock
+from dddpy.domain.todo.value_objects import TodoTimestamp
+
+
+def test_system_clock_reads_current_time():
+    """Test that the system clock reports the current time."""
+    before = TodoTimestamp.now()
+    now = SystemClock().now()
+    after = TodoTimestamp.now()
+    assert before <= now <= after
+
+
+def test_coarse_clock_reuses_reading_within_resolution():
+    """Test that the coarse clock only refreshes once per window."""
+    clock = CoarseClock(resolution_ms=10)
+    with patch('time.monotonic_ns', return_value=1_000_000_000):
+        first = clock.now()
+        second = clock.now()
+    assert second is first
+
+
+def test_coarse_clock_refreshes_after_resolution():
+    """Test that the coarse clock refreshes once the window has elapsed."""
+    clock = CoarseClock(resolution_ms=10)
+    with patch('time.monotonic_ns', return_value=1_000_000_000):
+        first = clock.now()
+    with (
+        patch('time.monotonic_ns', return_value=1_010_000_000),
+        patch.object(TodoTimestamp, 'now', return_value=TodoTimestamp(42)),
+    ):
+        second = clock.now()
+    assert second is not first
+    assert second == TodoTimestamp(42)
+
+
+def test_fixed_clock_set_and_advance():
+    """Test that the fixed clock only moves when told to."""
+    clock = FixedClock(TodoTimestamp(1000))
+    assert clock.now() == TodoTimestamp(1000)
+
+    clock.advance(500)
+    assert clock.now() == TodoTimestamp(1500)
+
+    clock.set(TodoTimestamp(10))
+    assert clock.now() == TodoTimestamp(10)
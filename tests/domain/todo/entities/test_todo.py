@@ -1,17 +1,33 @@
 """Test cases for the Todo entity."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import pytest
 
 from dddpy.domain.todo.entities.todo import Todo
+from dddpy.domain.todo.events import TodoEventKind
 from dddpy.domain.todo.value_objects import (
     TodoDescription,
     TodoId,
     TodoStatus,
+    TodoTimestamp,
     TodoTitle,
 )
 
+PAST = TodoTimestamp.from_datetime(datetime(2025, 3, 22))
+
+
+def _todo_created_in_past(
+    title: str = 'Test Todo', description: TodoDescription | None = None
+) -> Todo:
+    return Todo(
+        id=TodoId.generate(),
+        title=TodoTitle(title),
+        description=description,
+        created_at=PAST,
+        updated_at=PAST,
+    )
+
 
 def test_create_todo():
     """Test creating a new Todo."""
@@ -23,8 +39,8 @@ def test_create_todo():
     assert todo.title == title
     assert todo.description == description
     assert todo.status == TodoStatus.NOT_STARTED
-    assert isinstance(todo.created_at, datetime)
-    assert isinstance(todo.updated_at, datetime)
+    assert isinstance(todo.created_at, TodoTimestamp)
+    assert todo.updated_at == todo.created_at
     assert todo.completed_at is None
 
 
@@ -33,8 +49,8 @@ def test_todo_properties():
     todo_id = TodoId.generate()
     title = TodoTitle('Test Todo')
     description = TodoDescription('Test Description')
-    created_at = datetime.now()
-    updated_at = datetime.now()
+    created_at = TodoTimestamp.now()
+    updated_at = TodoTimestamp.now()
 
     todo = Todo(
         id=todo_id,
@@ -56,7 +72,7 @@ def test_todo_properties():
 
 def test_update_title():
     """Test updating Todo title."""
-    todo = Todo.create(TodoTitle('Original Title'))
+    todo = _todo_created_in_past('Original Title')
     new_title = TodoTitle('Updated Title')
 
     todo.update_title(new_title)
@@ -67,7 +83,7 @@ def test_update_title():
 
 def test_update_description():
     """Test updating Todo description."""
-    todo = Todo.create(TodoTitle('Test Todo'))
+    todo = _todo_created_in_past()
     new_description = TodoDescription('Updated Description')
 
     todo.update_description(new_description)
@@ -78,7 +94,7 @@ def test_update_description():
 
 def test_clear_description():
     """Test clearing Todo description."""
-    todo = Todo.create(TodoTitle('Test Todo'), TodoDescription('Original Description'))
+    todo = _todo_created_in_past(description=TodoDescription('Original Description'))
 
     todo.update_description(None)
 
@@ -88,7 +104,7 @@ def test_clear_description():
 
 def test_start_todo():
     """Test starting a Todo."""
-    todo = Todo.create(TodoTitle('Test Todo'))
+    todo = _todo_created_in_past()
 
     todo.start()
 
@@ -120,9 +136,12 @@ def test_complete_already_completed_todo():
 def test_is_overdue():
     """Test checking if a Todo is overdue."""
     # Create a todo with specific timestamps
-    created_at = datetime(2025, 3, 22)  # 2 days before deadline
-    deadline = datetime(2025, 3, 24)  # deadline
-    current_time = datetime(2025, 3, 23)  # 1 day before deadline
+    # 2 days before deadline
+    created_at = TodoTimestamp.from_datetime(datetime(2025, 3, 22))
+    # deadline
+    deadline = TodoTimestamp.from_datetime(datetime(2025, 3, 24))
+    # 1 day before deadline
+    current_time = TodoTimestamp.from_datetime(datetime(2025, 3, 23))
 
     # Test case 1: Not completed todo should not be overdue before deadline
     todo = Todo(
@@ -134,7 +153,8 @@ def test_is_overdue():
     assert not todo.is_overdue(deadline, current_time)
 
     # Test case 2: Not completed todo should be overdue after deadline
-    current_time = datetime(2025, 3, 25)  # 1 day after deadline
+    # 1 day after deadline
+    current_time = TodoTimestamp.from_datetime(datetime(2025, 3, 25))
     assert todo.is_overdue(deadline, current_time)
 
     # Test case 3: Completed todo should never be overdue, even if completed after deadline
@@ -171,3 +191,110 @@ def test_todo_equality():
     assert todo1 != todo2  # Different IDs
     assert todo3 == todo4  # Same ID, different titles
     assert todo1 != 'not a todo'  # Different type
+
+
+def test_todo_uses_slots():
+    """Test Todo and its value objects do not allocate per-instance dicts."""
+    todo = Todo.create(TodoTitle('Test Todo'), TodoDescription('Test Description'))
+
+    assert not hasattr(todo, '__dict__')
+    assert not hasattr(todo.id, '__dict__')
+    assert not hasattr(todo.title, '__dict__')
+    assert not hasattr(todo.description, '__dict__')
+    assert todo.title == TodoTitle('Test Todo')
+    assert todo.description == TodoDescription('Test Description')
+
+
+def test_create_and_mutate_with_explicit_time():
+    """Test that a single time reading can stamp creation and transitions."""
+    now = TodoTimestamp(1136214245000)
+    todo = Todo.create(TodoTitle('Test Todo'), now=now)
+
+    assert todo.created_at == now
+    assert todo.updated_at == now
+
+    later = TodoTimestamp(now.value + 1000)
+    todo.start(later)
+    assert todo.updated_at == later
+
+    todo.complete(later)
+    assert todo.completed_at == later
+
+
+def test_changed_fields_track_mutations():
+    """Test mutators record the fields they change until persisted."""
+    todo = _todo_created_in_past(description=TodoDescription('Description'))
+    assert todo.changed_fields == ()
+
+    todo.update_title(TodoTitle('New Title'))
+    assert todo.changed_fields == ('title', 'updated_at')
+
+    todo.update_description(TodoDescription('Description'))
+    assert todo.changed_fields == ('title', 'updated_at')
+
+    todo.start()
+    todo.complete()
+    assert todo.changed_fields == ('title', 'status', 'updated_at', 'completed_at')
+
+    todo.mark_persisted()
+    assert todo.changed_fields == ()
+
+
+def test_mutations_record_events():
+    """Test state changes record one event each until pulled."""
+    todo = Todo.create(TodoTitle('Todo'))
+    todo.update_title(TodoTitle('Todo'))
+    todo.update_title(TodoTitle('New Title'))
+    todo.update_description(TodoDescription('Description'))
+    todo.start()
+    todo.complete()
+
+    events = todo.pull_events()
+
+    assert [event.kind for event in events] == [
+        TodoEventKind.CREATED,
+        TodoEventKind.UPDATED,
+        TodoEventKind.STARTED,
+        TodoEventKind.COMPLETED,
+    ]
+    assert [event.todo.status for event in events] == [
+        TodoStatus.NOT_STARTED,
+        TodoStatus.NOT_STARTED,
+        TodoStatus.IN_PROGRESS,
+        TodoStatus.COMPLETED,
+    ]
+    assert events[1].todo.title == TodoTitle('New Title')
+    assert events[1].todo.description == TodoDescription('Description')
+    assert todo.pull_events() == []
+
+
+def test_events_keep_the_state_they_were_recorded_with():
+    """Test later changes do not alter the state held by earlier events."""
+    todo = Todo.create(TodoTitle('Todo'), now=TodoTimestamp(1))
+    todo.update_title(TodoTitle('Changed'), now=TodoTimestamp(2))
+
+    created, updated = todo.pull_events()
+
+    assert created.todo.title == TodoTitle('Todo')
+    assert created.todo.updated_at == TodoTimestamp(1)
+    assert updated.todo.title == TodoTitle('Changed')
+    assert updated.todo.updated_at == TodoTimestamp(2)
+    assert created.todo.version == updated.todo.version == 1
+
+
+def test_copy_is_independent():
+    """Test a copy has the same state but no pending changes or events."""
+    todo = Todo.create(TodoTitle('Todo'), TodoDescription('Description'))
+    todo.start()
+
+    copy = todo.copy()
+    copy.update_title(TodoTitle('Changed'))
+
+    assert copy == todo
+    assert copy is not todo
+    assert todo.title == TodoTitle('Todo')
+    assert copy.status == todo.status
+    assert copy.created_at == todo.created_at
+    assert copy.version == todo.version
+    assert todo.changed_fields == ('status', 'updated_at')
+    assert [event.kind for event in copy.pull_events()] == [TodoEventKind.UPDATED]
@@ -0,0 +1,164 @@
+"""Test cases for the TodoBatch columnar collection."""
+
+import random
+from array import array
+from datetime import datetime, timezone
+
+import pytest
+
+from dddpy.domain.todo.entities import Todo, TodoBatch
+from dddpy.domain.todo.entities.todo_batch import ID_SIZE, MISSING_TIMESTAMP
+from dddpy.domain.todo.value_objects import (
+    TodoDescription,
+    TodoId,
+    TodoStatus,
+    TodoTimestamp,
+    TodoTitle,
+)
+
+
+def _ms(value: datetime) -> int:
+    return TodoTimestamp.from_datetime(value).value
+
+
+def _ts(value: datetime) -> TodoTimestamp:
+    return TodoTimestamp.from_datetime(value)
+
+
+@pytest.fixture
+def todos():
+    """Create todos covering every lifecycle status."""
+    created_at = _ts(datetime(2025, 3, 22, tzinfo=timezone.utc))
+    not_started = Todo(
+        TodoId.generate(),
+        TodoTitle('Not started'),
+        TodoDescription('Description'),
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    in_progress = Todo(
+        TodoId.generate(),
+        TodoTitle('In progress'),
+        status=TodoStatus.IN_PROGRESS,
+        created_at=_ts(datetime(2025, 3, 23, tzinfo=timezone.utc)),
+        updated_at=_ts(datetime(2025, 3, 23, tzinfo=timezone.utc)),
+    )
+    completed = Todo(
+        TodoId.generate(),
+        TodoTitle('Completed'),
+        status=TodoStatus.COMPLETED,
+        created_at=_ts(datetime(2025, 3, 24, tzinfo=timezone.utc)),
+        updated_at=_ts(datetime(2025, 3, 25, tzinfo=timezone.utc)),
+        completed_at=_ts(datetime(2025, 3, 25, tzinfo=timezone.utc)),
+    )
+    return [not_started, in_progress, completed]
+
+
+def test_round_trip_preserves_todos(todos):
+    """Test converting todos to a batch and back keeps every field."""
+    batch = TodoBatch.from_todos(todos)
+    restored = batch.to_todos()
+
+    assert len(batch) == 3
+    assert restored == todos
+    for original, copy in zip(todos, restored, strict=True):
+        assert copy.title == original.title
+        assert copy.description == original.description
+        assert copy.status == original.status
+        assert copy.created_at == original.created_at
+        assert copy.updated_at == original.updated_at
+        assert copy.completed_at == original.completed_at
+
+
+def test_status_mask(todos):
+    """Test selecting todos by status."""
+    batch = TodoBatch.from_todos(todos)
+
+    assert batch.status_mask(TodoStatus.IN_PROGRESS) == bytes([0, 1, 0])
+    assert batch.select(batch.status_mask(TodoStatus.COMPLETED)).to_todos() == [
+        todos[2]
+    ]
+
+
+def test_is_overdue_matches_entity(todos):
+    """Test the vectorized overdue check agrees with Todo.is_overdue."""
+    batch = TodoBatch.from_todos(todos)
+    deadline = _ts(datetime(2025, 3, 24, tzinfo=timezone.utc))
+
+    for current_time in (
+        _ts(datetime(2025, 3, 23, tzinfo=timezone.utc)),
+        _ts(datetime(2025, 3, 25, tzinfo=timezone.utc)),
+    ):
+        expected = [todo.is_overdue(deadline, current_time) for todo in todos]
+        actual = batch.is_overdue(deadline.value, current_time.value)
+        assert list(map(bool, actual)) == expected
+
+
+def test_is_overdue_with_per_todo_deadlines(todos):
+    """Test the overdue check accepts one deadline per todo."""
+    batch = TodoBatch.from_todos(todos)
+    current_time = _ms(datetime(2025, 3, 24, tzinfo=timezone.utc))
+    deadlines = [current_time - 1, current_time + 1, current_time - 1]
+
+    assert batch.is_overdue(deadlines, current_time) == bytes([1, 0, 0])
+    with pytest.raises(ValueError, match='one value per todo'):
+        batch.is_overdue(deadlines[:2], current_time)
+
+
+def test_time_range_mask(todos):
+    """Test selecting todos by a half-open timestamp range."""
+    batch = TodoBatch.from_todos(todos)
+    start = _ms(datetime(2025, 3, 23, tzinfo=timezone.utc))
+    end = _ms(datetime(2025, 3, 24, tzinfo=timezone.utc))
+
+    assert batch.time_range_mask('created_at', start, end) == bytes([0, 1, 0])
+    assert batch.time_range_mask('completed_at', 0, end * 2) == bytes([0, 0, 1])
+    assert batch.time_range_mask('created_at', end, start) == bytes(3)
+
+
+@pytest.mark.parametrize('spread', [1, 300, 70_000, 2**40])
+def test_masks_match_row_by_row_comparisons(spread):
+    """Test the whole-column comparisons agree with per-row ones."""
+    rng = random.Random(spread)
+    count = 5000
+    base = 1_700_000_000_000
+    values = [base + rng.randrange(spread) for _ in range(count)]
+    values[::97] = [MISSING_TIMESTAMP] * len(values[::97])
+    values[1::89] = [-rng.randrange(spread) for _ in values[1::89]]
+    statuses = array('b', (rng.randrange(3) for _ in range(count)))
+    column = array('q', values)
+    batch = TodoBatch(
+        bytes(ID_SIZE * count),
+        [''] * count,
+        [None] * count,
+        statuses,
+        column,
+        column,
+        column,
+    )
+
+    for bound in (base, base + spread // 2, base + spread, 0, MISSING_TIMESTAMP):
+        end = bound + spread // 3 + 1
+        assert batch.time_range_mask('created_at', bound, end) == bytes(
+            bound <= value < end for value in values
+        )
+        assert batch.is_overdue(values, bound) == bytes(
+            status != 2 and value < bound
+            for status, value in zip(statuses, values, strict=True)
+        )
+
+
+def test_time_range_mask_rejects_unknown_field(todos):
+    """Test only timestamp columns can be used for range selection."""
+    batch = TodoBatch.from_todos(todos)
+
+    with pytest.raises(ValueError, match='Unknown timestamp field'):
+        batch.time_range_mask('title', 0, 1)
+
+
+def test_select_rejects_mask_of_other_length(todos):
+    """Test a mask must have one value per todo."""
+    batch = TodoBatch.from_todos(todos)
+
+    with pytest.raises(ValueError, match='one value per todo'):
+        batch.select([True])
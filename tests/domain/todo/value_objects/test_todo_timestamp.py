@@ -0,0 +1,44 @@
+"""Tests for TodoTimestamp value object."""
+
+from datetime import datetime, timedelta, timezone
+
+from dddpy.domain.todo.value_objects.todo_timestamp import TodoTimestamp
+
+
+def test_from_datetime_uses_epoch_milliseconds():
+    """Test that aware datetimes are converted to epoch milliseconds."""
+    value = datetime(2006, 1, 2, 15, 4, 5, 123000, tzinfo=timezone.utc)
+    assert TodoTimestamp.from_datetime(value).value == 1136214245123
+
+
+def test_from_datetime_treats_naive_values_as_utc():
+    """Test that naive datetimes are interpreted as UTC."""
+    naive = datetime(2006, 1, 2, 15, 4, 5)
+    aware = naive.replace(tzinfo=timezone.utc)
+    assert TodoTimestamp.from_datetime(naive) == TodoTimestamp.from_datetime(aware)
+
+
+def test_from_datetime_normalizes_offsets():
+    """Test that the same instant in different zones yields the same value."""
+    utc = datetime(2006, 1, 2, 6, 4, 5, tzinfo=timezone.utc)
+    jst = datetime(2006, 1, 2, 15, 4, 5, tzinfo=timezone(timedelta(hours=9)))
+    assert TodoTimestamp.from_datetime(utc) == TodoTimestamp.from_datetime(jst)
+
+
+def test_to_datetime_round_trip():
+    """Test that to_datetime returns an aware UTC datetime for the value."""
+    timestamp = TodoTimestamp(1136214245123)
+    value = timestamp.to_datetime()
+    assert value.tzinfo == timezone.utc
+    assert TodoTimestamp.from_datetime(value) == timestamp
+
+
+def test_ordering():
+    """Test that timestamps compare by their epoch value."""
+    assert TodoTimestamp(1) < TodoTimestamp(2)
+    assert TodoTimestamp.now() > TodoTimestamp(0)
+
+
+def test_str_representation():
+    """Test the string representation of TodoTimestamp."""
+    assert str(TodoTimestamp(1136214245000)) == '1136214245000'
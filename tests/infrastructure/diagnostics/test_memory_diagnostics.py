@@ -0,0 +1,83 @@
+"""Test cases for MemoryDiagnostics."""
+
+import gc
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.infrastructure.diagnostics import MemoryDiagnostics
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo import TodoRepositoryImpl
+
+
+class Leak:
+    """Objects accumulated between two snapshots."""
+
+
+def test_type_diff_reports_new_objects():
+    """Test objects created between snapshots appear in the type diff."""
+    diagnostics = MemoryDiagnostics()
+    diagnostics.take_snapshot('before')
+    leaked = [Leak() for _ in range(100)]
+    diagnostics.take_snapshot('after')
+
+    changes = diagnostics.compare('before', 'after', group_by='type')
+
+    assert {
+        'type': f'{__name__}.Leak',
+        'count': 100,
+        'count_diff': 100,
+    } in changes
+    assert len(leaked) == 100
+
+
+def test_allocation_diff_requires_tracemalloc():
+    """Test line diffs need both snapshots taken while tracing."""
+    diagnostics = MemoryDiagnostics()
+    diagnostics.take_snapshot('untraced')
+    diagnostics.start()
+    try:
+        diagnostics.take_snapshot('before')
+        leaked = [bytearray(1000) for _ in range(100)]
+        changes = diagnostics.compare('before', group_by='lineno')
+        with pytest.raises(ValueError):
+            diagnostics.compare('untraced', group_by='lineno')
+    finally:
+        diagnostics.stop()
+
+    assert changes[0]['location'].startswith(__file__)
+    assert changes[0]['count_diff'] >= 100
+    assert len(leaked) == 100
+
+
+def test_missing_snapshot_and_grouping_are_rejected():
+    """Test unknown snapshot names and groupings raise."""
+    diagnostics = MemoryDiagnostics(max_snapshots=1)
+    diagnostics.take_snapshot('first')
+    diagnostics.take_snapshot('second')
+
+    with pytest.raises(KeyError):
+        diagnostics.compare('first')
+    with pytest.raises(ValueError):
+        diagnostics.compare('second', group_by='module')
+
+
+def test_counts_todos_and_identity_maps():
+    """Test live todos and repository identity maps are reported."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(bind=engine)
+    diagnostics = MemoryDiagnostics()
+    gc.collect()
+    baseline = diagnostics.object_counts({'Todo': Todo})['Todo']
+
+    with sessionmaker(bind=engine)() as session:
+        repository = TodoRepositoryImpl(session)
+        todo = Todo.create(TodoTitle('Write'))
+        repository.save(todo)
+        repository.flush()
+
+        assert diagnostics.object_counts({'Todo': Todo}) == {'Todo': baseline + 1}
+        assert {'repository': 1, 'session': 0} in diagnostics.identity_map_sizes()
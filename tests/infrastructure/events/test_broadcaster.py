@@ -0,0 +1,97 @@
+"""Test cases for Broadcaster."""
+
+import asyncio
+
+from dddpy.infrastructure.events import Broadcaster, SlowSubscriberPolicy
+
+
+async def _publish(broadcaster, *events):
+    """Publish events and let the loop deliver them."""
+    for event in events:
+        broadcaster.publish(event, '{}')
+    await asyncio.sleep(0)
+
+
+def _ids(chunk):
+    """Return the event ids found in a chunk of frames."""
+    return [
+        int(line[4:]) for line in chunk.decode().splitlines() if line.startswith('id: ')
+    ]
+
+
+def test_every_subscriber_receives_published_frames():
+    """Test frames fan out to all subscribers in order."""
+
+    async def scenario():
+        broadcaster = Broadcaster()
+        broadcaster.attach(asyncio.get_running_loop())
+        first, second = broadcaster.subscribe(), broadcaster.subscribe()
+        await _publish(broadcaster, 'created', 'started')
+
+        assert _ids(await anext(first)) == [1, 2]
+        chunk = await anext(second)
+        assert chunk.startswith(b'id: 1\nevent: created\ndata: {}\n\n')
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_drops_oldest_frames():
+    """Test a slow subscriber keeps only the newest frames."""
+
+    async def scenario():
+        broadcaster = Broadcaster(queue_size=2)
+        broadcaster.attach(asyncio.get_running_loop())
+        subscription = broadcaster.subscribe()
+        await _publish(broadcaster, 'created', 'started', 'completed')
+
+        assert _ids(await anext(subscription)) == [2, 3]
+        assert broadcaster.stats().dropped == 1
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_disconnects_subscriber():
+    """Test the disconnect policy ends a slow subscriber's stream."""
+
+    async def scenario():
+        broadcaster = Broadcaster(queue_size=2, policy=SlowSubscriberPolicy.DISCONNECT)
+        broadcaster.attach(asyncio.get_running_loop())
+        subscription = broadcaster.subscribe()
+        await _publish(broadcaster, 'created', 'started', 'completed')
+
+        assert [chunk async for chunk in subscription] == []
+        assert broadcaster.stats().subscribers == 0
+        assert broadcaster.stats().disconnected == 1
+
+    asyncio.run(scenario())
+
+
+def test_subscriber_resumes_after_last_event_id():
+    """Test a reconnecting client receives the buffered frames it missed."""
+
+    async def scenario():
+        broadcaster = Broadcaster(history_size=2)
+        broadcaster.attach(asyncio.get_running_loop())
+        await _publish(broadcaster, 'created', 'started', 'completed')
+
+        assert _ids(await anext(broadcaster.subscribe(last_event_id=2))) == [3]
+        reset = await anext(broadcaster.subscribe(last_event_id=0))
+        assert reset.startswith(b'event: reset')
+
+    asyncio.run(scenario())
+
+
+def test_close_ends_every_stream():
+    """Test closing the broadcaster ends idle subscriptions."""
+
+    async def scenario():
+        broadcaster = Broadcaster()
+        subscription = broadcaster.subscribe()
+        waiting = asyncio.ensure_future(anext(subscription, None))
+        await asyncio.sleep(0)
+
+        broadcaster.close()
+
+        assert await waiting is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,81 @@
+"""Test cases for TodoEventDispatcher."""
+
+import threading
+
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind
+from dddpy.domain.todo.value_objects import TodoId
+from dddpy.infrastructure.events import TodoEventDispatcher
+
+
+def _events(count):
+    """Create deleted events for fresh ids."""
+    return [TodoEvent(TodoEventKind.DELETED, TodoId.generate()) for _ in range(count)]
+
+
+def test_every_handler_receives_events_in_order():
+    """Test batches reach each handler in publishing order."""
+    dispatcher = TodoEventDispatcher(workers=4, batch_size=3)
+    received = {'first': [], 'second': []}
+    dispatcher.subscribe(received['first'].extend)
+    dispatcher.subscribe(received['second'].extend)
+    events = _events(50)
+
+    dispatcher.start()
+    for i in range(0, 50, 5):
+        dispatcher.publish(events[i : i + 5])
+    dispatcher.stop()
+
+    assert received['first'] == events
+    assert received['second'] == events
+    stats = dispatcher.stats()
+    assert stats.published == 50
+    assert stats.queued == 0
+
+
+def test_failing_handler_does_not_stop_delivery():
+    """Test a raising handler is counted and the others still run."""
+    dispatcher = TodoEventDispatcher(workers=1)
+    received = []
+
+    def fail(batch):
+        raise RuntimeError('handler error')
+
+    dispatcher.subscribe(fail)
+    dispatcher.subscribe(received.extend)
+    events = _events(2)
+
+    dispatcher.start()
+    dispatcher.publish(events)
+    dispatcher.stop()
+
+    assert received == events
+    assert dispatcher.stats().failures >= 1
+
+
+def test_full_queue_drops_events_without_waiting():
+    """Test publishers drop what does not fit instead of waiting for room."""
+    dispatcher = TodoEventDispatcher(workers=1, queue_size=2, batch_size=1)
+    release = threading.Event()
+    dispatcher.subscribe(lambda batch: release.wait())
+
+    dispatcher.start()
+    dispatcher.publish(_events(1))
+    while dispatcher.stats().queued:
+        pass
+    dispatcher.publish(_events(4))
+    release.set()
+    dispatcher.stop()
+
+    stats = dispatcher.stats()
+    assert stats.published == 3
+    assert stats.dropped == 2
+
+
+def test_events_are_dropped_before_start():
+    """Test nothing is queued while the workers are not running."""
+    dispatcher = TodoEventDispatcher()
+
+    dispatcher.publish(_events(1))
+
+    assert dispatcher.stats().dropped == 1
+    assert dispatcher.stats().queued == 0
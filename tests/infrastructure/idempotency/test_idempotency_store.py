@@ -0,0 +1,123 @@
+"""Test cases for IdempotencyStore."""
+
+import threading
+
+import pytest
+
+from dddpy.infrastructure.idempotency import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInFlightError,
+    IdempotencyStore,
+    StoredResponse,
+)
+
+FINGERPRINT = b'payload'
+RESPONSE = StoredResponse(201, b'{"id": "1"}', FINGERPRINT)
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a hand-driven clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def store(clock):
+    """Create a store with a short TTL and wait timeout."""
+    return IdempotencyStore(
+        ttl_seconds=60, max_entries=3, wait_timeout_seconds=0.5, clock=clock
+    )
+
+
+def test_first_request_claims_key_and_retry_replays(store):
+    """Test the stored response is replayed for a retry."""
+    assert store.begin('key', FINGERPRINT) is None
+    store.complete('key', RESPONSE)
+
+    assert store.begin('key', FINGERPRINT) == RESPONSE
+
+
+def test_key_reused_for_other_payload_is_rejected(store):
+    """Test a key cannot be replayed for a different payload."""
+    store.begin('key', FINGERPRINT)
+    with pytest.raises(IdempotencyKeyConflictError):
+        store.begin('key', b'other')
+
+    store.complete('key', RESPONSE)
+    with pytest.raises(IdempotencyKeyConflictError):
+        store.begin('key', b'other')
+
+
+def test_concurrent_duplicate_waits_for_first_response():
+    """Test a duplicate arriving mid-flight receives the first response."""
+    store = IdempotencyStore(wait_timeout_seconds=5)
+    store.begin('key', FINGERPRINT)
+    replayed = []
+    waiter = threading.Thread(
+        target=lambda: replayed.append(store.begin('key', FINGERPRINT))
+    )
+
+    waiter.start()
+    store.complete('key', RESPONSE)
+    waiter.join()
+
+    assert replayed == [RESPONSE]
+
+
+def test_released_key_can_be_claimed_again(store):
+    """Test a failed first request lets the retry run."""
+    store.begin('key', FINGERPRINT)
+    store.release('key')
+
+    assert store.begin('key', FINGERPRINT) is None
+
+
+def test_duplicate_gives_up_after_wait_timeout():
+    """Test a duplicate stops waiting for a request that does not finish."""
+    store = IdempotencyStore(wait_timeout_seconds=0.05)
+    store.begin('key', FINGERPRINT)
+
+    with pytest.raises(IdempotencyKeyInFlightError):
+        store.begin('key', FINGERPRINT)
+
+
+def test_expired_responses_are_not_replayed(store, clock):
+    """Test a response is forgotten once its TTL passes."""
+    store.begin('key', FINGERPRINT)
+    store.complete('key', RESPONSE)
+    clock.now = 60
+
+    assert store.begin('key', FINGERPRINT) is None
+
+
+def test_evict_expired_drops_in_batches(store, clock):
+    """Test eviction drops only expired entries, at most a batch at a time."""
+    for key in ('a', 'b', 'c'):
+        store.begin(key, FINGERPRINT)
+        store.complete(key, RESPONSE)
+        clock.now += 10
+
+    clock.now = 75
+    assert store.evict_expired(batch_size=1) == 1
+    assert store.evict_expired(batch_size=10) == 1
+    assert len(store) == 1
+
+
+def test_store_is_bounded(store):
+    """Test the oldest responses are dropped beyond the size bound."""
+    for key in ('a', 'b', 'c', 'd'):
+        store.begin(key, FINGERPRINT)
+        store.complete(key, RESPONSE)
+
+    assert len(store) == 3
+    assert store.begin('a', FINGERPRINT) is None
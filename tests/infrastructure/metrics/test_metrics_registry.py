@@ -0,0 +1,111 @@
+"""Test cases for MetricsRegistry."""
+
+import threading
+
+import pytest
+
+from dddpy.infrastructure.metrics import MetricsRegistry, time_methods
+
+
+def test_counter_sums_increments_from_every_thread():
+    """Test per-thread shards add up to every increment."""
+    registry = MetricsRegistry()
+    counter = registry.counter('jobs_total', 'Jobs.', ('kind',)).labels('a')
+
+    def work():
+        for _ in range(10_000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value() == 80_000
+    assert 'jobs_total{kind="a"} 80000' in registry.render()
+
+
+def test_counter_keeps_increments_of_finished_threads():
+    """Test threads that ended are folded into the total and forgotten."""
+    registry = MetricsRegistry()
+    counter = registry.counter('jobs_total', 'Jobs.').labels()
+
+    for _ in range(1000):
+        thread = threading.Thread(target=counter.inc)
+        thread.start()
+        thread.join()
+
+    assert counter.value() == 1000
+    assert len(counter._shards._lists) <= 1
+
+
+def test_callback_gauge_has_no_children():
+    """Test callback gauges only expose the values of their callback."""
+    registry = MetricsRegistry()
+    gauge = registry.callback_gauge(
+        'queue_size', 'Queue size.', ('queue',), lambda: {('events',): 3.0}
+    )
+
+    assert not hasattr(gauge, 'labels')
+    assert 'queue_size{queue="events"} 3' in registry.render()
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test observations land in the first bucket bound not below them."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram('latency_seconds', 'Latency.', buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.labels().observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum 2.65' in lines
+    assert 'latency_seconds_count 4' in lines
+
+
+def test_registry_returns_existing_family_by_name():
+    """Test families are shared by name and kinds cannot be mixed."""
+    registry = MetricsRegistry()
+    counter = registry.counter('requests_total', 'Requests.')
+
+    assert registry.counter('requests_total', 'Requests.') is counter
+    with pytest.raises(ValueError):
+        registry.gauge('requests_total', 'Requests.')
+
+
+def test_labels_are_escaped_and_checked():
+    """Test label values are escaped and their number validated."""
+    registry = MetricsRegistry()
+    gauge = registry.gauge('open', 'Open.', ('path',))
+    gauge.labels('a"b\\c').inc(2)
+    gauge.labels('a"b\\c').dec()
+
+    assert 'open{path="a\\"b\\\\c"} 1' in registry.render()
+    with pytest.raises(ValueError):
+        gauge.labels('a', 'b')
+
+
+def test_time_methods_observes_each_call_once():
+    """Test wrapped methods are timed, including calls that raise."""
+
+    class Service:
+        def run(self, fail):
+            if fail:
+                raise RuntimeError
+            return 'done'
+
+    registry = MetricsRegistry()
+    histogram = registry.histogram('calls_seconds', 'Calls.', ('class', 'method'))
+    time_methods(Service, ('run',), histogram)
+    time_methods(Service, ('run',), histogram)
+
+    assert Service().run(False) == 'done'
+    with pytest.raises(RuntimeError):
+        Service().run(True)
+
+    _, _, count = histogram.labels('Service', 'run').snapshot()
+    assert count == 2
@@ -0,0 +1,47 @@
+"""Test cases for RequestProfiler and ProfileStore."""
+
+import marshal
+import time
+
+from dddpy.infrastructure.profiling import ProfileFormat, ProfileStore, RequestProfiler
+
+
+def busy_wait(seconds):
+    """Keep the thread running for a while."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return 'done'
+
+
+def test_collapsed_profile_counts_sampled_stacks():
+    """Test sampled stacks are rendered as frame;frame count lines."""
+    profiler = RequestProfiler(ProfileFormat.COLLAPSED, interval_seconds=0.001)
+
+    assert profiler.run(busy_wait, 0.05) == 'done'
+
+    lines = profiler.render().decode().splitlines()
+    assert profiler.samples > 0
+    assert any(f'{__name__}:busy_wait' in line for line in lines)
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in lines) == profiler.samples
+
+
+def test_pstats_profile_is_a_marshalled_stats_dump():
+    """Test the pstats format can be loaded back and names the call."""
+    profiler = RequestProfiler(ProfileFormat.PSTATS)
+    profiler.run(busy_wait, 0.001)
+
+    stats = marshal.loads(profiler.render())
+
+    assert any(function == 'busy_wait' for _, _, function in stats)
+
+
+def test_store_keeps_the_most_recent_profiles():
+    """Test the oldest profile is dropped once the store is full."""
+    store = ProfileStore(capacity=2)
+    first = store.add('GET', '/a', ProfileFormat.COLLAPSED, 1.0, b'')
+    store.add('GET', '/b', ProfileFormat.COLLAPSED, 1.0, b'')
+    store.add('GET', '/c', ProfileFormat.COLLAPSED, 1.0, b'')
+
+    assert store.get(first.id) is None
+    assert [profile.path for profile in store.list()] == ['/c', '/b']
@@ -0,0 +1,70 @@
+"""Test cases for the database schema setup."""
+
+import uuid
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from dddpy.domain.todo.clocks import FixedClock
+from dddpy.domain.todo.value_objects import TodoId, TodoTimestamp, TodoTitle
+from dddpy.infrastructure.sqlite.database import create_tables
+from dddpy.infrastructure.sqlite.todo import TodoRepositoryImpl, TodoUnitOfWorkImpl
+from dddpy.usecase.todo.update_todo_usecase import UpdateTodoUseCaseImpl
+
+
+def _create_table_without_version(engine, todo_id):
+    """Create and fill the todo table as it was before todos had a version."""
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                'CREATE TABLE todo (id CHAR(32) NOT NULL PRIMARY KEY, '
+                'title VARCHAR(100) NOT NULL, description VARCHAR(1000), '
+                'status VARCHAR NOT NULL, created_at INTEGER NOT NULL, '
+                'updated_at INTEGER NOT NULL, completed_at INTEGER)'
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO todo VALUES (:id, 'Old todo', NULL, 'not_started', "
+                '1700000000000, 1700000000000, NULL)'
+            ),
+            {'id': todo_id.hex},
+        )
+
+
+def test_create_tables_adds_version_to_existing_todo_table():
+    """Test a database created before the version column keeps its todos."""
+    engine = create_engine('sqlite://')
+    todo_id = uuid.uuid4()
+    _create_table_without_version(engine, todo_id)
+
+    create_tables(engine)
+    create_tables(engine)
+
+    columns = {column['name'] for column in inspect(engine).get_columns('todo')}
+    assert 'version' in columns
+    session = sessionmaker(bind=engine)()
+    todo = TodoRepositoryImpl(session).find_by_id(TodoId(todo_id))
+    assert todo is not None
+    assert todo.version == 1
+    session.close()
+    engine.dispose()
+
+
+def test_todos_stored_before_the_migration_can_be_updated():
+    """Test a migrated todo is updated in place rather than inserted again."""
+    engine = create_engine('sqlite://')
+    todo_id = uuid.uuid4()
+    _create_table_without_version(engine, todo_id)
+    create_tables(engine)
+
+    with sessionmaker(bind=engine)() as session:
+        todo = UpdateTodoUseCaseImpl(
+            TodoUnitOfWorkImpl(session), FixedClock(TodoTimestamp(1800000000000))
+        ).execute(TodoId(todo_id), title=TodoTitle('Renamed'))
+
+    assert todo.version == 2
+    with engine.connect() as connection:
+        rows = connection.execute(text('SELECT title, version FROM todo')).all()
+    assert rows == [('Renamed', 2)]
+    engine.dispose()
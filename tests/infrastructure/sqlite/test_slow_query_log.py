@@ -0,0 +1,60 @@
+"""Test cases for SlowQueryLog."""
+
+import logging
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.slow_query_log import SlowQueryLog
+from dddpy.infrastructure.sqlite.todo import TodoRepositoryImpl
+
+
+class _Records(logging.Handler):
+    """Keep the handled records."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _run_find_all(tmp_path, redact_parameters):
+    """Log every statement of two listings and return the written records."""
+    engine = create_engine(f'sqlite:///{tmp_path / "sqlite.db"}')
+    Base.metadata.create_all(bind=engine)
+    handler = _Records()
+    slow_query_log = SlowQueryLog(
+        engine,
+        threshold_seconds=0,
+        redact_parameters=redact_parameters,
+        handlers=[handler],
+    )
+    slow_query_log.install()
+    with sessionmaker(bind=engine)() as session:
+        TodoRepositoryImpl(session).find_all()
+        TodoRepositoryImpl(session).find_all()
+    slow_query_log.remove()
+    engine.dispose()
+    return handler.records
+
+
+def test_slow_statements_are_logged_with_caller_and_plan(tmp_path):
+    """Test records name the repository method and carry the query plan."""
+    records = _run_find_all(tmp_path, redact_parameters=True)
+
+    assert len(records) == 2
+    message = records[0].getMessage()
+    assert 'TodoRepositoryImpl.find_all' in message
+    assert '<redacted: 2 values>' in message
+    assert 'SCAN' in message or 'SEARCH' in message
+    assert records[1].getMessage().splitlines()[1:] == message.splitlines()[1:]
+
+
+def test_parameters_are_shown_when_not_redacted(tmp_path):
+    """Test parameter values appear only when redaction is off."""
+    records = _run_find_all(tmp_path, redact_parameters=False)
+
+    assert '<redacted' not in records[0].getMessage()
@@ -0,0 +1,29 @@
+"""Test cases for statement tracking."""
+
+from sqlalchemy import create_engine, text
+
+from dddpy.infrastructure.sqlite.statement_stats import (
+    current_statement_stats,
+    instrument_statement_stats,
+    track_statements,
+)
+
+
+def test_statements_are_counted_only_inside_the_scope():
+    """Test statements run within the block are counted and grouped by text."""
+    engine = create_engine('sqlite://')
+    instrument_statement_stats(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text('SELECT 1'))
+        with track_statements() as stats:
+            assert current_statement_stats() is stats
+            for value in range(3):
+                connection.execute(text('SELECT :value'), {'value': value})
+            connection.execute(text('SELECT 2'))
+        connection.execute(text('SELECT 1'))
+
+    assert current_statement_stats() is None
+    assert stats.count == 4
+    assert stats.seconds > 0
+    assert stats.repeated(3) == {'SELECT ?': 3}
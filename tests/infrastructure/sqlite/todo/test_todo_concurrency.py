@@ -0,0 +1,83 @@
+"""Concurrency tests for optimistic locking on todo updates."""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dddpy.domain.todo.clocks import SystemClock
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoVersionConflictError
+from dddpy.domain.todo.value_objects import TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo import TodoRepositoryImpl, TodoUnitOfWorkImpl
+from dddpy.usecase.todo.update_todo_usecase import UpdateTodoUseCaseImpl
+
+THREADS = 64
+INCREMENTS_PER_THREAD = 3
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Create a session factory bound to a file-backed SQLite database."""
+    engine = create_engine(
+        f'sqlite:///{tmp_path / "todo.db"}',
+        connect_args={'check_same_thread': False, 'timeout': 60},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def test_concurrent_updates_lose_nothing(session_factory):
+    """Test 64 threads incrementing a counter in one todo never lose a write."""
+    todo = Todo.create(TodoTitle('0'))
+    with session_factory() as session:
+        unit_of_work = TodoUnitOfWorkImpl(session)
+        unit_of_work.todos.save(todo)
+        unit_of_work.commit()
+
+    conflicts = 0
+    errors = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(THREADS)
+
+    def increment() -> None:
+        nonlocal conflicts
+        barrier.wait()
+        done = 0
+        while done < INCREMENTS_PER_THREAD:
+            with session_factory() as session:
+                unit_of_work = TodoUnitOfWorkImpl(session)
+                usecase = UpdateTodoUseCaseImpl(unit_of_work, SystemClock())
+                current = unit_of_work.todos.find_by_id(todo.id)
+                try:
+                    usecase.execute(
+                        todo.id,
+                        title=TodoTitle(str(int(current.title.value) + 1)),
+                        expected_version=current.version,
+                    )
+                except TodoVersionConflictError:
+                    unit_of_work.rollback()
+                    with lock:
+                        conflicts += 1
+                    continue
+                except Exception as e:
+                    errors.append(e)
+                    return
+            done += 1
+
+    threads = [threading.Thread(target=increment) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with session_factory() as session:
+        stored = TodoRepositoryImpl(session).find_by_id(todo.id)
+    total = THREADS * INCREMENTS_PER_THREAD
+    assert stored.title == TodoTitle(str(total))
+    assert stored.version == total + 1
+    assert conflicts > 0
@@ -0,0 +1,136 @@
+"""Test cases for TodoIdBloomFilter against an in-memory SQLite database."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoId, TodoTimestamp, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo import TodoIdBloomFilter, TodoRepositoryImpl
+
+
+@pytest.fixture
+def engine():
+    """Create an in-memory database shared by every session."""
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    """Create a factory of sessions bound to the test database."""
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def todos(session_factory):
+    """Store five todos and return them."""
+    todos = [Todo.create(TodoTitle(f'Todo {i}')) for i in range(5)]
+    with session_factory() as session:
+        repository = TodoRepositoryImpl(session)
+        for todo in todos:
+            repository.save(todo)
+        repository.flush()
+        session.commit()
+    return todos
+
+
+@pytest.fixture
+def statements(engine):
+    """Record the SQL statements executed on the engine."""
+    executed = []
+    event.listen(
+        engine,
+        'before_cursor_execute',
+        lambda conn, cursor, statement, *args: executed.append(statement),
+    )
+    return executed
+
+
+def test_unbuilt_filter_lets_every_id_through():
+    """Test no identifier is rejected before the first build."""
+    todo_id_filter = TodoIdBloomFilter()
+
+    assert todo_id_filter.might_contain(TodoId.generate())
+    assert todo_id_filter.stats().queries_avoided == 0
+
+
+def test_rebuild_streams_every_stored_id(session_factory, todos):
+    """Test a rebuild reads every identifier across chunks."""
+    todo_id_filter = TodoIdBloomFilter()
+
+    todo_id_filter.rebuild(session_factory, chunk_size=2)
+
+    assert all(todo_id_filter.might_contain(todo.id) for todo in todos)
+    stats = todo_id_filter.stats()
+    assert stats.items == 5
+    assert stats.rebuilds == 1
+
+
+def test_false_positive_rate_is_bounded(session_factory, todos):
+    """Test absent identifiers are mostly rejected at capacity."""
+    todo_id_filter = TodoIdBloomFilter(false_positive_rate=0.01, min_capacity=1000)
+    todo_id_filter.rebuild(session_factory)
+    for _ in range(995):
+        todo_id_filter.add(TodoId.generate())
+
+    passed = sum(todo_id_filter.might_contain(TodoId.generate()) for _ in range(10_000))
+
+    assert passed < 300
+
+
+def test_rebuild_keeps_recently_added_ids(session_factory, todos):
+    """Test ids staged before a rebuild but not yet committed survive it."""
+    todo_id_filter = TodoIdBloomFilter()
+    staged = TodoId.generate()
+    todo_id_filter.add(staged)
+
+    todo_id_filter.rebuild(session_factory)
+
+    assert todo_id_filter.might_contain(staged)
+
+
+def test_repository_skips_query_for_absent_id(session_factory, todos, statements):
+    """Test lookups of definitely-absent ids never reach SQLite."""
+    todo_id_filter = TodoIdBloomFilter()
+    todo_id_filter.rebuild(session_factory)
+    statements.clear()
+    now = TodoTimestamp.now()
+
+    with session_factory() as session:
+        repository = TodoRepositoryImpl(session, todo_id_filter)
+        missing = TodoId.generate()
+        while todo_id_filter.might_contain(missing):
+            missing = TodoId.generate()
+
+        assert repository.find_by_id(missing) is None
+        assert repository.start(missing, now) is None
+        assert repository.delete(missing) is False
+        assert statements == []
+        assert repository.find_by_id(todos[0].id) == todos[0]
+
+    assert todo_id_filter.stats().queries_avoided >= 3
+
+
+def test_repository_adds_saved_todos(session_factory):
+    """Test saving a new todo makes it visible to the filter."""
+    todo_id_filter = TodoIdBloomFilter()
+    todo_id_filter.rebuild(session_factory)
+    todo = Todo.create(TodoTitle('New'))
+
+    with session_factory() as session:
+        repository = TodoRepositoryImpl(session, todo_id_filter)
+        repository.save(todo)
+        repository.flush()
+        session.commit()
+
+    with session_factory() as session:
+        repository = TodoRepositoryImpl(session, todo_id_filter)
+        assert repository.find_by_id(todo.id) == todo
+        assert repository.delete(todo.id) is True
+
+    assert todo_id_filter.stats().deletes == 1
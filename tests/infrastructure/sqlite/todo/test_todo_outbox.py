@@ -0,0 +1,174 @@
+"""Test cases for the todo event outbox and TodoOutboxRelay."""
+
+import json
+import time
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from dddpy.domain.todo.clocks import FixedClock
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.value_objects import TodoId, TodoTimestamp, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo import (
+    TodoOutboxDTO,
+    TodoOutboxRelay,
+    TodoUnitOfWorkImpl,
+)
+from dddpy.usecase.todo.create_todo_usecase import CreateTodoUseCaseImpl
+from dddpy.usecase.todo.start_todo_usecase import StartTodoUseCaseImpl
+
+NOW = TodoTimestamp(1136214245000)
+
+
+@pytest.fixture
+def session_factory():
+    """Create a factory of sessions sharing one in-memory database."""
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def create_todos(session_factory):
+    """Return a function creating and starting todos through the outbox."""
+
+    def create(count):
+        todos = []
+        with session_factory() as session:
+            unit_of_work = TodoUnitOfWorkImpl(
+                session, outbox=True, clock=FixedClock(NOW)
+            )
+            for i in range(count):
+                todo = CreateTodoUseCaseImpl(unit_of_work, FixedClock(NOW)).execute(
+                    TodoTitle(f'Todo {i}')
+                )
+                StartTodoUseCaseImpl(unit_of_work, FixedClock(NOW)).execute(todo.id)
+                todos.append(todo)
+        return todos
+
+    return create
+
+
+def _write_rows(session_factory, count):
+    """Write outbox rows directly, as committed transactions would."""
+    with session_factory() as session:
+        session.execute(
+            TodoOutboxDTO.__table__.insert(),
+            [
+                {
+                    'todo_id': TodoId.generate().value,
+                    'kind': 'deleted',
+                    'payload': '{}',
+                    'created_at': NOW.value,
+                }
+                for _ in range(count)
+            ],
+        )
+        session.commit()
+
+
+def _outbox_size(session_factory):
+    """Count the rows left in the outbox."""
+    with session_factory() as session:
+        return session.scalar(select(func.count()).select_from(TodoOutboxDTO))
+
+
+def test_events_are_written_in_the_transaction(session_factory, create_todos):
+    """Test each committed change leaves one outbox row."""
+    (todo,) = create_todos(1)
+
+    with session_factory() as session:
+        rows = session.execute(select(TodoOutboxDTO).order_by(TodoOutboxDTO.id))
+        outbox = rows.scalars().all()
+
+    assert [row.kind for row in outbox] == ['created', 'started']
+    assert all(row.todo_id == todo.id.value for row in outbox)
+    assert json.loads(outbox[1].payload)['status'] == 'in_progress'
+    assert all(row.created_at == NOW.value for row in outbox)
+
+
+def test_rolled_back_events_are_not_written(session_factory):
+    """Test a rollback leaves no outbox rows behind."""
+    with session_factory() as session:
+        unit_of_work = TodoUnitOfWorkImpl(session, outbox=True)
+        unit_of_work.todos.save(Todo.create(TodoTitle('Discarded'), now=NOW))
+
+        unit_of_work.rollback()
+        unit_of_work.commit()
+
+    assert _outbox_size(session_factory) == 0
+
+
+def test_relay_delivers_rows_in_order_in_batches(session_factory, create_todos):
+    """Test the relay drains the outbox in order and advances its cursor."""
+    create_todos(3)
+    relay = TodoOutboxRelay(session_factory, batch_size=4)
+    received = []
+    relay.subscribe(received.extend)
+
+    assert relay.relay_once() == 4
+    assert relay.relay_once() == 2
+    assert relay.relay_once() == 0
+
+    assert [message.id for message in received] == [1, 2, 3, 4, 5, 6]
+    stats = relay.stats()
+    assert stats.delivered == 6
+    assert stats.batches == 2
+    assert stats.cursor == 6
+
+
+def test_relay_redelivers_after_handler_failure(session_factory, create_todos):
+    """Test a failed batch is delivered again on the next poll."""
+    create_todos(1)
+    relay = TodoOutboxRelay(session_factory)
+    attempts = []
+
+    def flaky(messages):
+        attempts.append([message.id for message in messages])
+        if len(attempts) == 1:
+            raise RuntimeError('unavailable')
+
+    relay.subscribe(flaky)
+
+    assert relay.relay_once() == 0
+    assert relay.relay_once() == 2
+    assert attempts == [[1, 2], [1, 2]]
+    assert relay.stats().failures == 1
+
+
+def test_prune_deletes_only_delivered_rows(session_factory, create_todos):
+    """Test pruning keeps rows the relay has not delivered yet."""
+    create_todos(2)
+    relay = TodoOutboxRelay(
+        session_factory,
+        batch_size=2,
+        retention_seconds=60,
+        clock=lambda: time.time() + 120,
+    )
+    relay.relay_once()
+
+    assert relay.prune() == 2
+    assert relay.pending() == 2
+    assert _outbox_size(session_factory) == 2
+
+
+def test_ids_are_not_reused_after_pruning_everything(session_factory):
+    """Test rows written after the outbox was emptied are still relayed."""
+    relay = TodoOutboxRelay(
+        session_factory, retention_seconds=60, clock=lambda: time.time() + 120
+    )
+    received = []
+    relay.subscribe(received.extend)
+    _write_rows(session_factory, 3)
+    relay.relay_once()
+    relay.prune()
+
+    _write_rows(session_factory, 1)
+
+    assert relay.pending() == 1
+    assert relay.relay_once() == 1
+    assert [message.id for message in received] == [1, 2, 3, 4]
@@ -0,0 +1,188 @@
+"""Test cases for TodoRepositoryImpl against an in-memory SQLite database."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoVersionConflictError
+from dddpy.domain.todo.value_objects import (
+    TodoDescription,
+    TodoId,
+    TodoStatus,
+    TodoTimestamp,
+    TodoTitle,
+)
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo import TodoRepositoryImpl
+
+
+@pytest.fixture
+def session():
+    """Create a session bound to a fresh in-memory database."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def todo_repository(session):
+    """Create a repository bound to the test session."""
+    return TodoRepositoryImpl(session)
+
+
+def test_find_all_as_batch(todo_repository):
+    """Test loading every todo into a columnar batch."""
+    first = Todo.create(TodoTitle('First'), TodoDescription('Description'))
+    second = Todo.create(TodoTitle('Second'))
+    second.complete()
+    todo_repository.save(first)
+    todo_repository.save(second)
+    todo_repository.flush()
+
+    batch = todo_repository.find_all_as_batch()
+
+    assert len(batch) == 2
+    todos = {todo.id: todo for todo in batch.to_todos()}
+    assert todos[first.id].description == TodoDescription('Description')
+    assert todos[second.id].status == TodoStatus.COMPLETED
+    assert batch.status_mask(TodoStatus.COMPLETED).count(1) == 1
+
+
+def test_start_transitions_not_started_todo(todo_repository):
+    """Test starting a todo updates status and timestamp atomically."""
+    todo = Todo.create(TodoTitle('Todo'))
+    todo_repository.save(todo)
+    now = TodoTimestamp(todo.created_at.value + 1000)
+
+    started = todo_repository.start(todo.id, now)
+
+    assert started == todo
+    assert started.status == TodoStatus.IN_PROGRESS
+    assert started.updated_at == now
+    assert todo_repository.find_by_id(todo.id).status == TodoStatus.IN_PROGRESS
+
+
+def test_start_skips_todo_in_other_status(todo_repository):
+    """Test starting only applies to todos that have not been started."""
+    todo = Todo.create(TodoTitle('Todo'))
+    todo_repository.save(todo)
+    todo_repository.start(todo.id, TodoTimestamp.now())
+
+    assert todo_repository.start(todo.id, TodoTimestamp.now()) is None
+    assert todo_repository.start(TodoId.generate(), TodoTimestamp.now()) is None
+
+
+def test_complete_transitions_in_progress_todo(todo_repository):
+    """Test completing a todo sets status and completion time atomically."""
+    todo = Todo.create(TodoTitle('Todo'))
+    todo_repository.save(todo)
+    now = TodoTimestamp(todo.created_at.value + 1000)
+
+    assert todo_repository.complete(todo.id, now) is None
+
+    todo_repository.start(todo.id, now)
+    completed = todo_repository.complete(todo.id, now)
+
+    assert completed.status == TodoStatus.COMPLETED
+    assert completed.completed_at == now
+    assert todo_repository.complete(todo.id, now) is None
+
+
+def test_save_defers_write_until_flush(session, todo_repository):
+    """Test a saved todo is only written when the repository is flushed."""
+    todo = Todo.create(TodoTitle('Todo'))
+
+    todo_repository.save(todo)
+    assert todo.version == 0
+    assert TodoRepositoryImpl(session).find_by_id(todo.id) is None
+
+    todo_repository.flush()
+    assert todo.version == 1
+    assert TodoRepositoryImpl(session).find_by_id(todo.id).title == todo.title
+
+
+def test_find_by_id_returns_tracked_instance(session, todo_repository):
+    """Test loading the same todo twice yields one identity-mapped entity."""
+    todo = Todo.create(TodoTitle('Todo'))
+    todo_repository.save(todo)
+    todo_repository.flush()
+    repository = TodoRepositoryImpl(session)
+
+    loaded = repository.find_by_id(todo.id)
+
+    assert repository.find_by_id(todo.id) is loaded
+    assert repository.find_all()[0] is loaded
+    assert repository.identity_map_size == 1
+
+
+def test_flush_increments_version(session, todo_repository):
+    """Test each flush stores and reports the next version."""
+    todo = Todo.create(TodoTitle('Todo'))
+
+    todo_repository.save(todo)
+    todo_repository.flush()
+    assert todo.version == 1
+
+    todo.update_title(TodoTitle('Updated'))
+    todo_repository.save(todo)
+    todo_repository.flush()
+    assert todo.version == 2
+    assert TodoRepositoryImpl(session).find_by_id(todo.id).version == 2
+
+
+def test_flush_rejects_stale_version(session, todo_repository):
+    """Test flushing a todo loaded before a concurrent write fails."""
+    todo = Todo.create(TodoTitle('Todo'))
+    todo_repository.save(todo)
+    todo_repository.flush()
+    stale_repository = TodoRepositoryImpl(session)
+    stale = stale_repository.find_by_id(todo.id)
+    fresh = todo_repository.find_by_id(todo.id)
+
+    fresh.update_title(TodoTitle('First writer'))
+    todo_repository.save(fresh)
+    todo_repository.flush()
+
+    stale.update_title(TodoTitle('Second writer'))
+    stale_repository.save(stale)
+    with pytest.raises(TodoVersionConflictError):
+        stale_repository.flush()
+    assert TodoRepositoryImpl(session).find_by_id(todo.id).title == TodoTitle(
+        'First writer'
+    )
+
+
+def test_delete_reports_whether_todo_existed(todo_repository):
+    """Test deleting returns whether a todo was removed."""
+    todo = Todo.create(TodoTitle('Todo'))
+    todo_repository.save(todo)
+
+    assert todo_repository.delete(todo.id) is True
+    assert todo_repository.delete(todo.id) is False
+    assert todo_repository.find_by_id(todo.id) is None
+
+
+def test_start_many_and_find_statuses(todo_repository):
+    """Test a set-based start only moves not-started todos."""
+    todos = [Todo.create(TodoTitle(f'Todo {n}')) for n in range(3)]
+    for todo in todos:
+        todo_repository.save(todo)
+    todo_repository.start(todos[0].id, TodoTimestamp.now())
+    ids = [todo.id for todo in todos] + [TodoId.generate()]
+    now = TodoTimestamp.now()
+
+    started = todo_repository.start_many(ids, now)
+
+    assert {todo.id for todo in started} == {todos[1].id, todos[2].id}
+    assert all(todo.updated_at == now for todo in started)
+    assert todo_repository.find_statuses(ids) == {
+        todo.id: TodoStatus.IN_PROGRESS for todo in todos
+    }
+
+    completed = todo_repository.complete_many(ids, now)
+    assert len(completed) == 3
+    assert all(todo.completed_at == now for todo in completed)
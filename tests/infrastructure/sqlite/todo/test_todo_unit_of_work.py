@@ -0,0 +1,214 @@
+"""Statement-count tests for todo use cases running on TodoUnitOfWorkImpl."""
+
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from dddpy.domain.todo.clocks import FixedClock
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind
+from dddpy.domain.todo.value_objects import TodoStatus, TodoTimestamp, TodoTitle
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.todo import TodoUnitOfWorkImpl
+from dddpy.usecase.todo import TodoEventPublisher
+from dddpy.usecase.todo.complete_todo_usecase import CompleteTodoUseCaseImpl
+from dddpy.usecase.todo.create_todo_usecase import CreateTodoUseCaseImpl
+from dddpy.usecase.todo.delete_todo_usecase import DeleteTodoUseCaseImpl
+from dddpy.usecase.todo.find_todo_by_id_usecase import FindTodoByIdUseCaseImpl
+from dddpy.usecase.todo.find_todos_usecase import FindTodosUseCaseImpl
+from dddpy.usecase.todo.start_todo_usecase import StartTodoUseCaseImpl
+from dddpy.usecase.todo.start_todos_usecase import StartTodosUseCaseImpl
+from dddpy.usecase.todo.update_todo_usecase import UpdateTodoUseCaseImpl
+
+NOW = TodoTimestamp(1136214245000)
+
+
+@pytest.fixture
+def engine():
+    """Create an in-memory database engine."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(engine):
+    """Record every SQL statement sent to the database."""
+    executed: List[str] = []
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    return executed
+
+
+@pytest.fixture
+def unit_of_work(engine):
+    """Create a unit of work bound to a fresh session."""
+    session = sessionmaker(bind=engine)()
+    yield TodoUnitOfWorkImpl(session)
+    session.close()
+
+
+@pytest.fixture
+def clock():
+    """Create a clock fixed at a known time."""
+    return FixedClock(NOW)
+
+
+@pytest.fixture
+def todo(engine):
+    """Store a not-started todo through a separate unit of work."""
+    todo = Todo.create(TodoTitle('Todo'), now=NOW)
+    with sessionmaker(bind=engine)() as session:
+        unit_of_work = TodoUnitOfWorkImpl(session)
+        unit_of_work.todos.save(todo)
+        unit_of_work.commit()
+    return todo
+
+
+def test_create_issues_one_statement(unit_of_work, clock, statements):
+    """Test creating a todo issues a single INSERT."""
+    CreateTodoUseCaseImpl(unit_of_work, clock).execute(TodoTitle('New'))
+
+    assert len(statements) == 1
+    assert statements[0].startswith('INSERT')
+
+
+def test_find_by_id_issues_one_statement(unit_of_work, todo, statements):
+    """Test finding a todo twice in one unit of work reads it once."""
+    usecase = FindTodoByIdUseCaseImpl(unit_of_work.todos)
+
+    usecase.execute(todo.id)
+    usecase.execute(todo.id)
+
+    assert len(statements) == 1
+
+
+def test_find_todos_issues_one_statement(unit_of_work, todo, statements):
+    """Test listing todos issues a single SELECT."""
+    FindTodosUseCaseImpl(unit_of_work.todos).execute()
+
+    assert len(statements) == 1
+
+
+def test_update_issues_two_statements(unit_of_work, clock, todo, statements):
+    """Test updating a todo reads it once and writes it once."""
+    UpdateTodoUseCaseImpl(unit_of_work, clock).execute(
+        todo.id, title=TodoTitle('Updated'), expected_version=1
+    )
+
+    assert len(statements) == 2
+    assert statements[0].startswith('SELECT')
+    assert statements[1].startswith('UPDATE')
+
+
+def test_update_writes_only_changed_columns(unit_of_work, clock, todo, statements):
+    """Test updating the title leaves the other columns out of the UPDATE."""
+    UpdateTodoUseCaseImpl(unit_of_work, clock).execute(
+        todo.id, title=TodoTitle('Updated')
+    )
+
+    set_clause = statements[1].split(' SET ')[1].split(' WHERE ')[0]
+    assert set_clause == 'title=?, updated_at=?, version=?'
+    assert unit_of_work.todos.find_by_id(todo.id).title == TodoTitle('Updated')
+
+
+def test_unchanged_todo_is_not_written(unit_of_work, todo, statements):
+    """Test committing a loaded but unchanged todo issues no UPDATE."""
+    loaded = unit_of_work.todos.find_by_id(todo.id)
+    unit_of_work.todos.save(loaded)
+
+    unit_of_work.commit()
+
+    assert len(statements) == 1
+    assert loaded.version == 1
+
+
+def test_start_issues_one_statement(unit_of_work, clock, todo, statements):
+    """Test starting a todo issues a single conditional UPDATE."""
+    started = StartTodoUseCaseImpl(unit_of_work, clock).execute(todo.id)
+
+    assert started.status == TodoStatus.IN_PROGRESS
+    assert len(statements) == 1
+
+
+def test_complete_issues_one_statement(unit_of_work, clock, todo, statements):
+    """Test completing a todo issues a single conditional UPDATE."""
+    StartTodoUseCaseImpl(unit_of_work, clock).execute(todo.id)
+    statements.clear()
+
+    completed = CompleteTodoUseCaseImpl(unit_of_work, clock).execute(todo.id)
+
+    assert completed.status == TodoStatus.COMPLETED
+    assert len(statements) == 1
+
+
+def test_start_many_issues_at_most_two_statements(
+    unit_of_work, clock, todo, statements
+):
+    """Test starting todos in bulk updates them all with one statement."""
+    usecase = StartTodosUseCaseImpl(unit_of_work, clock)
+
+    report = usecase.execute([todo.id])
+    assert len(report.transitioned) == 1
+    assert len(statements) == 1
+
+    statements.clear()
+    report = usecase.execute([todo.id])
+    assert len(report.rejected) == 1
+    assert len(statements) == 2
+
+
+def test_delete_issues_one_statement(unit_of_work, todo, statements):
+    """Test deleting a todo issues a single DELETE without reading it first."""
+    DeleteTodoUseCaseImpl(unit_of_work).execute(todo.id)
+
+    assert len(statements) == 1
+    assert statements[0].startswith('DELETE')
+
+
+def test_rollback_discards_staged_todos(unit_of_work, statements):
+    """Test rolling back forgets todos staged since the last commit."""
+    todo = Todo.create(TodoTitle('Discarded'), now=NOW)
+    unit_of_work.todos.save(todo)
+
+    unit_of_work.rollback()
+    unit_of_work.commit()
+
+    assert statements == []
+    assert unit_of_work.todos.find_by_id(todo.id) is None
+
+
+def test_events_are_published_after_commit(engine, clock):
+    """Test recorded events are published once, after the commit."""
+    publisher = Mock(spec=TodoEventPublisher)
+    with sessionmaker(bind=engine)() as session:
+        unit_of_work = TodoUnitOfWorkImpl(session, event_publisher=publisher)
+        todo = CreateTodoUseCaseImpl(unit_of_work, clock).execute(TodoTitle('New'))
+        created = todo.snapshot()
+        started = StartTodoUseCaseImpl(unit_of_work, clock).execute(todo.id)
+
+    assert [call.args[0] for call in publisher.publish.call_args_list] == [
+        [TodoEvent(TodoEventKind.CREATED, todo.id, created)],
+        [TodoEvent(TodoEventKind.STARTED, todo.id, started.snapshot())],
+    ]
+
+
+def test_rollback_discards_recorded_events(engine):
+    """Test events recorded before a rollback are never published."""
+    publisher = Mock(spec=TodoEventPublisher)
+    todo = Todo.create(TodoTitle('Discarded'), now=NOW)
+    with sessionmaker(bind=engine)() as session:
+        unit_of_work = TodoUnitOfWorkImpl(session, event_publisher=publisher)
+        unit_of_work.record(TodoEvent(TodoEventKind.CREATED, todo.id, todo.snapshot()))
+
+        unit_of_work.rollback()
+        unit_of_work.commit()
+
+    publisher.publish.assert_not_called()
@@ -0,0 +1,117 @@
+"""Test cases for Tracer and its exporters."""
+
+import contextvars
+import json
+import threading
+
+import pytest
+
+from dddpy.infrastructure.tracing import (
+    OtlpJsonFileSpanExporter,
+    RingBufferSpanExporter,
+    SpanKind,
+    Tracer,
+    current_span,
+    trace_methods,
+)
+
+
+class Repository:
+    """Stand-in for a traced class."""
+
+    def find(self, fail=False):
+        if fail:
+            raise LookupError
+        return current_span()
+
+
+trace_methods(Repository, ('find',), Tracer())
+
+
+def test_unsampled_trace_records_nothing():
+    """Test no span is started when the trace is not sampled."""
+    buffer = RingBufferSpanExporter()
+    tracer = Tracer(sample_rate=0.0, exporters=[buffer])
+
+    with tracer.start_trace('GET /todos') as root:
+        assert Repository().find() is None
+        with tracer.span('child') as child:
+            assert child is None
+
+    assert root is None
+    assert buffer.traces() == []
+
+
+def test_sampled_trace_links_children_across_threads():
+    """Test children, including ones in copied contexts, join the trace."""
+    buffer = RingBufferSpanExporter()
+    tracer = Tracer(sample_rate=1.0, exporters=[buffer])
+
+    with tracer.start_trace('GET /todos') as root:
+        found = Repository().find()
+        with tracer.span('render'):
+            pass
+        context = contextvars.copy_context()
+        thread = threading.Thread(target=context.run, args=(Repository().find,))
+        thread.start()
+        thread.join()
+    assert current_span() is None
+
+    [spans] = buffer.traces()
+    assert spans[-1] is root
+    assert [span.name for span in spans] == [
+        'Repository.find',
+        'render',
+        'Repository.find',
+        'GET /todos',
+    ]
+    assert found.parent_id == root.span_id
+    assert all(span.trace_id == root.trace_id for span in spans)
+
+
+def test_errors_are_recorded_on_the_span():
+    """Test a raising call ends its span with the exception type."""
+    buffer = RingBufferSpanExporter()
+    tracer = Tracer(sample_rate=1.0, exporters=[buffer])
+
+    with tracer.start_trace('GET /todos'):
+        with pytest.raises(LookupError):
+            Repository().find(fail=True)
+
+    [spans] = buffer.traces()
+    assert spans[0].error == 'LookupError'
+    assert spans[-1].error is None
+
+
+def test_ring_buffer_keeps_most_recent_traces():
+    """Test old traces are discarded and recent ones come first."""
+    buffer = RingBufferSpanExporter(capacity=2)
+    tracer = Tracer(sample_rate=1.0, exporters=[buffer])
+    for name in ('a', 'b', 'c'):
+        with tracer.start_trace(name):
+            pass
+
+    assert [spans[-1].name for spans in buffer.traces()] == ['c', 'b']
+    assert len(buffer.traces(limit=1)) == 1
+
+
+def test_file_exporter_writes_otlp_json(tmp_path):
+    """Test traces are appended as OTLP/JSON export requests."""
+    path = tmp_path / 'traces.jsonl'
+    exporter = OtlpJsonFileSpanExporter(str(path))
+    tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+    with tracer.start_trace('GET /todos', attributes={'http.status_code': 200}):
+        with tracer.span('SELECT', SpanKind.CLIENT):
+            pass
+    tracer.shutdown()
+
+    [line] = path.read_text().splitlines()
+    spans = json.loads(line)['resourceSpans'][0]['scopeSpans'][0]['spans']
+    child, root = spans
+    assert len(root['traceId']) == 32
+    assert 'parentSpanId' not in root
+    assert child['parentSpanId'] == root['spanId']
+    assert child['kind'] == SpanKind.CLIENT.value
+    assert root['attributes'] == [
+        {'key': 'http.status_code', 'value': {'intValue': '200'}}
+    ]
@@ -0,0 +1,34 @@
+"""Tests of the access check on the debug routes."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.parametrize(
+    ('method', 'path'),
+    [
+        ('GET', '/debug/traces'),
+        ('GET', '/debug/profiles'),
+        ('GET', '/debug/profiles/unknown'),
+        ('GET', '/debug/memory'),
+        ('POST', '/debug/memory/tracemalloc/start'),
+        ('POST', '/debug/memory/tracemalloc/stop'),
+        ('POST', '/debug/memory/snapshots/base'),
+        ('GET', '/debug/memory/diff?base=base'),
+    ],
+)
+def test_other_clients_are_forbidden(client, method, path):
+    """Test clients outside the allowed hosts cannot reach any debug route."""
+    response = client.request(method, path)
+
+    assert response.status_code == 403
+
+
+def test_allowed_client_reads_traces(client):
+    """Test a local client is served the debug routes."""
+    local = TestClient(client.app, client=('127.0.0.1', 50000))
+
+    response = local.get('/debug/traces')
+
+    assert response.status_code == 200
+    assert 'traces' in response.json()
@@ -0,0 +1,25 @@
+"""Tests of on-demand request profiling."""
+
+from fastapi.testclient import TestClient
+
+
+def test_allowed_client_gets_a_profile(client):
+    """Test a local request with X-Profile is profiled and listed."""
+    local = TestClient(client.app, client=('127.0.0.1', 50000))
+
+    response = local.get('/todos', headers={'X-Profile': 'pstats'})
+
+    assert response.status_code == 200
+    profile = local.get(response.headers['X-Profile-Url'])
+    assert profile.status_code == 200
+    assert b'get_todos' in profile.content
+    listed = local.get('/debug/profiles').json()['profiles']
+    assert listed[0]['id'] == response.headers['X-Profile-Id']
+
+
+def test_other_clients_are_not_profiled(client):
+    """Test the header is ignored for clients outside the allowed hosts."""
+    response = client.get('/todos', headers={'X-Profile': '1'})
+
+    assert response.status_code == 200
+    assert 'X-Profile-Id' not in response.headers
@@ -0,0 +1,61 @@
+"""Test cases for the JSON Merge Patch route."""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def todo_id(client):
+    """Create a todo through the API and return its id."""
+    response = client.post('/todos', json={'title': 'Write', 'description': 'Docs'})
+    return response.json()['id']
+
+
+def test_patch_leaves_missing_members_unchanged(client, todo_id):
+    """Test members absent from the patch keep their values."""
+    response = client.patch(f'/todos/{todo_id}', json={'title': 'Edit'})
+
+    assert response.status_code == 200
+    assert response.json()['title'] == 'Edit'
+    assert response.json()['description'] == 'Docs'
+    assert response.headers['ETag'] == '"2"'
+
+
+def test_patch_with_null_description_clears_it(client, todo_id):
+    """Test a null description removes it and keeps the title."""
+    response = client.patch(f'/todos/{todo_id}', json={'description': None})
+
+    assert response.status_code == 200
+    assert response.json()['title'] == 'Write'
+    assert response.json()['description'] == ''
+    assert client.get(f'/todos/{todo_id}').json()['description'] == ''
+
+
+def test_patch_with_null_title_is_rejected(client, todo_id):
+    """Test the title cannot be removed."""
+    response = client.patch(f'/todos/{todo_id}', json={'title': None})
+
+    assert response.status_code == 422
+    assert client.get(f'/todos/{todo_id}').json()['title'] == 'Write'
+
+
+def test_patch_accepts_merge_patch_content_type(client, todo_id):
+    """Test a document sent as application/merge-patch+json is applied."""
+    response = client.patch(
+        f'/todos/{todo_id}',
+        content=json.dumps({'description': 'Merged'}),
+        headers={'Content-Type': 'application/merge-patch+json'},
+    )
+
+    assert response.status_code == 200
+    assert response.json()['description'] == 'Merged'
+
+
+def test_patch_with_stale_if_match_is_rejected(client, todo_id):
+    """Test a patch based on an outdated version fails with 412."""
+    response = client.patch(
+        f'/todos/{todo_id}', json={'title': 'Edit'}, headers={'If-Match': '"7"'}
+    )
+
+    assert response.status_code == 412
@@ -0,0 +1,51 @@
+"""Statement budgets of the todo routes."""
+
+import pytest
+
+
+@pytest.fixture
+def todo_id(client):
+    """Create a todo through the API and return its id."""
+    response = client.post('/todos', json={'title': 'Write', 'description': 'Docs'})
+    return response.json()['id']
+
+
+def test_create_todo_within_budget(client, statement_budget):
+    """Test creating a todo inserts it and its outbox row."""
+    with statement_budget(2):
+        response = client.post('/todos', json={'title': 'Write'})
+    assert response.status_code == 201
+
+
+def test_read_routes_within_budget(client, statement_budget, todo_id):
+    """Test reads run a single query."""
+    with statement_budget(1):
+        assert client.get(f'/todos/{todo_id}').status_code == 200
+        assert client.get('/todos').status_code == 200
+
+
+def test_update_todo_within_budget(client, statement_budget, todo_id):
+    """Test an update loads, writes and records the event once each."""
+    with statement_budget(3):
+        response = client.put(
+            f'/todos/{todo_id}', json={'title': 'Edit', 'description': 'Docs'}
+        )
+    assert response.status_code == 200
+
+
+def test_transitions_within_budget(client, statement_budget, todo_id):
+    """Test start and complete each update the row in a single statement."""
+    with statement_budget(2):
+        assert client.patch(f'/todos/{todo_id}/start').status_code == 200
+        assert client.patch(f'/todos/{todo_id}/complete').status_code == 200
+
+
+def test_server_timing_reports_phases(client, todo_id):
+    """Test the header splits the request into db, app and serialize."""
+    header = client.get(f'/todos/{todo_id}').headers['Server-Timing']
+
+    assert [part.split(';')[0].strip() for part in header.split(',')] == [
+        'db',
+        'app',
+        'serialize',
+    ]
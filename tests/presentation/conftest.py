@@ -0,0 +1,64 @@
+"""Fixtures running the API against a temporary database."""
+
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dddpy.infrastructure.di.injection import get_todo_unit_of_work
+from dddpy.infrastructure.sqlite.database import Base
+from dddpy.infrastructure.sqlite.statement_stats import instrument_statement_stats
+from dddpy.infrastructure.sqlite.todo.todo_unit_of_work import new_todo_unit_of_work
+from dddpy.presentation.api.metrics import statement_count
+from main import app
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Serve the API from a fresh database file, without background jobs."""
+    engine = create_engine(
+        f'sqlite:///{tmp_path / "sqlite.db"}',
+        connect_args={'check_same_thread': False},
+    )
+    instrument_statement_stats(engine)
+    Base.metadata.create_all(bind=engine)
+    sessions = sessionmaker(bind=engine)
+
+    def unit_of_work():
+        with sessions() as session:
+            yield new_todo_unit_of_work(session, outbox=True)
+
+    app.dependency_overrides[get_todo_unit_of_work] = unit_of_work
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+@pytest.fixture
+def statement_budget(client):
+    """Fail the test when a request runs more SQL statements than declared.
+
+    Use as ``with statement_budget(2): client.put(...)``; every response
+    received inside the block is checked.
+    """
+
+    @contextmanager
+    def budget(limit):
+        responses = []
+        client.event_hooks['response'].append(responses.append)
+        try:
+            yield
+        finally:
+            client.event_hooks['response'].remove(responses.append)
+        for response in responses:
+            count = statement_count(response.headers.get('Server-Timing', ''))
+            assert count is not None, 'response has no statement count'
+            if count > limit:
+                pytest.fail(
+                    f'{response.request.method} {response.request.url.path} ran '
+                    f'{count} SQL statements, over its budget of {limit}'
+                )
+
+    return budget
@@ -5,11 +5,16 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from dddpy.domain.todo.clocks import FixedClock
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoNotStartedError
 from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTitle
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTimestamp, TodoTitle
+from dddpy.usecase.todo import TodoUnitOfWork
 from dddpy.usecase.todo.complete_todo_usecase import CompleteTodoUseCaseImpl
 
+NOW = TodoTimestamp(1136214245000)
+
 
 @pytest.fixture
 def todo_repository_mock():
@@ -18,9 +23,23 @@ def todo_repository_mock():
 
 
 @pytest.fixture
-def complete_todo_usecase(todo_repository_mock):
-    """Create a CompleteTodoUseCaseImpl instance with mocked repository."""
-    return CompleteTodoUseCaseImpl(todo_repository_mock)
+def unit_of_work_mock(todo_repository_mock):
+    """Create a mock TodoUnitOfWork exposing the mocked repository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    return unit_of_work
+
+
+@pytest.fixture
+def clock():
+    """Create a clock fixed at a known time."""
+    return FixedClock(NOW)
+
+
+@pytest.fixture
+def complete_todo_usecase(unit_of_work_mock, clock):
+    """Create a CompleteTodoUseCaseImpl instance with mocked unit of work and fixed clock."""
+    return CompleteTodoUseCaseImpl(unit_of_work_mock, clock)
 
 
 @pytest.fixture
@@ -38,22 +57,26 @@ def todo():
 def test_complete_todo_success(complete_todo_usecase, todo_repository_mock, todo):
     """Test completing a Todo successfully."""
     # Arrange
-    todo_repository_mock.find_by_id.return_value = todo
+    todo.complete(NOW)
+    todo_repository_mock.complete.return_value = todo
 
     # Act
     result = complete_todo_usecase.execute(todo.id)
 
     # Assert
     assert result.status == TodoStatus.COMPLETED
-    assert result.completed_at is not None
-    todo_repository_mock.find_by_id.assert_called_once_with(todo.id)
-    todo_repository_mock.save.assert_called_once_with(result)
+    assert result.completed_at == NOW
+    assert result.updated_at == NOW
+    todo_repository_mock.complete.assert_called_once_with(todo.id, NOW)
+    todo_repository_mock.find_by_id.assert_not_called()
+    todo_repository_mock.save.assert_not_called()
 
 
 def test_complete_todo_not_found(complete_todo_usecase, todo_repository_mock):
     """Test completing a non-existent Todo."""
     # Arrange
     todo_id = TodoId.generate()
+    todo_repository_mock.complete.return_value = None
     todo_repository_mock.find_by_id.return_value = None
 
     # Act & Assert
@@ -62,12 +85,25 @@ def test_complete_todo_not_found(complete_todo_usecase, todo_repository_mock):
     assert 'The Todo you specified does not exist' in str(exc_info.value)
 
 
+def test_complete_not_started_todo(complete_todo_usecase, todo_repository_mock):
+    """Test completing a Todo that has not been started."""
+    # Arrange
+    todo = Todo(id=TodoId.generate(), title=TodoTitle('Test Todo'))
+    todo_repository_mock.complete.return_value = None
+    todo_repository_mock.find_by_id.return_value = todo
+
+    # Act & Assert
+    with pytest.raises(TodoNotStartedError):
+        complete_todo_usecase.execute(todo.id)
+
+
 def test_complete_already_completed_todo(
     complete_todo_usecase, todo_repository_mock, todo
 ):
     """Test completing an already completed Todo."""
     # Arrange
     todo.complete()  # Make the todo completed
+    todo_repository_mock.complete.return_value = None
     todo_repository_mock.find_by_id.return_value = todo
 
     # Act & Assert
@@ -0,0 +1,84 @@
+"""Test cases for CompleteTodosUseCaseImpl."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from dddpy.domain.todo.clocks import FixedClock
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoNotStartedError
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTimestamp, TodoTitle
+from dddpy.usecase.todo import TodoUnitOfWork
+from dddpy.usecase.todo.complete_todos_usecase import CompleteTodosUseCaseImpl
+
+NOW = TodoTimestamp(1136214245000)
+
+
+@pytest.fixture
+def todo_repository_mock():
+    """Create a mock TodoRepository."""
+    return Mock(spec=TodoRepository)
+
+
+@pytest.fixture
+def unit_of_work_mock(todo_repository_mock):
+    """Create a mock TodoUnitOfWork exposing the mocked repository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    return unit_of_work
+
+
+@pytest.fixture
+def complete_todos_usecase(unit_of_work_mock):
+    """Create a CompleteTodosUseCaseImpl instance with mocked unit of work and fixed clock."""
+    return CompleteTodosUseCaseImpl(unit_of_work_mock, FixedClock(NOW))
+
+
+def test_complete_todos_reports_each_id(
+    complete_todos_usecase, todo_repository_mock, unit_of_work_mock
+):
+    """Test transitioned, rejected and missing todos are reported in order."""
+    # Arrange
+    todo = Todo(TodoId.generate(), TodoTitle('Todo'))
+    todo.start(NOW)
+    todo.complete(NOW)
+    rejected_id = TodoId.generate()
+    missing_id = TodoId.generate()
+    todo_repository_mock.complete_many.return_value = [todo]
+    todo_repository_mock.find_statuses.return_value = {
+        rejected_id: TodoStatus.NOT_STARTED
+    }
+
+    # Act
+    report = complete_todos_usecase.execute([missing_id, todo.id, rejected_id, todo.id])
+
+    # Assert
+    assert report.transitioned == [todo]
+    assert report.transitioned[0].status == TodoStatus.COMPLETED
+    assert report.not_found == [missing_id]
+    assert [todo_id for todo_id, _ in report.rejected] == [rejected_id]
+    assert isinstance(report.rejected[0][1], TodoNotStartedError)
+    todo_repository_mock.complete_many.assert_called_once_with(
+        [missing_id, todo.id, rejected_id], NOW
+    )
+    todo_repository_mock.find_statuses.assert_called_once_with(
+        [missing_id, rejected_id]
+    )
+    unit_of_work_mock.commit.assert_called_once_with()
+
+
+def test_complete_todos_skips_status_lookup_when_all_transition(
+    complete_todos_usecase, todo_repository_mock
+):
+    """Test statuses are not read when every todo was transitioned."""
+    # Arrange
+    todo = Todo(TodoId.generate(), TodoTitle('Todo'))
+    todo_repository_mock.complete_many.return_value = [todo]
+
+    # Act
+    report = complete_todos_usecase.execute([todo.id])
+
+    # Assert
+    assert report.transitioned == [todo]
+    todo_repository_mock.find_statuses.assert_not_called()
@@ -1,14 +1,20 @@
 """Test cases for CreateTodoUseCaseImpl."""
 
+from dataclasses import replace
 from unittest.mock import Mock, patch
 
 import pytest
 
+from dddpy.domain.todo.clocks import FixedClock
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind
 from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.domain.todo.value_objects import TodoDescription, TodoTitle
+from dddpy.domain.todo.value_objects import TodoDescription, TodoTimestamp, TodoTitle
+from dddpy.usecase.todo import TodoUnitOfWork
 from dddpy.usecase.todo.create_todo_usecase import CreateTodoUseCaseImpl
 
+NOW = TodoTimestamp(1136214245000)
+
 
 @pytest.fixture
 def todo_repository_mock():
@@ -17,12 +23,28 @@ def todo_repository_mock():
 
 
 @pytest.fixture
-def create_todo_usecase(todo_repository_mock):
-    """Create a CreateTodoUseCaseImpl instance with mocked repository."""
-    return CreateTodoUseCaseImpl(todo_repository_mock)
+def unit_of_work_mock(todo_repository_mock):
+    """Create a mock TodoUnitOfWork exposing the mocked repository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    return unit_of_work
+
+
+@pytest.fixture
+def clock():
+    """Create a clock fixed at a known time."""
+    return FixedClock(NOW)
 
 
-def test_create_todo_with_title_only(create_todo_usecase, todo_repository_mock):
+@pytest.fixture
+def create_todo_usecase(unit_of_work_mock, clock):
+    """Create a CreateTodoUseCaseImpl instance with mocked unit of work and fixed clock."""
+    return CreateTodoUseCaseImpl(unit_of_work_mock, clock)
+
+
+def test_create_todo_with_title_only(
+    create_todo_usecase, todo_repository_mock, unit_of_work_mock
+):
     """Test creating a Todo with only title."""
     # Arrange
     title = TodoTitle('Test Todo')
@@ -31,7 +53,15 @@ def test_create_todo_with_title_only(create_todo_usecase, todo_repository_mock):
     # Assert
     assert result.title == title
     assert result.description is None
+    assert result.created_at == NOW
+    assert result.updated_at == NOW
     todo_repository_mock.save.assert_called_once_with(result)
+    assert result.pull_events() == [
+        TodoEvent(
+            TodoEventKind.CREATED, result.id, replace(result.snapshot(), version=1)
+        )
+    ]
+    unit_of_work_mock.commit.assert_called_once_with()
 
 
 def test_create_todo_with_title_and_description(
@@ -5,8 +5,10 @@ from unittest.mock import Mock, patch
 import pytest
 
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.events import TodoEvent, TodoEventKind
 from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoId, TodoTitle
+from dddpy.usecase.todo import TodoUnitOfWork
 from dddpy.usecase.todo.delete_todo_usecase import DeleteTodoUseCaseImpl
 
 
@@ -17,9 +19,17 @@ def todo_repository_mock():
 
 
 @pytest.fixture
-def delete_todo_usecase(todo_repository_mock):
-    """Create a DeleteTodoUseCaseImpl instance with mocked repository."""
-    return DeleteTodoUseCaseImpl(todo_repository_mock)
+def unit_of_work_mock(todo_repository_mock):
+    """Create a mock TodoUnitOfWork exposing the mocked repository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    return unit_of_work
+
+
+@pytest.fixture
+def delete_todo_usecase(unit_of_work_mock):
+    """Create a DeleteTodoUseCaseImpl instance with mocked unit of work."""
+    return DeleteTodoUseCaseImpl(unit_of_work_mock)
 
 
 @pytest.fixture
@@ -31,26 +41,36 @@ def todo():
     )
 
 
-def test_delete_todo_success(delete_todo_usecase, todo_repository_mock, todo):
+def test_delete_todo_success(
+    delete_todo_usecase, todo_repository_mock, unit_of_work_mock, todo
+):
     """Test deleting a Todo successfully."""
     # Arrange
-    todo_repository_mock.find_by_id.return_value = todo
+    todo_repository_mock.delete.return_value = True
 
     # Act
     delete_todo_usecase.execute(todo.id)
 
     # Assert
-    todo_repository_mock.find_by_id.assert_called_once_with(todo.id)
+    todo_repository_mock.find_by_id.assert_not_called()
     todo_repository_mock.delete.assert_called_once_with(todo.id)
+    unit_of_work_mock.record.assert_called_once_with(
+        TodoEvent(TodoEventKind.DELETED, todo.id)
+    )
+    unit_of_work_mock.commit.assert_called_once_with()
 
 
-def test_delete_todo_not_found(delete_todo_usecase, todo_repository_mock):
+def test_delete_todo_not_found(
+    delete_todo_usecase, todo_repository_mock, unit_of_work_mock
+):
     """Test deleting a non-existent Todo."""
     # Arrange
     todo_id = TodoId.generate()
-    todo_repository_mock.find_by_id.return_value = None
+    todo_repository_mock.delete.return_value = False
 
     # Act & Assert
     with pytest.raises(Exception) as exc_info:
         delete_todo_usecase.execute(todo_id)
     assert 'The Todo you specified does not exist' in str(exc_info.value)
+    unit_of_work_mock.record.assert_not_called()
+    unit_of_work_mock.commit.assert_not_called()
@@ -0,0 +1,140 @@
+"""Test cases for ExecuteTodoBatchUseCaseImpl."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from dddpy.domain.todo.clocks import FixedClock
+from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoNotFoundError
+from dddpy.domain.todo.repositories import TodoRepository
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTimestamp, TodoTitle
+from dddpy.usecase.todo import (
+    TodoOperation,
+    TodoOperationKind,
+    TodoOperationOutcome,
+    TodoUnitOfWork,
+)
+from dddpy.usecase.todo.execute_todo_batch_usecase import ExecuteTodoBatchUseCaseImpl
+
+NOW = TodoTimestamp(1136214245000)
+
+
+@pytest.fixture
+def todo_repository_mock():
+    """Create a mock TodoRepository."""
+    return Mock(spec=TodoRepository)
+
+
+@pytest.fixture
+def unit_of_work_mock(todo_repository_mock):
+    """Create a mock TodoUnitOfWork exposing the mocked repository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    return unit_of_work
+
+
+@pytest.fixture
+def execute_todo_batch_usecase(unit_of_work_mock):
+    """Create an ExecuteTodoBatchUseCaseImpl instance with a fixed clock."""
+    return ExecuteTodoBatchUseCaseImpl(unit_of_work_mock, FixedClock(NOW))
+
+
+@pytest.fixture
+def operations():
+    """Create a batch that creates a todo and starts a missing one."""
+    return [
+        TodoOperation(TodoOperationKind.CREATE, title=TodoTitle('New')),
+        TodoOperation(TodoOperationKind.START, todo_id=TodoId.generate()),
+        TodoOperation(TodoOperationKind.DELETE, todo_id=TodoId.generate()),
+    ]
+
+
+def test_batch_commits_once(
+    execute_todo_batch_usecase, todo_repository_mock, unit_of_work_mock
+):
+    """Test successful operations are flushed and committed together."""
+    # Arrange
+    started = Todo(TodoId.generate(), TodoTitle('Todo'), status=TodoStatus.IN_PROGRESS)
+    todo_repository_mock.start.return_value = started
+    todo_repository_mock.delete.return_value = True
+
+    # Act
+    results = execute_todo_batch_usecase.execute(
+        [
+            TodoOperation(TodoOperationKind.CREATE, title=TodoTitle('New')),
+            TodoOperation(TodoOperationKind.START, todo_id=started.id),
+            TodoOperation(TodoOperationKind.DELETE, todo_id=started.id),
+        ]
+    )
+
+    # Assert
+    assert [result.outcome for result in results] == [
+        TodoOperationOutcome.SUCCEEDED
+    ] * 3
+    assert results[0].todo.title == TodoTitle('New')
+    assert results[1].todo is started
+    assert results[2].todo is None
+    assert unit_of_work_mock.flush.call_count == 3
+    unit_of_work_mock.commit.assert_called_once_with()
+
+
+def test_atomic_batch_rolls_back_on_failure(
+    execute_todo_batch_usecase, todo_repository_mock, unit_of_work_mock, operations
+):
+    """Test a failing operation rolls back an atomic batch."""
+    # Arrange
+    todo_repository_mock.start.return_value = None
+    todo_repository_mock.find_by_id.return_value = None
+
+    # Act
+    results = execute_todo_batch_usecase.execute(operations)
+
+    # Assert
+    assert [result.outcome for result in results] == [
+        TodoOperationOutcome.ROLLED_BACK,
+        TodoOperationOutcome.FAILED,
+        TodoOperationOutcome.SKIPPED,
+    ]
+    assert isinstance(results[1].error, TodoNotFoundError)
+    unit_of_work_mock.record.assert_not_called()
+    todo_repository_mock.delete.assert_not_called()
+    unit_of_work_mock.rollback.assert_called_once_with()
+    unit_of_work_mock.commit.assert_not_called()
+
+
+def test_independent_batch_commits_succeeded_operations(
+    execute_todo_batch_usecase, todo_repository_mock, unit_of_work_mock, operations
+):
+    """Test a failing operation does not stop a non-atomic batch."""
+    # Arrange
+    todo_repository_mock.start.return_value = None
+    todo_repository_mock.find_by_id.return_value = None
+    todo_repository_mock.delete.return_value = True
+
+    # Act
+    results = execute_todo_batch_usecase.execute(operations, atomic=False)
+
+    # Assert
+    assert [result.outcome for result in results] == [
+        TodoOperationOutcome.SUCCEEDED,
+        TodoOperationOutcome.FAILED,
+        TodoOperationOutcome.SUCCEEDED,
+    ]
+    unit_of_work_mock.rollback.assert_not_called()
+    unit_of_work_mock.commit.assert_called_once_with()
+
+
+def test_batch_rolls_back_on_unexpected_error(
+    execute_todo_batch_usecase, todo_repository_mock, unit_of_work_mock, operations
+):
+    """Test an unexpected error rolls back the batch and propagates."""
+    # Arrange
+    todo_repository_mock.start.side_effect = Exception('Database error')
+
+    # Act & Assert
+    with pytest.raises(Exception) as exc_info:
+        execute_todo_batch_usecase.execute(operations, atomic=False)
+    assert str(exc_info.value) == 'Database error'
+    unit_of_work_mock.rollback.assert_called_once_with()
+    unit_of_work_mock.commit.assert_not_called()
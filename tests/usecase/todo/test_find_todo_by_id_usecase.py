@@ -7,7 +7,11 @@ import pytest
 from dddpy.domain.todo.entities import Todo
 from dddpy.domain.todo.repositories import TodoRepository
 from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
-from dddpy.usecase.todo.find_todo_by_id_usecase import FindTodoByIdUseCaseImpl
+from dddpy.usecase.todo import SingleFlight
+from dddpy.usecase.todo.find_todo_by_id_usecase import (
+    FindTodoByIdUseCaseImpl,
+    new_find_todo_by_id_usecase,
+)
 
 
 @pytest.fixture
@@ -55,3 +59,20 @@ def test_find_todo_by_id_not_found(find_todo_by_id_usecase, todo_repository_mock
     with pytest.raises(Exception) as exc_info:
         find_todo_by_id_usecase.execute(todo_id)
     assert 'The Todo you specified does not exist' in str(exc_info.value)
+
+
+def test_find_todo_by_id_with_single_flight(todo_repository_mock, todo):
+    """Test the single-flight wrapper delegates to the repository lookup."""
+    # Arrange
+    todo_repository_mock.find_by_id.return_value = todo
+    single_flight = SingleFlight()
+    usecase = new_find_todo_by_id_usecase(todo_repository_mock, single_flight)
+
+    # Act
+    result = usecase.execute(todo.id)
+
+    # Assert
+    assert result == todo
+    assert result is not todo
+    assert result.title == todo.title
+    assert single_flight.stats().executions == 1
@@ -0,0 +1,104 @@
+"""Test cases for SingleFlight."""
+
+import threading
+
+import pytest
+
+from dddpy.usecase.todo import SingleFlight, SingleFlightStats
+
+FOLLOWERS = 8
+
+
+def _run_concurrently(single_flight, fn, count):
+    """Call ``fn`` through the group from ``count`` threads at once."""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(single_flight.do('key', fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test followers receive the leader's result without running again."""
+    single_flight = SingleFlight(timeout_seconds=5)
+    release = threading.Event()
+    executions = []
+
+    def fetch():
+        executions.append(1)
+        release.wait()
+        return 'todo'
+
+    leader, results, _ = _run_concurrently(single_flight, fetch, 1)
+    while not executions:
+        pass
+    followers, _, _ = _run_concurrently(single_flight, fetch, FOLLOWERS)
+    while single_flight.stats().calls < FOLLOWERS + 1:
+        pass
+    release.set()
+    for thread in leader + followers:
+        thread.join()
+
+    assert len(executions) == 1
+    assert single_flight.stats() == SingleFlightStats(
+        calls=FOLLOWERS + 1, executions=1, collapsed=FOLLOWERS, timeouts=0
+    )
+
+
+def test_followers_receive_leader_error():
+    """Test an exception raised by the shared execution reaches every caller."""
+    single_flight = SingleFlight(timeout_seconds=5)
+    release = threading.Event()
+
+    def fetch():
+        release.wait()
+        raise LookupError('missing')
+
+    threads, _, errors = _run_concurrently(single_flight, fetch, 1)
+    followers, _, follower_errors = _run_concurrently(single_flight, fetch, 2)
+    while single_flight.stats().calls < 3:
+        pass
+    release.set()
+    for thread in threads + followers:
+        thread.join()
+
+    assert [str(e) for e in errors + follower_errors] == ['missing'] * 3
+    assert len({id(e) for e in errors + follower_errors}) == 3
+    assert all(e.__cause__ is errors[0] for e in follower_errors)
+
+
+def test_follower_runs_itself_after_timeout():
+    """Test a follower stops waiting for a slow leader and runs the call."""
+    single_flight = SingleFlight(timeout_seconds=0.05)
+    release = threading.Event()
+
+    def slow():
+        release.wait()
+        return 'slow'
+
+    threads, _, _ = _run_concurrently(single_flight, slow, 1)
+    while single_flight.stats().calls < 1:
+        pass
+
+    assert single_flight.do('key', lambda: 'fast') == 'fast'
+    release.set()
+    threads[0].join()
+    assert single_flight.stats().timeouts == 1
+
+
+def test_sequential_calls_are_not_shared():
+    """Test a finished call is never replayed to later callers."""
+    single_flight = SingleFlight()
+
+    assert single_flight.do('key', lambda: 1) == 1
+    assert single_flight.do('key', lambda: 2) == 2
+    with pytest.raises(ValueError):
+        single_flight.do('key', lambda: int('x'))
+    assert single_flight.stats().collapsed == 0
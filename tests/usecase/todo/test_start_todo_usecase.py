@@ -4,11 +4,16 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from dddpy.domain.todo.clocks import FixedClock
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoAlreadyStartedError
 from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTitle
+from dddpy.domain.todo.value_objects import TodoId, TodoStatus, TodoTimestamp, TodoTitle
+from dddpy.usecase.todo import TodoUnitOfWork
 from dddpy.usecase.todo.start_todo_usecase import StartTodoUseCaseImpl
 
+NOW = TodoTimestamp(1136214245000)
+
 
 @pytest.fixture
 def todo_repository_mock():
@@ -17,9 +22,23 @@ def todo_repository_mock():
 
 
 @pytest.fixture
-def start_todo_usecase(todo_repository_mock):
-    """Create a StartTodoUseCaseImpl instance with mocked repository."""
-    return StartTodoUseCaseImpl(todo_repository_mock)
+def unit_of_work_mock(todo_repository_mock):
+    """Create a mock TodoUnitOfWork exposing the mocked repository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    return unit_of_work
+
+
+@pytest.fixture
+def clock():
+    """Create a clock fixed at a known time."""
+    return FixedClock(NOW)
+
+
+@pytest.fixture
+def start_todo_usecase(unit_of_work_mock, clock):
+    """Create a StartTodoUseCaseImpl instance with mocked unit of work and fixed clock."""
+    return StartTodoUseCaseImpl(unit_of_work_mock, clock)
 
 
 @pytest.fixture
@@ -35,21 +54,25 @@ def todo():
 def test_start_todo_success(start_todo_usecase, todo_repository_mock, todo):
     """Test starting a Todo successfully."""
     # Arrange
-    todo_repository_mock.find_by_id.return_value = todo
+    todo.start(NOW)
+    todo_repository_mock.start.return_value = todo
 
     # Act
     result = start_todo_usecase.execute(todo.id)
 
     # Assert
     assert result.status == TodoStatus.IN_PROGRESS
-    todo_repository_mock.find_by_id.assert_called_once_with(todo.id)
-    todo_repository_mock.save.assert_called_once_with(result)
+    assert result.updated_at == NOW
+    todo_repository_mock.start.assert_called_once_with(todo.id, NOW)
+    todo_repository_mock.find_by_id.assert_not_called()
+    todo_repository_mock.save.assert_not_called()
 
 
 def test_start_todo_not_found(start_todo_usecase, todo_repository_mock):
     """Test starting a non-existent Todo."""
     # Arrange
     todo_id = TodoId.generate()
+    todo_repository_mock.start.return_value = None
     todo_repository_mock.find_by_id.return_value = None
 
     # Act & Assert
@@ -58,10 +81,23 @@ def test_start_todo_not_found(start_todo_usecase, todo_repository_mock):
     assert 'The Todo you specified does not exist' in str(exc_info.value)
 
 
+def test_start_in_progress_todo(start_todo_usecase, todo_repository_mock, todo):
+    """Test starting a Todo that is already in progress."""
+    # Arrange
+    todo.start()
+    todo_repository_mock.start.return_value = None
+    todo_repository_mock.find_by_id.return_value = todo
+
+    # Act & Assert
+    with pytest.raises(TodoAlreadyStartedError):
+        start_todo_usecase.execute(todo.id)
+
+
 def test_start_completed_todo(start_todo_usecase, todo_repository_mock, todo):
     """Test starting a completed Todo."""
     # Arrange
     todo.complete()  # Make the todo completed
+    todo_repository_mock.start.return_value = None
     todo_repository_mock.find_by_id.return_value = todo
 
     # Act & Assert
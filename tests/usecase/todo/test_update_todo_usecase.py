@@ -4,11 +4,21 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from dddpy.domain.todo.clocks import FixedClock
 from dddpy.domain.todo.entities import Todo
+from dddpy.domain.todo.exceptions import TodoVersionConflictError
 from dddpy.domain.todo.repositories import TodoRepository
-from dddpy.domain.todo.value_objects import TodoDescription, TodoId, TodoTitle
+from dddpy.domain.todo.value_objects import (
+    TodoDescription,
+    TodoId,
+    TodoTimestamp,
+    TodoTitle,
+)
+from dddpy.usecase.todo import TodoUnitOfWork
 from dddpy.usecase.todo.update_todo_usecase import UpdateTodoUseCaseImpl
 
+NOW = TodoTimestamp(1136214245000)
+
 
 @pytest.fixture
 def todo_repository_mock():
@@ -17,9 +27,23 @@ def todo_repository_mock():
 
 
 @pytest.fixture
-def update_todo_usecase(todo_repository_mock):
-    """Create a UpdateTodoUseCaseImpl instance with mocked repository."""
-    return UpdateTodoUseCaseImpl(todo_repository_mock)
+def unit_of_work_mock(todo_repository_mock):
+    """Create a mock TodoUnitOfWork exposing the mocked repository."""
+    unit_of_work = Mock(spec=TodoUnitOfWork)
+    unit_of_work.todos = todo_repository_mock
+    return unit_of_work
+
+
+@pytest.fixture
+def clock():
+    """Create a clock fixed at a known time."""
+    return FixedClock(NOW)
+
+
+@pytest.fixture
+def update_todo_usecase(unit_of_work_mock, clock):
+    """Create a UpdateTodoUseCaseImpl instance with mocked unit of work and fixed clock."""
+    return UpdateTodoUseCaseImpl(unit_of_work_mock, clock)
 
 
 @pytest.fixture
@@ -32,7 +56,9 @@ def todo():
     )
 
 
-def test_update_todo_title_only(update_todo_usecase, todo_repository_mock, todo):
+def test_update_todo_title_only(
+    update_todo_usecase, todo_repository_mock, unit_of_work_mock, todo
+):
     """Test updating a Todo's title only."""
     # Arrange
     todo_repository_mock.find_by_id.return_value = todo
@@ -46,6 +72,7 @@ def test_update_todo_title_only(update_todo_usecase, todo_repository_mock, todo)
     assert result.description == todo.description
     todo_repository_mock.find_by_id.assert_called_once_with(todo.id)
     todo_repository_mock.save.assert_called_once_with(result)
+    unit_of_work_mock.commit.assert_called_once_with()
 
 
 def test_update_todo_description_only(update_todo_usecase, todo_repository_mock, todo):
@@ -79,10 +106,26 @@ def test_update_todo_both_fields(update_todo_usecase, todo_repository_mock, todo
     # Assert
     assert result.title == new_title
     assert result.description == new_description
+    assert result.updated_at == NOW
     todo_repository_mock.find_by_id.assert_called_once_with(todo.id)
     todo_repository_mock.save.assert_called_once_with(result)
 
 
+def test_update_todo_clear_description(update_todo_usecase, todo_repository_mock, todo):
+    """Test removing a Todo's description without touching its title."""
+    # Arrange
+    todo_repository_mock.find_by_id.return_value = todo
+
+    # Act
+    result = update_todo_usecase.execute(todo.id, clear_description=True)
+
+    # Assert
+    assert result.title == TodoTitle('Original Title')
+    assert result.description is None
+    assert result.changed_fields == ('description', 'updated_at')
+    todo_repository_mock.save.assert_called_once_with(result)
+
+
 def test_update_todo_not_found(update_todo_usecase, todo_repository_mock):
     """Test updating a non-existent Todo."""
     # Arrange
@@ -94,3 +137,19 @@ def test_update_todo_not_found(update_todo_usecase, todo_repository_mock):
     with pytest.raises(Exception) as exc_info:
         update_todo_usecase.execute(todo_id, title=new_title)
     assert 'The Todo you specified does not exist' in str(exc_info.value)
+
+
+def test_update_todo_version_mismatch(
+    update_todo_usecase, todo_repository_mock, unit_of_work_mock, todo
+):
+    """Test updating a Todo based on a stale version."""
+    # Arrange
+    todo_repository_mock.find_by_id.return_value = todo
+
+    # Act & Assert
+    with pytest.raises(TodoVersionConflictError):
+        update_todo_usecase.execute(
+            todo.id, title=TodoTitle('Updated Title'), expected_version=todo.version + 1
+        )
+    todo_repository_mock.save.assert_not_called()
+    unit_of_work_mock.commit.assert_not_called()